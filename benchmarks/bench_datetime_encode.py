@@ -0,0 +1,73 @@
+"""Encoding datetimes for to_gpstime_array() in-process or in a process pool.
+
+Usage: python benchmarks/bench_datetime_encode.py [count] [batch] [workers]
+
+`to_gpstime_array()` encodes `datetime.datetime` objects as datetime64 values
+in a single pass in the calling process, and only uses its process pool to
+parse ISO strings. This compares that single pass with encoding the same
+datetimes in a process pool of `workers` processes (the number of CPUs by
+default), which must pickle the datetimes to send them to the workers.
+
+`count` datetimes (100000000 by default) are encoded in batches of `batch`
+(10000000 by default), so that only one batch of datetime objects is held in
+memory at a time. For each method the total time over all of the batches is
+reported, along with the time spent pickling the chunks of datetimes in the
+calling process. The pool cannot encode a batch in less than that time,
+however many workers it has, so if it exceeds the time of the single pass,
+the pool is slower on any machine.
+"""
+
+import os
+import sys
+import time
+import pickle
+import datetime
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from gps_time.parallel import _as_input_array
+
+
+def _batch(start: int, size: int) -> list:
+    first = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    step = datetime.timedelta(microseconds=1250)
+    return [first + step * i for i in range(start, start + size)]
+
+
+def main(count: int = 100000000, batch: int = 10000000, workers: int = 0) -> None:
+    workers = workers or os.cpu_count() or 1
+    # As many chunks as to_gpstime_array() uses for ISO strings
+    chunk_size = -(-batch // (4 * workers))
+    in_process = pooled = pickling = 0.0
+    with ProcessPoolExecutor(workers) as executor:
+        # Start the workers before timing
+        list(executor.map(abs, range(workers)))
+        for start in range(0, count, batch):
+            values = _batch(start, min(batch, count - start))
+            chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+            begin = time.perf_counter()
+            expected = _as_input_array(values)
+            in_process += time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            result = np.concatenate(list(executor.map(_as_input_array, chunks)))
+            pooled += time.perf_counter() - begin
+            assert np.array_equal(result, expected)
+
+            begin = time.perf_counter()
+            for chunk in chunks:
+                pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL)
+            pickling += time.perf_counter() - begin
+            del values, chunks, expected, result
+
+    print("encode {:,} datetimes in batches of {:,}".format(count, batch))
+    print("in-process single pass:        {:8.1f} s".format(in_process))
+    print("process pool, {:3d} worker(s):   {:8.1f} s".format(workers, pooled))
+    print("pickling for the pool alone:   {:8.1f} s".format(pickling))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
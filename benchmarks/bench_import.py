@@ -0,0 +1,50 @@
+"""Import time of gps_time.
+
+Usage: python benchmarks/bench_import.py [repeat]
+
+Imports gps_time in fresh interpreters with `python -X importtime` and
+reports the best cumulative import time of the package, along with whether
+numpy and ruamel.yaml were loaded. Importing gps_time alone should load
+neither.
+"""
+
+import os
+import re
+import sys
+import subprocess
+
+
+def _import_once() -> dict:
+    """Import gps_time in a new interpreter and parse the import times."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+        + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gps_time"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+def main(repeat: int = 10) -> None:
+    runs = [_import_once() for _ in range(repeat)]
+    best = min(run["gps_time"] for run in runs)
+    print("import gps_time: {:.1f} ms (best of {})".format(best / 1000, repeat))
+    for module in ("numpy", "ruamel.yaml"):
+        print(
+            "{} imported: {}".format(module, any(module in run for run in runs))
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,95 @@
+"""Range query latency of a memory-mapped GPSTimeStore.
+
+Usage: python benchmarks/bench_store.py [rows] [directory]
+
+Creates a store of `rows` times, one every 0.5 s (10000000 by default), with
+a float64 value column in a temporary directory in `directory`, appending
+one million rows at a time. Reopens it and runs 1000 queries for random one
+minute ranges, reporting the mean latency of each query, the size of the
+store on disk, and the peak resident memory of the process.
+
+The pages of the memory maps that are read count toward the resident
+memory, and with large page cache folios a single read may map megabytes of
+a recently written file, but they are page cache that the kernel reclaims
+as needed. On Linux, the anonymous resident memory, which excludes them, is
+also reported; it should not grow with the number of rows. Pass a count
+large enough that the store is bigger than the memory of the machine to
+check that it can be queried.
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import resource
+import tempfile
+
+import numpy as np
+
+from gps_time import GPSTime, GPSTimeArray
+from gps_time.store import GPSTimeStore
+
+
+_CHUNK = 1000000
+
+
+def _chunk(start: int, stop: int) -> GPSTimeArray:
+    half_seconds = np.arange(start, stop, dtype=np.int64)
+    return GPSTimeArray(
+        2100 + half_seconds // 1209600,
+        half_seconds % 1209600 // 2,
+        half_seconds % 2 * 500000000000000,
+    )
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def _anonymous_rss_mb() -> float:
+    # Only available on Linux
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024 / 1e6
+    except OSError:
+        pass
+    return float("nan")
+
+
+def main(rows: int = 10000000, directory: str = None) -> None:
+    path = tempfile.mkdtemp(dir=directory)
+    try:
+        start = time.perf_counter()
+        store = GPSTimeStore.create(path, _chunk(0, 0), {"value": np.empty(0)})
+        for first in range(0, rows, _CHUNK):
+            last = min(first + _CHUNK, rows)
+            store.append(_chunk(first, last), {"value": np.arange(first, last, dtype=float)})
+        elapsed = time.perf_counter() - start
+        print("append: {:,.0f} rows/s".format(rows / elapsed))
+        print("create peak RSS: {:,.1f} MB".format(_peak_rss_mb()))
+
+        store = GPSTimeStore(path)
+        rng = random.Random(0)
+        starts = [store.times[rng.randrange(rows)] for _ in range(1000)]
+        start = time.perf_counter()
+        for first in starts:
+            times, columns = store.query(first, first + 60)
+            columns["value"].sum()
+        elapsed = time.perf_counter() - start
+        print("query: {:,.1f} us per query".format(elapsed / len(starts) * 1e6))
+
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        print("store size: {:,.1f} MB".format(size / 1e6))
+        print("peak RSS: {:,.1f} MB".format(_peak_rss_mb()))
+        print("anonymous RSS: {:,.1f} MB".format(_anonymous_rss_mb()))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if i == 0 else arg for i, arg in enumerate(sys.argv[1:])))
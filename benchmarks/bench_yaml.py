@@ -0,0 +1,55 @@
+"""Throughput of the ruamel.yaml loaders and dumpers for GPSTime documents.
+
+Usage: python benchmarks/bench_yaml.py [entries]
+
+Dumps and loads a document holding a list of `entries` `GPSTime` objects
+(1000000 by default) with the round-trip loader, the pure Python safe
+loader, and the libyaml safe loader, and reports the entries per second of
+each. The libyaml loader requires the `ruamel.yaml.clib` package and is
+reported as unavailable without it.
+"""
+
+import io
+import sys
+import time
+
+from gps_time import GPSTime
+from gps_time.yamlio import yaml_loader
+
+
+_LOADERS = {
+    "round trip": {"typ": "rt"},
+    "safe (Python)": {"typ": "safe", "pure": True},
+    "safe (libyaml)": {"typ": "safe"},
+}
+
+
+def main(entries: int = 1000000) -> None:
+    times = [GPSTime(2100 + i // 604800, i % 604800, 250000000000000) for i in range(entries)]
+    for name, kwargs in _LOADERS.items():
+        yaml = yaml_loader(**kwargs)
+        if kwargs.get("typ") == "safe" and not kwargs.get("pure"):
+            if yaml.Parser.__name__ != "CParser":
+                print("{}: unavailable, install ruamel.yaml.clib".format(name))
+                continue
+
+        stream = io.StringIO()
+        start = time.perf_counter()
+        yaml.dump(times, stream)
+        dump_rate = entries / (time.perf_counter() - start)
+
+        stream.seek(0)
+        start = time.perf_counter()
+        loaded = yaml.load(stream)
+        load_rate = entries / (time.perf_counter() - start)
+        assert loaded == times
+
+        print(
+            "{}: dump {:,.0f} entries/s, load {:,.0f} entries/s".format(
+                name, dump_rate, load_rate
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
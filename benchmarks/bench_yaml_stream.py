@@ -0,0 +1,57 @@
+"""Throughput of streaming YAML records with GPSTime tags.
+
+Usage: python benchmarks/bench_yaml_stream.py [records] [directory]
+
+Writes `records` records (10000 by default), each holding a `!GPSTime`, to
+a temporary YAML file in `directory` with `dump_records()`, then reads them
+back with `load_records()`. Reports the records per second of each pass, the
+size of the file, and the peak resident memory of the process. The records
+are generated and consumed one at a time, so the peak memory should not grow
+with the number of records: pass a count large enough that the file is
+bigger than the memory of the machine to check that it can be processed.
+"""
+
+import os
+import sys
+import time
+import resource
+import tempfile
+
+from gps_time import GPSTime
+from gps_time.yamlio import dump_records, load_records
+
+
+def _records(count: int):
+    for i in range(count):
+        yield {"id": i, "time": GPSTime(2100 + i // 604800, i % 604800, 250000000000000)}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def main(records: int = 10000, directory: str = None) -> None:
+    fd, path = tempfile.mkstemp(suffix=".yaml", dir=directory)
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        dump_records(_records(records), path)
+        elapsed = time.perf_counter() - start
+        print("dump_records: {:,.0f} records/s".format(records / elapsed))
+
+        start = time.perf_counter()
+        count = sum(1 for _ in load_records(path))
+        elapsed = time.perf_counter() - start
+        assert count == records
+        print("load_records: {:,.0f} records/s".format(records / elapsed))
+
+        print("file size: {:,.1f} MB".format(os.path.getsize(path) / 1e6))
+        print("peak RSS: {:,.1f} MB".format(_peak_rss_mb()))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if i == 0 else arg for i, arg in enumerate(sys.argv[1:])))
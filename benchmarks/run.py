@@ -0,0 +1,659 @@
+"""Benchmark suite for the scalar and batch paths of gps_time.
+
+Usage:
+    python benchmarks/run.py [--sizes N [N ...]] [--filter TEXT]
+                             [--output FILE] [--compare FILE] [--threshold X]
+                             [--strict] [--rounds N] [--repeat N]
+
+Every case is run on inputs of each size (1, 1000 and 1000000 elements by
+default). For each run the suite records the throughput in elements per
+second and the peak memory traced by `tracemalloc` while processing the
+input once.
+
+The timings are taken in 5 rounds over all of the cases, 3 per case in each
+round, each of at least 0.1 s. Each timing is divided by a timing of a fixed
+reference workload taken right after it, and the median of these ratios is
+the relative speed of the case. Slowdowns of the whole machine, which last
+seconds on shared or virtual machines, change the ratios much less than the
+throughput, and interleaving the rounds keeps them from landing on all of
+the timings of one case.
+
+The results are printed and, with `--output`, written as JSON. With
+`--compare`, they are checked against a previous JSON file: cases whose
+relative speed is lower, or that use more memory, by more than the
+threshold (30% by default) are flagged, and the exit status is 1. Cases
+missing from the baseline are flagged too, and with `--strict` they also
+fail the comparison. Timings depend on the machine, so refresh the stored
+baseline on the machine used for comparison:
+
+    python benchmarks/run.py --output benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json
+
+The cases named "baseline ..." run the `GPSTime` class from before the
+performance work, frozen in `baseline_gpstime.py`, on the same inputs as the
+cases of the same name, so that the effect of that work can be measured on
+any machine, e.g. the memory per instance and the speed of construction:
+
+    python benchmarks/run.py --sizes 1000000 --filter "GPSTime()"
+
+Sorting 10 million times takes minutes with the baseline class, so time it
+once rather than in rounds:
+
+    python benchmarks/run.py --sizes 10000000 --filter "(GPSTime)" --rounds 1 --repeat 1
+
+The suite imports `gps_time` from the checkout that holds it, so it can be
+run without installing the package.
+"""
+
+import os
+import sys
+import json
+import pickle
+import random
+import timeit
+import argparse
+import datetime
+import platform
+import statistics
+import tracemalloc
+
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Benchmark the checkout, as bench_import.py does, even if gps_time is not
+# installed or another version is
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gps_time import GPSTime, GPSTimeArray, GPSTimeDelta, GPSTimeDeltaArray
+from gps_time import wire
+from gps_time.cache import enable_cache, disable_cache
+from gps_time.datetime import (
+    cast_to_datetime,
+    datetime2tow,
+    correct_week,
+    correct_week_array,
+    array_time_difference,
+    subtract_timedelta,
+    datetime2tow_array,
+    tow2datetime_array,
+    datetime2zcount,
+    datetime2zcount_array,
+    zcount2datetime_array,
+    arange_datetime,
+    parse_iso_array,
+)
+from gps_time.leapseconds import LeapSeconds, gps2utc, gps2utc_array
+from gps_time.parallel import to_gpstime_array
+from gps_time.utilities import arange_gpstime
+
+from baseline_gpstime import GPSTime as BaselineGPSTime
+
+
+_CASES: Dict[str, Callable[[int], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    """Register a benchmark.
+
+    The decorated function takes the input size, does any setup, and returns
+    the callable to time, which processes `size` elements per call.
+    """
+
+    def register(factory):
+        _CASES[name] = factory
+        return factory
+
+    return register
+
+
+def _gpstimes(size: int, cls: type = GPSTime) -> List[GPSTime]:
+    rng = random.Random(0)
+    return [
+        cls(rng.randrange(2000, 2100), rng.randrange(604800), rng.randrange(10**15))
+        for _ in range(size)
+    ]
+
+
+def _datetimes(size: int) -> List[datetime.datetime]:
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    return [start + datetime.timedelta(seconds=1.25 * i) for i in range(size)]
+
+
+def _datetime64(size: int) -> np.ndarray:
+    start = np.datetime64("2020-01-01T00:00:00", "us")
+    return start + np.arange(size, dtype=np.int64).astype("timedelta64[us]") * 1250000
+
+
+def _iso_strings(size: int) -> List[str]:
+    return np.datetime_as_string(_datetime64(size), unit="us").tolist()
+
+
+# Scalar paths, applied to each element of a list
+
+
+@case("GPSTime()")
+def _(size):
+    return lambda: [GPSTime(2000, i, i) for i in range(size)]
+
+
+@case("GPSTime + float")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: [t + 1.5 for t in times]
+
+
+@case("GPSTime + timedelta")
+def _(size):
+    times = _gpstimes(size)
+    delta = datetime.timedelta(seconds=1.5)
+    return lambda: [t + delta for t in times]
+
+
+@case("GPSTime + GPSTimeDelta")
+def _(size):
+    times = _gpstimes(size)
+    delta = GPSTimeDelta(1, 500000000000000)
+    return lambda: [t + delta for t in times]
+
+
+@case("GPSTime - GPSTime")
+def _(size):
+    times = _gpstimes(size)
+    other = GPSTime(2050, 1000, 5)
+    return lambda: [t - other for t in times]
+
+
+@case("GPSTime.from_datetime")
+def _(size):
+    date_times = _datetimes(size)
+    return lambda: [GPSTime.from_datetime(d) for d in date_times]
+
+
+@case("GPSTime.from_datetime cached")
+def _(size):
+    # Many records share each epoch, as when decoding several satellites
+    epochs = _datetimes(100)
+    date_times = [epochs[i % 100] for i in range(size)]
+
+    def convert():
+        enable_cache()
+        try:
+            return [GPSTime.from_datetime(d) for d in date_times]
+        finally:
+            disable_cache()
+
+    return convert
+
+
+@case("GPSTime.to_datetime")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: [t.to_datetime() for t in times]
+
+
+@case("sorted(GPSTime)")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: sorted(times)
+
+
+@case("set(GPSTime)")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: set(times)
+
+
+@case("pickle GPSTime")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: pickle.loads(pickle.dumps(times, protocol=5))
+
+
+@case("GPSTime.to_bytes")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: [GPSTime.from_bytes(t.to_bytes()) for t in times]
+
+
+@case("LeapSeconds.get_leap_seconds")
+def _(size):
+    times = [GPSTime(1000 + t.week_number % 1000, t.seconds) for t in _gpstimes(size)]
+    return lambda: [LeapSeconds.get_leap_seconds(t) for t in times]
+
+
+@case("gps2utc")
+def _(size):
+    times = [GPSTime(1000 + t.week_number % 1000, t.seconds) for t in _gpstimes(size)]
+    return lambda: [gps2utc(t) for t in times]
+
+
+@case("datetime2tow")
+def _(size):
+    date_times = _datetimes(size)
+    return lambda: [datetime2tow(d) for d in date_times]
+
+
+@case("correct_week")
+def _(size):
+    weeks = [(2140 + i % 50) % 1024 for i in range(size)]
+    return lambda: [correct_week(w, 0.0, 2021) for w in weeks]
+
+
+@case("datetime2zcount")
+def _(size):
+    date_times = _datetimes(size)
+    return lambda: [datetime2zcount(d) for d in date_times]
+
+
+@case("array_time_difference")
+def _(size):
+    date_times = np.array(_datetimes(size))
+    return lambda: array_time_difference(date_times, date_times[::-1])
+
+
+@case("subtract_timedelta")
+def _(size):
+    date_times = np.array(_datetimes(size))
+    deltas = np.linspace(-1e6, 1e6, size)
+    return lambda: subtract_timedelta(date_times, deltas)
+
+
+@case("cast_to_datetime")
+def _(size):
+    iso_strings = _iso_strings(size)
+    return lambda: [cast_to_datetime(s) for s in iso_strings]
+
+
+# The GPSTime class from before the performance work, frozen in
+# baseline_gpstime.py, for before/after comparisons with the cases above
+
+
+@case("baseline GPSTime()")
+def _(size):
+    return lambda: [BaselineGPSTime(2000, i, i) for i in range(size)]
+
+
+@case("baseline GPSTime + float")
+def _(size):
+    times = _gpstimes(size, BaselineGPSTime)
+    return lambda: [t + 1.5 for t in times]
+
+
+@case("baseline GPSTime - GPSTime")
+def _(size):
+    times = _gpstimes(size, BaselineGPSTime)
+    other = BaselineGPSTime(2050, 1000, 5)
+    return lambda: [t - other for t in times]
+
+
+@case("baseline GPSTime.from_datetime")
+def _(size):
+    date_times = _datetimes(size)
+    return lambda: [BaselineGPSTime.from_datetime(d) for d in date_times]
+
+
+@case("baseline sorted(GPSTime)")
+def _(size):
+    times = _gpstimes(size, BaselineGPSTime)
+    return lambda: sorted(times)
+
+
+@case("baseline set(GPSTime)")
+def _(size):
+    times = _gpstimes(size, BaselineGPSTime)
+    return lambda: set(times)
+
+
+# Sequence generators, producing `size` elements
+
+
+@case("arange_gpstime list")
+def _(size):
+    start = GPSTime(2000, 0)
+    return lambda: arange_gpstime(start, size / 1000, 1)
+
+
+@case("arange_gpstime array")
+def _(size):
+    start = GPSTime(2000, 0)
+    return lambda: arange_gpstime(start, size / 1000, 1, output="array")
+
+
+@case("arange_datetime list")
+def _(size):
+    start = datetime.datetime(2020, 1, 1)
+    return lambda: arange_datetime(start, size / 1000, 1)
+
+
+@case("arange_datetime datetime64")
+def _(size):
+    start = datetime.datetime(2020, 1, 1)
+    return lambda: arange_datetime(start, size / 1000, 1, output="datetime64")
+
+
+# Batch paths, applied to a whole array
+
+
+@case("GPSTimeArray.from_gpstimes")
+def _(size):
+    times = _gpstimes(size)
+    return lambda: GPSTimeArray.from_gpstimes(times)
+
+
+@case("GPSTimeArray.to_gpstimes")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+    return lambda: times.to_gpstimes()
+
+
+@case("GPSTimeArray + float")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+    return lambda: times + 1.5
+
+
+@case("GPSTimeArray - GPSTime")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+    other = GPSTime(2050, 1000, 5)
+    return lambda: times - other
+
+
+@case("pickle GPSTimeArray")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+
+    def round_trip():
+        buffers = []
+        data = pickle.dumps(times, protocol=5, buffer_callback=buffers.append)
+        return pickle.loads(data, buffers=buffers)
+
+    return round_trip
+
+
+@case("wire.pack")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+    return lambda: wire.pack(times)
+
+
+@case("wire.unpack")
+def _(size):
+    data = wire.pack(GPSTimeArray.from_gpstimes(_gpstimes(size)))
+    return lambda: wire.unpack(data)
+
+
+@case("GPSTimeArray.argsort")
+def _(size):
+    times = GPSTimeArray.from_gpstimes(_gpstimes(size))
+    return lambda: times.argsort()
+
+
+@case("GPSTimeDeltaArray.cumsum")
+def _(size):
+    deltas = GPSTimeDeltaArray(np.zeros(size, dtype=np.int64), 10**15 // 3)
+    return lambda: deltas.cumsum()
+
+
+@case("datetime2tow_array")
+def _(size):
+    date_times = _datetime64(size)
+    return lambda: datetime2tow_array(date_times)
+
+
+@case("tow2datetime_array")
+def _(size):
+    week_num, tow = datetime2tow_array(_datetime64(size))
+    return lambda: tow2datetime_array(week_num, tow)
+
+
+@case("correct_week_array")
+def _(size):
+    weeks = (2140 + np.arange(size) % 50) % 1024
+    return lambda: correct_week_array(weeks, 0.0, 2021)
+
+
+@case("datetime2zcount_array")
+def _(size):
+    date_times = _datetime64(size)
+    return lambda: datetime2zcount_array(date_times, integer=True)
+
+
+@case("zcount2datetime_array")
+def _(size):
+    week_num, zcount = datetime2zcount_array(_datetime64(size), integer=True)
+    return lambda: zcount2datetime_array(week_num, zcount)
+
+
+@case("array_time_difference datetime64")
+def _(size):
+    date_times = _datetime64(size)
+    return lambda: array_time_difference(date_times, date_times[::-1])
+
+
+@case("subtract_timedelta datetime64")
+def _(size):
+    date_times = _datetime64(size)
+    deltas = np.linspace(-1e6, 1e6, size)
+    return lambda: subtract_timedelta(date_times, deltas)
+
+
+@case("gps2utc_array")
+def _(size):
+    date_times = _datetime64(size)
+    return lambda: gps2utc_array(date_times)
+
+
+@case("parse_iso_array")
+def _(size):
+    iso_strings = np.array(_iso_strings(size))
+    return lambda: parse_iso_array(iso_strings)
+
+
+@case("to_gpstime_array iso")
+def _(size):
+    iso_strings = _iso_strings(size)
+    return lambda: to_gpstime_array(iso_strings)
+
+
+@case("to_gpstime_array datetime")
+def _(size):
+    date_times = _datetimes(size)
+    return lambda: to_gpstime_array(date_times)
+
+
+_REFERENCE_FLOATS = [float(i) for i in range(20000)]
+_REFERENCE_ARRAY = np.arange(200000, dtype=np.int64)[::-1]
+
+
+def _reference() -> None:
+    """A fixed mix of interpreter and NumPy work to scale the timings by.
+
+    The speed of a shared or virtual machine drifts by tens of percent over
+    periods of several seconds, for all code alike. Dividing each timing by
+    a timing of this function taken right after it cancels most of that.
+    """
+    sorted(_REFERENCE_FLOATS, key=lambda x: -x)
+    [(x, x + 1.5) for x in _REFERENCE_FLOATS]
+    np.sort(_REFERENCE_ARRAY)
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """The peak memory traced while calling a callable once."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(
+    func: Callable[[], object],
+    reference: timeit.Timer,
+    reference_number: int,
+    repeat: int = 3,
+    min_time: float = 0.1,
+) -> List[Tuple[float, float]]:
+    """Time a callable, each time alongside the reference workload.
+
+    The callable is called as many times per timing as it takes to run for
+    at least `min_time` seconds.
+
+    Returns the seconds per call of each timing, with the ratio of it to the
+    seconds per call of the reference timed right after it.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(2 * number, int(1.2 * number * min_time / max(elapsed, 1e-9)))
+
+    timings = []
+    for _ in range(repeat):
+        seconds = timer.timeit(number) / number
+        reference_seconds = reference.timeit(reference_number) / reference_number
+        timings.append((seconds, seconds / reference_seconds))
+    return timings
+
+
+def run(
+    sizes: List[int], name_filter: str = "", rounds: int = 5, repeat: int = 3
+) -> List[dict]:
+    """Run the cases and summarize each by the median of its timings.
+
+    All of the cases are timed once per round, so that a period in which the
+    machine is slower affects a few of the timings of many cases rather than
+    all of the timings of one case. The peak memory is traced in the first
+    round.
+    """
+    names = [name for name in _CASES if name_filter.lower() in name.lower()]
+    reference = timeit.Timer(_reference)
+    reference_number, _ = reference.autorange()
+
+    results = []
+    for size in sizes:
+        timings: Dict[str, List[Tuple[float, float]]] = {name: [] for name in names}
+        peaks: Dict[str, int] = {}
+        for round_ in range(rounds):
+            for name in names:
+                func = _CASES[name](size)
+                if round_ == 0:
+                    peaks[name] = peak_memory(func)
+                timings[name].extend(measure(func, reference, reference_number, repeat))
+                del func
+
+        for name in names:
+            result = {
+                "case": name,
+                "size": size,
+                "ops_per_sec": size / statistics.median(t for t, _ in timings[name]),
+                # Elements processed in the time the reference workload takes
+                "relative_speed": size / statistics.median(r for _, r in timings[name]),
+                "peak_bytes": peaks[name],
+            }
+            print(
+                "{:32s} {:>9,d} {:>16,.0f} el/s {:>14,d} B peak".format(
+                    name, size, result["ops_per_sec"], result["peak_bytes"]
+                ),
+                flush=True,
+            )
+            results.append(result)
+    return results
+
+
+def compare(
+    results: List[dict], baseline: dict, threshold: float, strict: bool = False
+) -> int:
+    """Print the change from a baseline and count the regressions.
+
+    Speeds are compared by their relative speed. Results without a baseline
+    are flagged, and only counted as regressions if `strict` is set.
+    """
+    previous = {(r["case"], r["size"]): r for r in baseline["results"]}
+    regressions = 0
+    missing = 0
+    print("\nchange from baseline (speed ratio, memory ratio):")
+    for result in results:
+        old = previous.get((result["case"], result["size"]))
+        if old is None:
+            missing += 1
+            print(
+                "{:32s} {:>9,d} {:>9s} {:>9s}  NO BASELINE".format(
+                    result["case"], result["size"], "-", "-"
+                )
+            )
+            continue
+        speed = result["relative_speed"] / old["relative_speed"]
+        memory = (result["peak_bytes"] + 1) / (old["peak_bytes"] + 1)
+        flags = []
+        if speed < 1 - threshold:
+            flags.append("SLOWER")
+        # Ignore small absolute changes in memory, which are mostly noise
+        if memory > 1 + threshold and result["peak_bytes"] - old["peak_bytes"] > 4096:
+            flags.append("MORE MEMORY")
+        regressions += bool(flags)
+        print(
+            "{:32s} {:>9,d} {:>8.2f}x {:>8.2f}x  {}".format(
+                result["case"], result["size"], speed, memory, " ".join(flags)
+            )
+        )
+    if missing:
+        print(
+            "warning: {} result(s) have no baseline; regenerate it with --output".format(
+                missing
+            )
+        )
+    return regressions + (missing if strict else 0)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 1000000])
+    parser.add_argument("--filter", default="", help="only run cases containing TEXT")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="time every case this many times"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="timings of each case per round"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="count results without a baseline as regressions",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.filter, args.rounds, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                f,
+                indent=1,
+            )
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.strict)
+        print("{} regression(s)".format(regressions))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
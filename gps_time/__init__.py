@@ -20,4 +20,25 @@ logger.setLevel(logging.ERROR)
 logger.debug("Running gps_time version " + __version__)
 logger.debug(__copyright__)
 
-from .core import GPSTime  # noqa: F401,E402
+from .core import GPSTime, GPSTimeDelta  # noqa: F401,E402
+
+# The array types require numpy, so they are imported on first use
+_LAZY_ATTRIBUTES = {
+    "GPSTimeArray": "arrays",
+    "GPSTimeDeltaArray": "arrays",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        module = importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
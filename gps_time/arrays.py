@@ -0,0 +1,1596 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+import datetime
+
+import numpy as np
+
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
+from logging import getLogger
+
+from .core import (
+    GPSTime,
+    GPSTimeDelta,
+    _tow2sec,
+    _SEC_IN_WEEK,
+    _SEC_TO_FEMTO_SEC,
+    _FEMTO_SEC_TO_SEC,
+    _FEMTO_SEC_IN_SEC,
+)
+from .datetime import _datetime64_offset
+
+
+__all__ = ['logger', 'GPSTIME_DTYPE', 'GPSTimeArray', 'GPSTimeDeltaArray', 'gpstimes_to_records',
+           'records_to_gpstimes', 'gpstime_add', 'gpstime_subtract', 'gpstime_compare', 'gpstime_min',
+           'gpstime_max', 'gpstime_argsort']
+
+
+logger = getLogger(__name__)
+
+
+GPSTIME_DTYPE: np.dtype = np.dtype(
+    [("week_number", "<i4"), ("seconds", "<i4"), ("femtoseconds", "<i8")]
+)
+"""Structured dtype holding one GPS time in 16 bytes.
+
+Arrays of this dtype can be saved with `numpy.save` and opened with
+`numpy.memmap` or `numpy.load(..., mmap_mode="r")`. The times must be
+normalized as in `GPSTime`, i.e. the seconds in [0, 604800) and the
+femtoseconds in [0, 1e15). The `gpstime_*` functions operate on these
+arrays directly; files larger than memory can be processed in slices, e.g.
+`gpstime_add(times[i:j], offset, out=times[i:j])`.
+"""
+
+
+def _reconstruct_gpstime_array(
+    cls: type, week_number: np.ndarray, seconds: np.ndarray, femtoseconds: np.ndarray
+) -> GPSTimeArray:
+    """Unpickle a `GPSTimeArray` from the columns written by `__reduce__()`."""
+    return cls._from_normalized(week_number, seconds, femtoseconds)
+
+
+def _as_column(values: Union[int, np.ndarray]) -> np.ndarray:
+    """Cast a value to an int64 array without copying if possible.
+
+    Parameters
+    ----------
+    values : Union[int, np.ndarray]
+        The values to cast
+
+    Returns
+    -------
+    np.ndarray
+        The values as an int64 array
+    """
+    return np.asarray(values, dtype=np.int64)
+
+
+def _tow2sec_array(time_of_week: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert float times to integer seconds and femtoseconds
+
+    This is the vectorized form of `gps_time.core._tow2sec()` and produces
+    identical values element by element.
+
+    Parameters
+    ----------
+    time_of_week : np.ndarray
+        The times of week, as floats
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The seconds and femtoseconds within the time of week
+    """
+    time_of_week = np.asarray(time_of_week, dtype=np.float64)
+    seconds = np.floor_divide(time_of_week, 1).astype(np.int64)
+    femtoseconds = (np.mod(time_of_week, 1) * _SEC_TO_FEMTO_SEC).astype(np.int64)
+    return seconds, femtoseconds
+
+
+def _normalize(
+    week_number: np.ndarray, seconds: np.ndarray, femtoseconds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Carry out-of-range femtoseconds and seconds into the larger units.
+
+    This is the vectorized form of `GPSTime.correct_time()`, but it uses
+    integer arithmetic only.
+
+    Parameters
+    ----------
+    week_number : np.ndarray
+        The week numbers
+    seconds : np.ndarray
+        The seconds of week, possibly outside of [0, 604800)
+    femtoseconds : np.ndarray
+        The femtoseconds, possibly outside of [0, 1e15)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The normalized week numbers, seconds, and femtoseconds
+    """
+    carry, femtoseconds = np.divmod(femtoseconds, _FEMTO_SEC_IN_SEC)
+    carry, seconds = np.divmod(seconds + carry, _SEC_IN_WEEK)
+    return week_number + carry, seconds, femtoseconds
+
+
+def _scale_femtoseconds(
+    multiplier: np.ndarray, femtoseconds: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Multiply a duration in femtoseconds by an integer array, exactly.
+
+    The product is split into whole seconds and femtoseconds so that it does
+    not overflow int64 even when it spans many seconds.
+
+    Parameters
+    ----------
+    multiplier : np.ndarray
+        The non-negative integer multipliers, each less than about 9e12
+    femtoseconds : int
+        The duration to multiply, in femtoseconds
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The int64 seconds and femtoseconds of each product. The femtoseconds
+        are within [0, 1e15).
+    """
+    multiplier = np.asarray(multiplier, dtype=np.int64)
+    step_seconds, step_femtoseconds = divmod(int(femtoseconds), _FEMTO_SEC_IN_SEC)
+    high, low = divmod(step_femtoseconds, 1000000000)
+
+    carry, remainder = np.divmod(multiplier * high, 1000000)
+    femtoseconds = remainder * 1000000000 + multiplier * low
+    carry_seconds, femtoseconds = np.divmod(femtoseconds, _FEMTO_SEC_IN_SEC)
+    return multiplier * step_seconds + carry + carry_seconds, femtoseconds
+
+
+class GPSTimeArray:
+    """Columnar array of GPS times.
+
+    This stores a sequence of GPS times as three contiguous int64 columns
+    (week numbers, seconds of week, and femtoseconds) rather than as a
+    sequence of `GPSTime` objects. Arithmetic, comparisons, and sorting are
+    performed on the integer columns with NumPy and never create `GPSTime`
+    objects. Indexing with an integer returns a `GPSTime`; indexing with a
+    slice returns a `GPSTimeArray` whose columns are views of this one.
+
+    Parameters
+    ----------
+    week_number : Union[int, np.ndarray]
+        The number of weeks since the start of the GPS epoch, 6 Jan 1980.
+    seconds : Union[int, float, np.ndarray]
+        The number of integer seconds into the week. If `femtoseconds` is not
+        given and this is a float array, it is interpreted as the time of
+        week, just as for `GPSTime`.
+    femtoseconds : Union[int, np.ndarray], optional
+        The number of femtoseconds into the week, by default None
+
+    Notes
+    -----
+    Scalars are broadcast against arrays, so `GPSTimeArray(2000, tow_array)`
+    creates an array of times within week 2000. Values outside of the week
+    or second are carried into the larger unit, as in
+    `GPSTime.correct_time()`.
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the columns are not one dimensional
+    TypeError
+        For various operators if the other operand is not a supported type
+    """
+
+    week_number: np.ndarray
+    seconds: np.ndarray
+    femtoseconds: np.ndarray
+
+    # Make NumPy arrays and scalars defer to the operators of this class
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        week_number: Union[int, np.ndarray],
+        seconds: Union[int, float, np.ndarray] = 0,
+        femtoseconds: Union[int, np.ndarray, None] = None,
+    ) -> None:
+        """Object constructor.
+
+        The inputs are broadcast together and cast to int64. The columns are
+        only copied if the dtype differs or if they require normalization.
+
+        Parameters
+        ----------
+        week_number : Union[int, np.ndarray]
+            The week numbers
+        seconds : Union[int, float, np.ndarray], optional
+            The seconds of week, or the time of week if `femtoseconds` is not
+            given and the values are floats, by default 0
+        femtoseconds : Union[int, np.ndarray, None], optional
+            The femtoseconds, by default None
+        """
+        seconds = np.asarray(seconds)
+        if femtoseconds is None:
+            if seconds.dtype.kind == "f":
+                seconds, femtoseconds = _tow2sec_array(seconds)
+            else:
+                femtoseconds = 0
+
+        columns = [_as_column(v) for v in (week_number, seconds, femtoseconds)]
+        shape = np.broadcast_shapes(*(c.shape for c in columns))
+        week_number, seconds, femtoseconds = [
+            c if c.shape == shape else np.broadcast_to(c, shape).copy()
+            for c in columns
+        ]
+        if week_number.ndim != 1:
+            raise ValueError("GPSTimeArray columns must be one dimensional")
+
+        if (
+            np.any(femtoseconds < 0)
+            or np.any(femtoseconds >= _FEMTO_SEC_IN_SEC)
+            or np.any(seconds < 0)
+            or np.any(seconds >= _SEC_IN_WEEK)
+        ):
+            week_number, seconds, femtoseconds = _normalize(
+                week_number, seconds, femtoseconds
+            )
+
+        self.week_number = week_number
+        self.seconds = seconds
+        self.femtoseconds = femtoseconds
+
+    @classmethod
+    def _from_normalized(
+        cls,
+        week_number: np.ndarray,
+        seconds: np.ndarray,
+        femtoseconds: np.ndarray,
+    ) -> GPSTimeArray:
+        """Create an array from columns that are already normalized.
+
+        This skips the argument handling and range checks of the constructor
+        and uses the columns as given, without copying.
+
+        Parameters
+        ----------
+        week_number : np.ndarray
+            The int64 week numbers
+        seconds : np.ndarray
+            The int64 seconds of week, within [0, 604800)
+        femtoseconds : np.ndarray
+            The int64 femtoseconds, within [0, 1e15)
+
+        Returns
+        -------
+        GPSTimeArray
+            The array wrapping the given columns
+        """
+        out = cls.__new__(cls)
+        out.week_number = week_number
+        out.seconds = seconds
+        out.femtoseconds = femtoseconds
+        return out
+
+    @classmethod
+    def from_gpstimes(cls, times: Iterable[GPSTime]) -> GPSTimeArray:
+        """Create an array from a sequence of `GPSTime` objects.
+
+        Parameters
+        ----------
+        times : Iterable[GPSTime]
+            The `GPSTime` objects
+
+        Returns
+        -------
+        GPSTimeArray
+            The array holding the same times. This is a lossless conversion.
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If any element is not a `GPSTime`
+        """
+        times = list(times)
+        if not all(isinstance(t, GPSTime) for t in times):
+            raise TypeError("times must be a sequence of GPSTime")
+        count = len(times)
+        return cls(
+            np.fromiter((t.week_number for t in times), dtype=np.int64, count=count),
+            np.fromiter((t.seconds for t in times), dtype=np.int64, count=count),
+            np.fromiter((t.femtoseconds for t in times), dtype=np.int64, count=count),
+        )
+
+    @classmethod
+    def from_range(
+        cls, start: GPSTime, step_femtoseconds: int, count: int
+    ) -> GPSTimeArray:
+        """Create an evenly spaced array of times.
+
+        The times are computed with exact integer arithmetic, so there is no
+        accumulated floating point error over long ranges.
+
+        Parameters
+        ----------
+        start : GPSTime
+            The first time
+        step_femtoseconds : int
+            The spacing between times, in femtoseconds. May be negative.
+        count : int
+            The number of times
+
+        Returns
+        -------
+        GPSTimeArray
+            The times `start + i * step` for `i` in `range(count)`
+        """
+        seconds, femtoseconds = _scale_femtoseconds(
+            np.arange(count, dtype=np.int64), step_femtoseconds
+        )
+        return cls._from_normalized(
+            *_normalize(
+                np.full(count, start.week_number, dtype=np.int64),
+                seconds + start.seconds,
+                femtoseconds + start.femtoseconds,
+            )
+        )
+
+    @classmethod
+    def from_datetime64(cls, date_times: np.ndarray) -> GPSTimeArray:
+        """Create an array from `numpy.datetime64` values.
+
+        Like `GPSTime.from_datetime`, this does not apply leap seconds. The
+        conversion is exact in integer arithmetic for units from seconds down
+        to nanoseconds.
+
+        Parameters
+        ----------
+        date_times : np.ndarray
+            An array of `numpy.datetime64` values, which are taken to be UTC
+
+        Returns
+        -------
+        GPSTimeArray
+            The corresponding times
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If the input is not a datetime64 array
+        ValueError
+            If the input holds NaT
+        """
+        offset, units_per_second = _datetime64_offset(date_times)
+        week_number, units = np.divmod(offset, _SEC_IN_WEEK * units_per_second)
+        seconds, units = np.divmod(units, units_per_second)
+        return cls._from_normalized(
+            week_number, seconds, units * (_FEMTO_SEC_IN_SEC // units_per_second)
+        )
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable[GPSTimeArray]) -> GPSTimeArray:
+        """Join a sequence of arrays end to end.
+
+        Parameters
+        ----------
+        arrays : Iterable[GPSTimeArray]
+            The arrays to join
+
+        Returns
+        -------
+        GPSTimeArray
+            A new array containing the elements of each array in order
+        """
+        arrays = list(arrays)
+        return cls._from_normalized(
+            np.concatenate([a.week_number for a in arrays]),
+            np.concatenate([a.seconds for a in arrays]),
+            np.concatenate([a.femtoseconds for a in arrays]),
+        )
+
+    def to_gpstimes(self) -> List[GPSTime]:
+        """Convert the array to a list of `GPSTime` objects.
+
+        Returns
+        -------
+        List[GPSTime]
+            One `GPSTime` per element. This is a lossless conversion.
+        """
+        return list(self)
+
+    tolist = to_gpstimes
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> GPSTimeArray:
+        """Create an array from a structured array of `GPSTIME_DTYPE`.
+
+        Parameters
+        ----------
+        records : np.ndarray
+            A one dimensional structured array with "week_number", "seconds",
+            and "femtoseconds" fields, e.g. one opened with `numpy.memmap`
+
+        Returns
+        -------
+        GPSTimeArray
+            The same times, with the columns copied to int64
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If the array lacks the fields of `GPSTIME_DTYPE`
+        """
+        names = records.dtype.names or ()
+        if not all(name in names for name in GPSTIME_DTYPE.names):
+            raise TypeError("records must have the fields of GPSTIME_DTYPE")
+        return cls(
+            records["week_number"].astype(np.int64),
+            records["seconds"].astype(np.int64),
+            records["femtoseconds"].astype(np.int64),
+        )
+
+    def to_records(self, out: Union[np.ndarray, None] = None) -> np.ndarray:
+        """Convert to a structured array of `GPSTIME_DTYPE`.
+
+        Parameters
+        ----------
+        out : Union[np.ndarray, None], optional
+            A structured array, such as a writable `numpy.memmap`, of the
+            same length to write into, by default None
+
+        Returns
+        -------
+        np.ndarray
+            The structured array of times
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If a week number does not fit in 32 bits
+        """
+        info = np.iinfo(np.int32)
+        if len(self) and (
+            self.week_number.min() < info.min or self.week_number.max() > info.max
+        ):
+            raise ValueError("week numbers must fit in 32 bits for GPSTIME_DTYPE")
+        if out is None:
+            out = np.empty(len(self), dtype=GPSTIME_DTYPE)
+        out["week_number"] = self.week_number
+        out["seconds"] = self.seconds
+        out["femtoseconds"] = self.femtoseconds
+        return out
+
+    @property
+    def time_of_week(self) -> np.ndarray:
+        """The times of week as floats."""
+        return self.seconds + self.femtoseconds * _FEMTO_SEC_TO_SEC
+
+    def copy(self) -> GPSTimeArray:
+        """Copy the array.
+
+        Returns
+        -------
+        GPSTimeArray
+            An array whose columns do not share memory with this one
+        """
+        return self._from_normalized(
+            self.week_number.copy(), self.seconds.copy(), self.femtoseconds.copy()
+        )
+
+    def __reduce__(self) -> Tuple[Callable, tuple]:
+        """Reduce the array for pickling.
+
+        The array is pickled as its three int64 columns. With pickle
+        protocol 5, NumPy passes each contiguous column to the
+        `buffer_callback` of `pickle.dumps()` as an out-of-band buffer, so
+        large arrays can be sent between processes without copying them into
+        the pickle stream. Columns that are strided views are copied to
+        contiguous memory first.
+
+        Returns
+        -------
+        Tuple[Callable, tuple]
+            The function that recreates the array and its arguments
+
+        Notes
+        -----
+        Arrays unpickled from read-only out-of-band buffers, such as `bytes`,
+        have read-only columns, as for any NumPy array.
+        """
+        return (
+            _reconstruct_gpstime_array,
+            (
+                type(self),
+                np.ascontiguousarray(self.week_number),
+                np.ascontiguousarray(self.seconds),
+                np.ascontiguousarray(self.femtoseconds),
+            ),
+        )
+
+    def _seconds_key(self) -> np.ndarray:
+        """The whole seconds since the start of the GPS epoch.
+
+        Together with the femtoseconds, this orders the times exactly.
+        """
+        return self.week_number * _SEC_IN_WEEK + self.seconds
+
+    def argsort(self) -> np.ndarray:
+        """Get the indices that would sort the array.
+
+        The sort is stable and exact at femtosecond precision.
+
+        Returns
+        -------
+        np.ndarray
+            The indices that sort the array from earliest to latest
+        """
+        return np.lexsort((self.femtoseconds, self._seconds_key()))
+
+    def sort(self) -> None:
+        """Sort the array in place, from earliest to latest.
+
+        Returns
+        -------
+        None
+
+        """
+        order = self.argsort()
+        self.week_number[...] = self.week_number[order]
+        self.seconds[...] = self.seconds[order]
+        self.femtoseconds[...] = self.femtoseconds[order]
+
+    def min(self) -> GPSTime:
+        """Get the earliest time in the array.
+
+        Returns
+        -------
+        GPSTime
+            The earliest time
+        """
+        return self[self._extreme_index(np.argmin)]
+
+    def max(self) -> GPSTime:
+        """Get the latest time in the array.
+
+        Returns
+        -------
+        GPSTime
+            The latest time
+        """
+        return self[self._extreme_index(np.argmax)]
+
+    def _extreme_index(self, arg_func) -> int:
+        """Find the index of the earliest or latest time.
+
+        Parameters
+        ----------
+        arg_func : Callable
+            Either `np.argmin` or `np.argmax`
+
+        Returns
+        -------
+        int
+            The index of the first element holding the extreme value
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If the array is empty
+        """
+        if len(self) == 0:
+            raise ValueError("Cannot find the extreme of an empty GPSTimeArray")
+        key = self._seconds_key()
+        candidates = np.flatnonzero(key == key[arg_func(key)])
+        return int(candidates[arg_func(self.femtoseconds[candidates])])
+
+    def _other_columns(
+        self, other: Union[GPSTime, GPSTimeArray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the week, second, and femtosecond columns of the other operand.
+
+        Parameters
+        ----------
+        other : Union[GPSTime, GPSTimeArray]
+            The other operand
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            The columns, which are scalars if other is a `GPSTime`
+        """
+        if isinstance(other, GPSTime):
+            return (
+                np.int64(other.week_number),
+                np.int64(other.seconds),
+                np.int64(other.femtoseconds),
+            )
+        return other.week_number, other.seconds, other.femtoseconds
+
+    def _offset_columns(
+        self,
+        other: Union[
+            int,
+            float,
+            datetime.timedelta,
+            GPSTimeDelta,
+            GPSTimeDeltaArray,
+            np.ndarray,
+        ],
+        operation: str,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert a time offset into second and femtosecond columns.
+
+        Floats are split into seconds and femtoseconds the same way as they
+        are for `GPSTime`. Durations, integer arrays, and `timedelta64`
+        scalars and arrays are converted exactly.
+
+        Parameters
+        ----------
+        other : Union[int, float, datetime.timedelta, GPSTimeDelta,
+                      GPSTimeDeltaArray, np.ndarray]
+            The offset, in seconds if it is a number or numeric array
+        operation : str
+            The operator symbol, used in the error message
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The seconds and femtoseconds of the offset
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If other is not a supported type
+        """
+        if isinstance(other, np.timedelta64):
+            # timedelta64 scalars are also np.integer, so check them first
+            other = np.asarray(other)
+        if isinstance(other, (bool, np.bool_)):
+            pass
+        elif isinstance(other, (int, float, np.integer, np.floating)):
+            return tuple(np.int64(v) for v in _tow2sec(float(other)))
+        elif isinstance(other, datetime.timedelta):
+            return tuple(np.int64(v) for v in _tow2sec(other.total_seconds()))
+        elif isinstance(other, GPSTimeDelta):
+            return np.int64(other.seconds), np.int64(other.femtoseconds)
+        elif isinstance(other, GPSTimeDeltaArray):
+            return other.seconds, other.femtoseconds
+        elif isinstance(other, np.ndarray):
+            if other.dtype.kind in "iu":
+                return _as_column(other), np.int64(0)
+            elif other.dtype.kind == "f":
+                return _tow2sec_array(other)
+            elif other.dtype.kind == "m":
+                nanoseconds = other.astype("timedelta64[ns]").view(np.int64)
+                seconds, nanoseconds = np.divmod(nanoseconds, 1000000000)
+                return seconds, nanoseconds * 1000000
+        raise TypeError(
+            "unsupported operand type(s) for {}: '{}' and '{}'".format(
+                operation, type(self), type(other)
+            )
+        )
+
+    def __len__(self) -> int:
+        """The number of times in the array."""
+        return len(self.week_number)
+
+    def __getitem__(self, key) -> Union[GPSTime, GPSTimeArray]:
+        """Index the array.
+
+        Parameters
+        ----------
+        key
+            An integer, slice, integer array, or boolean mask
+
+        Returns
+        -------
+        Union[GPSTime, GPSTimeArray]
+            A `GPSTime` for an integer index. Otherwise, a `GPSTimeArray`,
+            which is a view of this array for a slice.
+        """
+        if isinstance(key, (int, np.integer)):
+            return GPSTime._from_normalized(
+                int(self.week_number[key]),
+                int(self.seconds[key]),
+                int(self.femtoseconds[key]),
+            )
+        return self._from_normalized(
+            self.week_number[key], self.seconds[key], self.femtoseconds[key]
+        )
+
+    def __setitem__(self, key, value: Union[GPSTime, GPSTimeArray]) -> None:
+        """Assign times to elements of the array.
+
+        Parameters
+        ----------
+        key
+            An integer, slice, integer array, or boolean mask
+        value : Union[GPSTime, GPSTimeArray]
+            The time(s) to assign
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If value is not a `GPSTime` or `GPSTimeArray`
+        """
+        if not isinstance(value, (GPSTime, GPSTimeArray)):
+            raise TypeError("Only GPSTime or GPSTimeArray values can be assigned")
+        week_number, seconds, femtoseconds = self._other_columns(value)
+        self.week_number[key] = week_number
+        self.seconds[key] = seconds
+        self.femtoseconds[key] = femtoseconds
+
+    def __iter__(self) -> Iterator[GPSTime]:
+        """Iterate over the array, yielding `GPSTime` objects."""
+        for week_number, seconds, femtoseconds in zip(
+            self.week_number.tolist(),
+            self.seconds.tolist(),
+            self.femtoseconds.tolist(),
+        ):
+            yield GPSTime._from_normalized(week_number, seconds, femtoseconds)
+
+    def __add__(
+        self,
+        other: Union[
+            int,
+            float,
+            datetime.timedelta,
+            GPSTimeDelta,
+            GPSTimeDeltaArray,
+            np.ndarray,
+        ],
+    ) -> GPSTimeArray:
+        """Addition, apply an offset to every time in the array.
+
+        Parameters
+        ----------
+        other : Union[int, float, datetime.timedelta, GPSTimeDelta,
+                      GPSTimeDeltaArray, np.ndarray]
+            The offset to add. Numbers and numeric arrays are in seconds.
+            Arrays must broadcast against this array. Durations are added
+            exactly.
+
+        Returns
+        -------
+        GPSTimeArray
+            The times moved forward by `other`
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If other is not a supported type
+        """
+        seconds, femtoseconds = self._offset_columns(other, "+")
+        return self._from_normalized(
+            *_normalize(
+                self.week_number,
+                self.seconds + seconds,
+                self.femtoseconds + femtoseconds,
+            )
+        )
+
+    __radd__ = __add__
+
+    def __sub__(
+        self,
+        other: Union[
+            int,
+            float,
+            GPSTime,
+            GPSTimeArray,
+            datetime.timedelta,
+            GPSTimeDelta,
+            GPSTimeDeltaArray,
+            np.ndarray,
+        ],
+    ) -> Union[GPSTimeArray, np.ndarray]:
+        """Subtraction.
+
+        As with `GPSTime`, subtracting another time gives the number of
+        seconds between the times, while subtracting an offset moves the
+        times backward.
+
+        Parameters
+        ----------
+        other : Union[int, float, GPSTime, GPSTimeArray, datetime.timedelta,
+                      GPSTimeDelta, GPSTimeDeltaArray, np.ndarray]
+            The time or offset to subtract
+
+        Returns
+        -------
+        Union[GPSTimeArray, np.ndarray]
+            A float array of seconds if other is a `GPSTime` or
+            `GPSTimeArray`. A `GPSTimeArray` otherwise.
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If other is not a supported type
+        """
+        if isinstance(other, (GPSTime, GPSTimeArray)):
+            week_number, seconds, femtoseconds = self._other_columns(other)
+            weeks_diff = self.week_number - week_number
+            sec_diff = self.seconds - seconds
+            femto_diff = self.femtoseconds - femtoseconds
+            return (weeks_diff * _SEC_IN_WEEK + sec_diff).astype(
+                np.float64
+            ) + femto_diff * _FEMTO_SEC_TO_SEC
+
+        seconds, femtoseconds = self._offset_columns(other, "-")
+        return self._from_normalized(
+            *_normalize(
+                self.week_number,
+                self.seconds - seconds,
+                self.femtoseconds - femtoseconds,
+            )
+        )
+
+    def __rsub__(self, other: GPSTime) -> np.ndarray:
+        """Reflected subtraction, the seconds from each time to a `GPSTime`.
+
+        Parameters
+        ----------
+        other : GPSTime
+            The time to subtract the times of the array from
+
+        Returns
+        -------
+        np.ndarray
+            A float array of the seconds between the times
+        """
+        if not isinstance(other, GPSTime):
+            return NotImplemented
+        # Negating the float result is exact, as rounding is symmetric
+        return -(self - other)
+
+    def delta(self, other: Union[GPSTime, GPSTimeArray]) -> GPSTimeDeltaArray:
+        """Get the exact durations since other times.
+
+        This is the array form of `GPSTime.delta()`. Unlike subtraction,
+        which gives float seconds, the result is not rounded.
+
+        Parameters
+        ----------
+        other : Union[GPSTime, GPSTimeArray]
+            The earlier time(s)
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The durations from `other` to each time in this array
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If other is not a `GPSTime` or `GPSTimeArray`
+        """
+        if not isinstance(other, (GPSTime, GPSTimeArray)):
+            raise TypeError("other must be a GPSTime or GPSTimeArray")
+        week_number, seconds, femtoseconds = self._other_columns(other)
+        return GPSTimeDeltaArray(
+            (self.week_number - week_number) * _SEC_IN_WEEK + self.seconds - seconds,
+            self.femtoseconds - femtoseconds,
+        )
+
+    def _compare(self, other: Union[GPSTime, GPSTimeArray], less: bool, equal: bool):
+        """Compare against another time, element by element.
+
+        Parameters
+        ----------
+        other : Union[GPSTime, GPSTimeArray]
+            The time(s) to compare against
+        less : bool
+            If True, test for before `other`. Otherwise, test for after.
+        equal : bool
+            If True, coincident times also satisfy the comparison
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array, or NotImplemented for unsupported types
+        """
+        if not isinstance(other, (GPSTime, GPSTimeArray)):
+            return NotImplemented
+        week_number, seconds, femtoseconds = self._other_columns(other)
+        key = self._seconds_key()
+        other_key = week_number * _SEC_IN_WEEK + seconds
+        if less:
+            strict = (key < other_key) | (
+                (key == other_key) & (self.femtoseconds < femtoseconds)
+            )
+        else:
+            strict = (key > other_key) | (
+                (key == other_key) & (self.femtoseconds > femtoseconds)
+            )
+        if equal:
+            return strict | ((key == other_key) & (self.femtoseconds == femtoseconds))
+        return strict
+
+    def __lt__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Less Than, i.e. before, element by element."""
+        return self._compare(other, less=True, equal=False)
+
+    def __le__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Less Than or Equals, element by element."""
+        return self._compare(other, less=True, equal=True)
+
+    def __gt__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Greater Than, i.e. after, element by element."""
+        return self._compare(other, less=False, equal=False)
+
+    def __ge__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Greater Than or Equals, element by element."""
+        return self._compare(other, less=False, equal=True)
+
+    def __eq__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Equality, i.e. coincident, element by element."""
+        if not isinstance(other, (GPSTime, GPSTimeArray)):
+            return NotImplemented
+        week_number, seconds, femtoseconds = self._other_columns(other)
+        return (
+            (self.week_number == week_number)
+            & (self.seconds == seconds)
+            & (self.femtoseconds == femtoseconds)
+        )
+
+    def __ne__(self, other: Union[GPSTime, GPSTimeArray]) -> np.ndarray:
+        """Comparison: Not Equals, element by element."""
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return NotImplemented
+        return ~equal
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Representation of the object.
+
+        Returns
+        -------
+        str
+            The representation of the object
+
+        """
+        return "GPSTimeArray(week_number={}, seconds={}, femtoseconds={})".format(
+            self.week_number, self.seconds, self.femtoseconds
+        )
+
+
+def gpstimes_to_records(times: Iterable[GPSTime]) -> np.ndarray:
+    """Convert `GPSTime` objects to a structured array.
+
+    Parameters
+    ----------
+    times : Iterable[GPSTime]
+        The times
+
+    Returns
+    -------
+    np.ndarray
+        An array of `GPSTIME_DTYPE`
+    """
+    return GPSTimeArray.from_gpstimes(times).to_records()
+
+
+def records_to_gpstimes(records: np.ndarray) -> List[GPSTime]:
+    """Convert a structured array to `GPSTime` objects.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+
+    Returns
+    -------
+    List[GPSTime]
+        The times
+    """
+    return GPSTimeArray.from_records(records).to_gpstimes()
+
+
+def gpstime_add(
+    records: np.ndarray,
+    offset: Union[int, float, datetime.timedelta, GPSTimeDelta, np.ndarray],
+    out: Union[np.ndarray, None] = None,
+) -> np.ndarray:
+    """Apply offsets to a structured array of times.
+
+    This is `GPSTimeArray.__add__()` for arrays of `GPSTIME_DTYPE`.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+    offset : Union[int, float, datetime.timedelta, GPSTimeDelta, np.ndarray]
+        The offset(s) to add, in seconds if numeric
+    out : Union[np.ndarray, None], optional
+        An array of `GPSTIME_DTYPE` to write into, which may be `records`
+        itself, by default None
+
+    Returns
+    -------
+    np.ndarray
+        The offset times, as an array of `GPSTIME_DTYPE`
+    """
+    return (GPSTimeArray.from_records(records) + offset).to_records(out)
+
+
+def gpstime_subtract(
+    records: np.ndarray,
+    other: Union[
+        int, float, datetime.timedelta, GPSTime, GPSTimeDelta, np.ndarray
+    ],
+    out: Union[np.ndarray, None] = None,
+) -> np.ndarray:
+    """Subtract times or offsets from a structured array of times.
+
+    This is `GPSTimeArray.__sub__()` for arrays of `GPSTIME_DTYPE`.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+    other : Union[int, float, datetime.timedelta, GPSTime, GPSTimeDelta,
+                  np.ndarray]
+        A time, an array of `GPSTIME_DTYPE`, or the offset(s) to subtract
+    out : Union[np.ndarray, None], optional
+        When offsets are subtracted, an array of `GPSTIME_DTYPE` to write
+        into, by default None
+
+    Returns
+    -------
+    np.ndarray
+        The float seconds between the times if other is a time, otherwise
+        the offset times as an array of `GPSTIME_DTYPE`
+    """
+    if isinstance(other, np.ndarray) and other.dtype.names is not None:
+        other = GPSTimeArray.from_records(other)
+    result = GPSTimeArray.from_records(records) - other
+    if isinstance(result, GPSTimeArray):
+        return result.to_records(out)
+    return result
+
+
+_COMPARISONS = {
+    "<": GPSTimeArray.__lt__,
+    "<=": GPSTimeArray.__le__,
+    ">": GPSTimeArray.__gt__,
+    ">=": GPSTimeArray.__ge__,
+    "==": GPSTimeArray.__eq__,
+    "!=": GPSTimeArray.__ne__,
+}
+
+
+def gpstime_compare(
+    records: np.ndarray, other: Union[GPSTime, np.ndarray], operator: str
+) -> np.ndarray:
+    """Compare a structured array of times, element by element.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+    other : Union[GPSTime, np.ndarray]
+        A time or an array of `GPSTIME_DTYPE` to compare against
+    operator : str
+        One of "<", "<=", ">", ">=", "==", or "!="
+
+    Returns
+    -------
+    np.ndarray
+        The boolean results
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the operator is not recognized
+    """
+    if operator not in _COMPARISONS:
+        raise ValueError("operator must be one of {}".format(list(_COMPARISONS)))
+    if isinstance(other, np.ndarray):
+        other = GPSTimeArray.from_records(other)
+    return _COMPARISONS[operator](GPSTimeArray.from_records(records), other)
+
+
+def gpstime_min(records: np.ndarray) -> GPSTime:
+    """Get the earliest time in a structured array of times.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+
+    Returns
+    -------
+    GPSTime
+        The earliest time
+    """
+    return GPSTimeArray.from_records(records).min()
+
+
+def gpstime_max(records: np.ndarray) -> GPSTime:
+    """Get the latest time in a structured array of times.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+
+    Returns
+    -------
+    GPSTime
+        The latest time
+    """
+    return GPSTimeArray.from_records(records).max()
+
+
+def gpstime_argsort(records: np.ndarray) -> np.ndarray:
+    """Get the indices that would sort a structured array of times.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        An array of `GPSTIME_DTYPE`
+
+    Returns
+    -------
+    np.ndarray
+        The indices that sort the times from earliest to latest. The sort is
+        stable.
+    """
+    return GPSTimeArray.from_records(records).argsort()
+
+
+def _scale_columns(
+    seconds: np.ndarray, femtoseconds: np.ndarray, multiplier: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Multiply durations by integers, exactly.
+
+    The femtoseconds are split into two parts before multiplying so that the
+    products do not overflow int64.
+
+    Parameters
+    ----------
+    seconds : np.ndarray
+        The seconds of the durations
+    femtoseconds : np.ndarray
+        The femtoseconds of the durations, within [0, 1e15)
+    multiplier : np.ndarray
+        The integer multipliers, each less than about 9e9 in magnitude
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The seconds and femtoseconds of the products. The femtoseconds are
+        within [0, 1e15).
+    """
+    high, low = np.divmod(femtoseconds, 1000000000)
+    carry, high = np.divmod(high * multiplier, 1000000)
+    carry_seconds, femtoseconds = np.divmod(
+        high * 1000000000 + low * multiplier, _FEMTO_SEC_IN_SEC
+    )
+    return seconds * multiplier + carry + carry_seconds, femtoseconds
+
+
+def _cumulative_sum(
+    seconds: np.ndarray, femtoseconds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Accumulate durations exactly.
+
+    The femtoseconds are split into two parts that are summed separately,
+    so the running sums do not overflow int64 for any practical length.
+
+    Parameters
+    ----------
+    seconds : np.ndarray
+        The seconds of the durations
+    femtoseconds : np.ndarray
+        The femtoseconds of the durations, within [0, 1e15)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The seconds and femtoseconds of the running totals
+    """
+    high, low = np.divmod(femtoseconds, 1000000000)
+    carry, low = np.divmod(np.cumsum(low), 1000000000)
+    carry_seconds, high = np.divmod(np.cumsum(high) + carry, 1000000)
+    return np.cumsum(seconds) + carry_seconds, high * 1000000000 + low
+
+
+class GPSTimeDeltaArray:
+    """Columnar array of exact durations.
+
+    This is the array form of `GPSTimeDelta`. The durations are stored as
+    int64 columns of seconds and femtoseconds, and sums, differences,
+    integer multiples, and running totals are computed exactly with NumPy.
+    Indexing with an integer returns a `GPSTimeDelta`.
+
+    Parameters
+    ----------
+    seconds : Union[int, float, np.ndarray]
+        The number of seconds. If `femtoseconds` is not given and this is a
+        float array, the fractional seconds are converted as they are for
+        `GPSTimeDelta`.
+    femtoseconds : Union[int, np.ndarray], optional
+        The number of femtoseconds, by default None
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the columns are not one dimensional
+    TypeError
+        For various operators if the other operand is not a supported type
+    """
+
+    seconds: np.ndarray
+    femtoseconds: np.ndarray
+
+    # Make NumPy arrays defer to the operators of this class
+    __array_ufunc__ = None
+
+    def __init__(
+        self,
+        seconds: Union[int, float, np.ndarray],
+        femtoseconds: Union[int, np.ndarray, None] = None,
+    ) -> None:
+        """Object constructor.
+
+        The inputs are broadcast together and cast to int64. Femtoseconds
+        outside of [0, 1e15) are carried into the seconds.
+
+        Parameters
+        ----------
+        seconds : Union[int, float, np.ndarray]
+            The seconds
+        femtoseconds : Union[int, np.ndarray, None], optional
+            The femtoseconds, by default None
+        """
+        seconds = np.asarray(seconds)
+        if femtoseconds is None:
+            if seconds.dtype.kind == "f":
+                seconds, femtoseconds = _tow2sec_array(seconds)
+            else:
+                femtoseconds = 0
+
+        columns = [_as_column(v) for v in (seconds, femtoseconds)]
+        shape = np.broadcast_shapes(*(c.shape for c in columns))
+        seconds, femtoseconds = [
+            c if c.shape == shape else np.broadcast_to(c, shape).copy()
+            for c in columns
+        ]
+        if seconds.ndim != 1:
+            raise ValueError("GPSTimeDeltaArray columns must be one dimensional")
+
+        if np.any(femtoseconds < 0) or np.any(femtoseconds >= _FEMTO_SEC_IN_SEC):
+            carry, femtoseconds = np.divmod(femtoseconds, _FEMTO_SEC_IN_SEC)
+            seconds = seconds + carry
+
+        self.seconds = seconds
+        self.femtoseconds = femtoseconds
+
+    @classmethod
+    def _from_normalized(
+        cls, seconds: np.ndarray, femtoseconds: np.ndarray
+    ) -> GPSTimeDeltaArray:
+        """Create an array from columns that are already normalized.
+
+        Parameters
+        ----------
+        seconds : np.ndarray
+            The int64 seconds
+        femtoseconds : np.ndarray
+            The int64 femtoseconds, within [0, 1e15)
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The array wrapping the given columns
+        """
+        out = cls.__new__(cls)
+        out.seconds = seconds
+        out.femtoseconds = femtoseconds
+        return out
+
+    @classmethod
+    def from_deltas(cls, deltas: Iterable[GPSTimeDelta]) -> GPSTimeDeltaArray:
+        """Create an array from a sequence of `GPSTimeDelta` objects.
+
+        Parameters
+        ----------
+        deltas : Iterable[GPSTimeDelta]
+            The `GPSTimeDelta` objects
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The array holding the same durations
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If any element is not a `GPSTimeDelta`
+        """
+        deltas = list(deltas)
+        if not all(isinstance(d, GPSTimeDelta) for d in deltas):
+            raise TypeError("deltas must be a sequence of GPSTimeDelta")
+        count = len(deltas)
+        return cls._from_normalized(
+            np.fromiter((d.seconds for d in deltas), dtype=np.int64, count=count),
+            np.fromiter((d.femtoseconds for d in deltas), dtype=np.int64, count=count),
+        )
+
+    def to_deltas(self) -> List[GPSTimeDelta]:
+        """Convert to a list of `GPSTimeDelta` objects.
+
+        Returns
+        -------
+        List[GPSTimeDelta]
+            The durations
+        """
+        return list(self)
+
+    def total_seconds(self) -> np.ndarray:
+        """The durations as float seconds."""
+        return self.seconds + self.femtoseconds * _FEMTO_SEC_TO_SEC
+
+    def cumsum(self) -> GPSTimeDeltaArray:
+        """Get the running totals of the durations, exactly.
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The sum of the first `i + 1` durations at each index `i`
+        """
+        return self._from_normalized(*_cumulative_sum(self.seconds, self.femtoseconds))
+
+    def sum(self) -> GPSTimeDelta:
+        """Get the total of the durations, exactly.
+
+        Returns
+        -------
+        GPSTimeDelta
+            The total duration
+        """
+        if len(self) == 0:
+            return GPSTimeDelta(0)
+        return self.cumsum()[-1]
+
+    def _other_columns(
+        self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the second and femtosecond columns of the other operand.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, GPSTimeDeltaArray]
+            The other operand
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The columns, which are scalars if other is a `GPSTimeDelta`
+        """
+        if isinstance(other, GPSTimeDelta):
+            return np.int64(other.seconds), np.int64(other.femtoseconds)
+        return other.seconds, other.femtoseconds
+
+    def __len__(self) -> int:
+        """The number of durations in the array."""
+        return len(self.seconds)
+
+    def __getitem__(self, key) -> Union[GPSTimeDelta, GPSTimeDeltaArray]:
+        """Index the array.
+
+        Parameters
+        ----------
+        key
+            An integer, slice, integer array, or boolean mask
+
+        Returns
+        -------
+        Union[GPSTimeDelta, GPSTimeDeltaArray]
+            A `GPSTimeDelta` for an integer index. Otherwise, a
+            `GPSTimeDeltaArray`, which is a view of this array for a slice.
+        """
+        if isinstance(key, (int, np.integer)):
+            return GPSTimeDelta(int(self.seconds[key]), int(self.femtoseconds[key]))
+        return self._from_normalized(self.seconds[key], self.femtoseconds[key])
+
+    def __iter__(self) -> Iterator[GPSTimeDelta]:
+        """Iterate over the array, yielding `GPSTimeDelta` objects."""
+        for seconds, femtoseconds in zip(
+            self.seconds.tolist(), self.femtoseconds.tolist()
+        ):
+            yield GPSTimeDelta(seconds, femtoseconds)
+
+    def __add__(
+        self,
+        other: Union[GPSTimeDelta, GPSTimeDeltaArray, GPSTime, GPSTimeArray],
+    ) -> Union[GPSTimeDeltaArray, GPSTimeArray]:
+        """Addition.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, GPSTimeDeltaArray, GPSTime, GPSTimeArray]
+            The duration(s) or time(s) to add
+
+        Returns
+        -------
+        Union[GPSTimeDeltaArray, GPSTimeArray]
+            The total durations, or the times moved by the durations if other
+            is a `GPSTime` or `GPSTimeArray`
+        """
+        if isinstance(other, GPSTime):
+            other = GPSTimeArray.from_gpstimes([other])
+        if isinstance(other, GPSTimeArray):
+            return other + self
+        if not isinstance(other, (GPSTimeDelta, GPSTimeDeltaArray)):
+            return NotImplemented
+        seconds, femtoseconds = self._other_columns(other)
+        return GPSTimeDeltaArray(
+            self.seconds + seconds, self.femtoseconds + femtoseconds
+        )
+
+    __radd__ = __add__
+
+    def __sub__(
+        self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]
+    ) -> GPSTimeDeltaArray:
+        """Subtraction.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, GPSTimeDeltaArray]
+            The duration(s) to subtract
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The differences of the durations
+        """
+        if not isinstance(other, (GPSTimeDelta, GPSTimeDeltaArray)):
+            return NotImplemented
+        seconds, femtoseconds = self._other_columns(other)
+        return GPSTimeDeltaArray(
+            self.seconds - seconds, self.femtoseconds - femtoseconds
+        )
+
+    def __rsub__(self, other: GPSTimeDelta) -> GPSTimeDeltaArray:
+        """Subtraction from a `GPSTimeDelta`."""
+        if not isinstance(other, GPSTimeDelta):
+            return NotImplemented
+        return -self + other
+
+    def __neg__(self) -> GPSTimeDeltaArray:
+        """Negation."""
+        return GPSTimeDeltaArray(-self.seconds, -self.femtoseconds)
+
+    def __mul__(self, other: Union[int, np.ndarray]) -> GPSTimeDeltaArray:
+        """Scale the durations by integers, exactly.
+
+        Parameters
+        ----------
+        other : Union[int, np.ndarray]
+            The integer multiplier(s), which must broadcast against this array
+
+        Returns
+        -------
+        GPSTimeDeltaArray
+            The scaled durations
+        """
+        if isinstance(other, (bool, np.bool_)):
+            return NotImplemented
+        if isinstance(other, (int, np.integer)) or (
+            isinstance(other, np.ndarray) and other.dtype.kind in "iu"
+        ):
+            return self._from_normalized(
+                *_scale_columns(self.seconds, self.femtoseconds, _as_column(other))
+            )
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def _compare(
+        self, other: Union[GPSTimeDelta, GPSTimeDeltaArray], less: bool, equal: bool
+    ):
+        """Compare against other durations, element by element.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, GPSTimeDeltaArray]
+            The duration(s) to compare against
+        less : bool
+            If True, test for shorter than `other`. Otherwise, test for longer.
+        equal : bool
+            If True, equal durations also satisfy the comparison
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array, or NotImplemented for unsupported types
+        """
+        if not isinstance(other, (GPSTimeDelta, GPSTimeDeltaArray)):
+            return NotImplemented
+        seconds, femtoseconds = self._other_columns(other)
+        same = self.seconds == seconds
+        if less:
+            strict = (self.seconds < seconds) | (same & (self.femtoseconds < femtoseconds))
+        else:
+            strict = (self.seconds > seconds) | (same & (self.femtoseconds > femtoseconds))
+        if equal:
+            return strict | (same & (self.femtoseconds == femtoseconds))
+        return strict
+
+    def __lt__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Less Than, i.e. shorter, element by element."""
+        return self._compare(other, less=True, equal=False)
+
+    def __le__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Less Than or Equals, element by element."""
+        return self._compare(other, less=True, equal=True)
+
+    def __gt__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Greater Than, i.e. longer, element by element."""
+        return self._compare(other, less=False, equal=False)
+
+    def __ge__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Greater Than or Equals, element by element."""
+        return self._compare(other, less=False, equal=True)
+
+    def __eq__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Equality, element by element."""
+        if not isinstance(other, (GPSTimeDelta, GPSTimeDeltaArray)):
+            return NotImplemented
+        seconds, femtoseconds = self._other_columns(other)
+        return (self.seconds == seconds) & (self.femtoseconds == femtoseconds)
+
+    def __ne__(self, other: Union[GPSTimeDelta, GPSTimeDeltaArray]) -> np.ndarray:
+        """Comparison: Not Equals, element by element."""
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return NotImplemented
+        return ~equal
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Representation of the object.
+
+        Returns
+        -------
+        str
+            The representation of the object
+
+        """
+        return "GPSTimeDeltaArray(seconds={}, femtoseconds={})".format(
+            self.seconds, self.femtoseconds
+        )
@@ -0,0 +1,369 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+import os
+
+import numpy as np
+
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Union
+from logging import getLogger
+
+from .core import GPSTime
+from .arrays import GPSTimeArray
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.dataset
+
+
+__all__ = ['logger', 'gpstime_type', 'to_arrow', 'from_arrow', 'time_filter', 'write_parquet',
+           'read_parquet', 'scan_parquet']
+
+
+logger = getLogger(__name__)
+
+
+_FIELDS = ("week_number", "seconds", "femtoseconds")
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is an optional dependency.
+
+    Returns
+    -------
+    module
+        The pyarrow module
+    """
+
+    """
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "gps_time.arrow requires pyarrow; install it with `pip install gps_time[arrow]`"
+        )
+    return pyarrow
+
+
+def gpstime_type() -> pyarrow.StructType:
+    """The Arrow type of a GPS time column.
+
+    A GPS time is a struct of three int64 fields, "week_number", "seconds",
+    and "femtoseconds", which are the columns of `GPSTimeArray`. In Parquet,
+    each field is stored as its own column with its own statistics, so
+    filters on e.g. the week number skip row groups that cannot match.
+
+    Returns
+    -------
+    pyarrow.StructType
+        The struct type
+    """
+    pa = _import_pyarrow()
+    return pa.struct([(name, pa.int64()) for name in _FIELDS])
+
+
+def to_arrow(times: GPSTimeArray) -> pyarrow.StructArray:
+    """Convert a `GPSTimeArray` to an Arrow struct array.
+
+    The fields of the struct array share memory with the columns of the
+    `GPSTimeArray`, unless the columns are strided views, which are copied.
+    No precision is lost, unlike converting to timestamps.
+
+    Parameters
+    ----------
+    times : GPSTimeArray
+        The times
+
+    Returns
+    -------
+    pyarrow.StructArray
+        An array of `gpstime_type()`
+    """
+    pa = _import_pyarrow()
+    return pa.StructArray.from_arrays(
+        [pa.array(np.ascontiguousarray(getattr(times, name))) for name in _FIELDS],
+        fields=list(gpstime_type()),
+    )
+
+
+def from_arrow(
+    array: Union[pyarrow.StructArray, pyarrow.ChunkedArray]
+) -> GPSTimeArray:
+    """Convert an Arrow struct array to a `GPSTimeArray`.
+
+    The struct must have the fields of `gpstime_type()`. The columns of the
+    result share memory with the Arrow buffers if the array has a single
+    chunk, the fields are int64, and the times are normalized; such columns
+    are read-only, so use `GPSTimeArray.copy()` before modifying them in
+    place. Otherwise the columns are copied, and normalized as by the
+    `GPSTimeArray` constructor.
+
+    Parameters
+    ----------
+    array : Union[pyarrow.StructArray, pyarrow.ChunkedArray]
+        The GPS times, e.g. a column of a table read by `read_parquet()`
+
+    Returns
+    -------
+    GPSTimeArray
+        The times
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the array is not a struct with the fields of `gpstime_type()`
+    ValueError
+        If the array has nulls
+    """
+    pa = _import_pyarrow()
+    if not pa.types.is_struct(array.type) or not all(
+        array.type.get_field_index(name) >= 0 for name in _FIELDS
+    ):
+        raise TypeError("array must be a struct with the fields of gpstime_type()")
+    if array.null_count:
+        raise ValueError("array must not have nulls")
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks() if array.num_chunks != 1 else array.chunk(0)
+    # flatten() applies the offset and length of a sliced struct array
+    fields = dict(zip((f.name for f in array.type), array.flatten()))
+    return GPSTimeArray(*(_to_numpy(fields[name]) for name in _FIELDS))
+
+
+def _to_numpy(array: pyarrow.Array) -> np.ndarray:
+    """Convert an integer Arrow array without nulls to NumPy.
+
+    Parameters
+    ----------
+    array : pyarrow.Array
+        The integers
+
+    Returns
+    -------
+    np.ndarray
+        A view of the Arrow buffer if possible, otherwise a copy
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the array has nulls
+    """
+    if array.null_count:
+        raise ValueError("array must not have nulls")
+    return array.to_numpy(zero_copy_only=False)
+
+
+def time_filter(
+    column: str = "time",
+    start: Optional[GPSTime] = None,
+    stop: Optional[GPSTime] = None,
+) -> pyarrow.dataset.Expression:
+    """Build a dataset filter selecting the times in [start, stop).
+
+    The expression compares the week number, seconds, and femtoseconds
+    fields lexicographically, so it is exact. As each comparison starts with
+    the week number, Parquet row groups whose week number statistics are
+    outside of the range are skipped without being read. The expression can
+    be combined with other filters with `&` and `|`.
+
+    Parameters
+    ----------
+    column : str, optional
+        The name of the GPS time column, by default "time"
+    start : Optional[GPSTime], optional
+        The first time selected, by default None, which does not bound the
+        times from below
+    stop : Optional[GPSTime], optional
+        The time after the last time selected, by default None, which does
+        not bound the times from above
+
+    Returns
+    -------
+    pyarrow.dataset.Expression
+        The filter
+    """
+    _import_pyarrow()
+    import pyarrow.dataset as ds
+
+    week_number, seconds, femtoseconds = (ds.field(column, name) for name in _FIELDS)
+    expression = ds.scalar(True)
+    if start is not None:
+        expression &= (week_number > start.week_number) | (
+            (week_number == start.week_number)
+            & (
+                (seconds > start.seconds)
+                | ((seconds == start.seconds) & (femtoseconds >= start.femtoseconds))
+            )
+        )
+    if stop is not None:
+        expression &= (week_number < stop.week_number) | (
+            (week_number == stop.week_number)
+            & (
+                (seconds < stop.seconds)
+                | ((seconds == stop.seconds) & (femtoseconds < stop.femtoseconds))
+            )
+        )
+    return expression
+
+
+def write_parquet(
+    where: Union[str, os.PathLike],
+    times: GPSTimeArray,
+    column: str = "time",
+    table: Optional[pyarrow.Table] = None,
+    **kwargs: Any,
+) -> None:
+    """Write GPS times, and optionally other columns, to a Parquet file.
+
+    Sort the rows by time before writing so that each row group covers a
+    narrow range of weeks, which makes the filters of `read_parquet()` and
+    `scan_parquet()` skip as many row groups as possible.
+
+    Parameters
+    ----------
+    where : Union[str, os.PathLike]
+        The path of the Parquet file
+    times : GPSTimeArray
+        The times
+    column : str, optional
+        The name of the GPS time column, by default "time"
+    table : Optional[pyarrow.Table], optional
+        Other columns to write, with one row per time, by default None
+    **kwargs : Any
+        Passed to `pyarrow.parquet.write_table()`, e.g. `row_group_size`
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the table does not have one row per time
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if table is None:
+        table = pa.table({column: to_arrow(times)})
+    elif table.num_rows != len(times):
+        raise ValueError("table must have one row per time")
+    else:
+        table = table.append_column(column, to_arrow(times))
+    pq.write_table(table, where, **kwargs)
+
+
+def _dataset(source: Any) -> pyarrow.dataset.Dataset:
+    """Open a Parquet file, directory, or list of files as a dataset."""
+    _import_pyarrow()
+    import pyarrow.dataset as ds
+
+    if isinstance(source, ds.Dataset):
+        return source
+    return ds.dataset(source, format="parquet")
+
+
+def _scan_filter(
+    column: str,
+    start: Optional[GPSTime],
+    stop: Optional[GPSTime],
+    filter: Optional[pyarrow.dataset.Expression],
+) -> Optional[pyarrow.dataset.Expression]:
+    """Combine the time range with any other filter."""
+    if start is None and stop is None:
+        return filter
+    expression = time_filter(column, start, stop)
+    return expression if filter is None else expression & filter
+
+
+def read_parquet(
+    source: Any,
+    column: str = "time",
+    columns: Optional[List[str]] = None,
+    start: Optional[GPSTime] = None,
+    stop: Optional[GPSTime] = None,
+    filter: Optional[pyarrow.dataset.Expression] = None,
+) -> pyarrow.Table:
+    """Read the rows of Parquet files within a range of GPS times.
+
+    The files are read with `pyarrow.dataset`, so only the requested columns
+    are read (projection), and row groups that cannot hold times in
+    [start, stop) are skipped using their statistics (predicate pushdown).
+    Use `from_arrow()` to convert the GPS time column of the result.
+
+    Parameters
+    ----------
+    source : Any
+        A Parquet file, a directory of them, a list of files, or a
+        `pyarrow.dataset.Dataset`
+    column : str, optional
+        The name of the GPS time column, by default "time"
+    columns : Optional[List[str]], optional
+        The columns to read, by default None, which reads all of them
+    start : Optional[GPSTime], optional
+        The first time read, by default None
+    stop : Optional[GPSTime], optional
+        The time after the last time read, by default None
+    filter : Optional[pyarrow.dataset.Expression], optional
+        Another filter that the rows must satisfy, by default None
+
+    Returns
+    -------
+    pyarrow.Table
+        The rows within the range
+    """
+    return _dataset(source).to_table(
+        columns=columns, filter=_scan_filter(column, start, stop, filter)
+    )
+
+
+def scan_parquet(
+    source: Any,
+    column: str = "time",
+    columns: Optional[List[str]] = None,
+    start: Optional[GPSTime] = None,
+    stop: Optional[GPSTime] = None,
+    filter: Optional[pyarrow.dataset.Expression] = None,
+    batch_size: int = 131072,
+) -> Iterator[pyarrow.RecordBatch]:
+    """Scan the rows of Parquet files within a range of GPS times in batches.
+
+    This is `read_parquet()` for datasets that do not fit in memory. The
+    record batches are read as they are consumed.
+
+    Parameters
+    ----------
+    source : Any
+        A Parquet file, a directory of them, a list of files, or a
+        `pyarrow.dataset.Dataset`
+    column : str, optional
+        The name of the GPS time column, by default "time"
+    columns : Optional[List[str]], optional
+        The columns to read, by default None, which reads all of them
+    start : Optional[GPSTime], optional
+        The first time read, by default None
+    stop : Optional[GPSTime], optional
+        The time after the last time read, by default None
+    filter : Optional[pyarrow.dataset.Expression], optional
+        Another filter that the rows must satisfy, by default None
+    batch_size : int, optional
+        The largest number of rows in each batch, by default 131072
+
+    Yields
+    ------
+    pyarrow.RecordBatch
+        The rows within the range, in batches
+    """
+    return _dataset(source).to_batches(
+        columns=columns,
+        filter=_scan_filter(column, start, stop, filter),
+        batch_size=batch_size,
+    )
@@ -0,0 +1,172 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+import functools
+import threading
+
+from typing import Callable, Dict, Hashable, NamedTuple, Optional
+from logging import getLogger
+
+
+__all__ = ['logger', 'CacheInfo', 'enable_cache', 'disable_cache', 'clear_cache', 'cache_enabled',
+           'cache_info']
+
+
+logger = getLogger(__name__)
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Memo:
+    """A conversion whose results can be cached.
+
+    The conversion must take a single hashable argument and its result must
+    depend only on the value of that argument. The argument and result must
+    be immutable, e.g. tuples of integers or datetimes, so that cached values
+    cannot be modified by the caller. Callers check `cached`, which is None
+    while caching is disabled, so that the disabled path costs a single
+    attribute lookup.
+
+    Parameters
+    ----------
+    func : Callable[[Hashable], object]
+        The conversion
+    """
+
+    __slots__ = ("func", "cached")
+
+    def __init__(self, func: Callable[[Hashable], object]) -> None:
+        self.func = func
+        self.cached: Optional[Callable[[Hashable], object]] = None
+
+
+_lock = threading.Lock()
+
+_memos: Dict[str, _Memo] = {}
+"""The conversions that can be cached, by name."""
+
+_maxsize: Optional[int] = None
+"""The size of each cache, or None while caching is disabled."""
+
+
+def _memoize(name: str, func: Callable[[Hashable], object]) -> _Memo:
+    """Register a conversion that can be cached.
+
+    Parameters
+    ----------
+    name : str
+        The name of the conversion, as reported by `cache_info()`
+    func : Callable[[Hashable], object]
+        The conversion
+
+    Returns
+    -------
+    _Memo
+        The conversion, with its cache if caching is enabled
+
+    """
+    memo = _Memo(func)
+    with _lock:
+        if _maxsize is not None:
+            memo.cached = functools.lru_cache(maxsize=_maxsize)(func)
+        _memos[name] = memo
+    return memo
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """Cache the results of conversions.
+
+    Each of `GPSTime.from_datetime()`, `GPSTime.to_datetime()`, and
+    `gps2utc()` gets its own cache, which holds the results for the
+    `maxsize` most recently used inputs. Only inputs for which a cached
+    result is exact are cached, i.e. `datetime.datetime` objects (not
+    subclasses) and the integer fields of `GPSTime` objects. A new
+    `GPSTime` is returned on every call, so modifying one does not affect the
+    cache.
+
+    The caches may be used from several threads. Enabling the caches again
+    replaces them with empty caches of the new size. Warnings logged by a
+    conversion, such as for times after the leap second table expires, are
+    only logged when the result is not in the cache.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The number of results held by each cache, by default 4096
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the size is not positive
+    """
+    global _maxsize
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    with _lock:
+        _maxsize = maxsize
+        for memo in _memos.values():
+            memo.cached = functools.lru_cache(maxsize=maxsize)(memo.func)
+
+
+def disable_cache() -> None:
+    """Stop caching the results of conversions and free the caches."""
+    global _maxsize
+    with _lock:
+        _maxsize = None
+        for memo in _memos.values():
+            memo.cached = None
+
+
+def clear_cache(name: Optional[str] = None) -> None:
+    """Empty the caches and reset their counters.
+
+    Parameters
+    ----------
+    name : Optional[str], optional
+        The name of the conversion whose cache is emptied, by default None,
+        which empties all of the caches
+
+    """
+    with _lock:
+        for memo_name, memo in _memos.items():
+            if memo.cached is not None and name in (None, memo_name):
+                memo.cached.cache_clear()
+
+
+def cache_enabled() -> bool:
+    """Check if the results of conversions are being cached.
+
+    Returns
+    -------
+    bool
+        True if the caches are enabled
+
+    """
+    return _maxsize is not None
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Get the statistics of each cache.
+
+    Returns
+    -------
+    Dict[str, CacheInfo]
+        The hits, misses, maximum size, and current size of the cache of
+        each conversion. These are all zero while caching is disabled.
+
+    """
+    with _lock:
+        return {
+            name: CacheInfo(*memo.cached.cache_info()) if memo.cached is not None else CacheInfo(0, 0, 0, 0)
+            for name, memo in _memos.items()
+        }
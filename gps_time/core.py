@@ -3,18 +3,23 @@
 
 
 from __future__ import annotations
+import sys
+import struct
 import datetime
-import ruamel.yaml
+import fractions
 
-import numpy as np
-
-from typing import Union, Tuple
+from typing import TYPE_CHECKING, Callable, Union, Tuple
 from logging import getLogger
 
+from .cache import _memoize
 from .datetime import tow2datetime, datetime2tow
 
+if TYPE_CHECKING:
+    import numpy as np
+    import ruamel.yaml
+
 
-__all__ = ['logger', 'GPSTime']
+__all__ = ['logger', 'GPSTime', 'GPSTimeDelta']
 
 
 logger = getLogger(__name__)
@@ -23,6 +28,14 @@ logger = getLogger(__name__)
 _SEC_IN_WEEK: int = 604800
 _SEC_TO_FEMTO_SEC: float = 1.0e15
 _FEMTO_SEC_TO_SEC: float = 1.0e-15
+_FEMTO_SEC_IN_SEC: int = 1000000000000000
+
+_WIRE_FORMAT: struct.Struct = struct.Struct("<HIQ")
+"""The 14 byte binary encoding of a `GPSTime`.
+
+The week number (uint16), seconds of week (uint32), and femtoseconds
+(uint64), little-endian and without padding.
+"""
 
 
 def _tow2sec(time_of_week: float) -> Tuple[int, int]:
@@ -43,6 +56,496 @@ def _tow2sec(time_of_week: float) -> Tuple[int, int]:
     return seconds, femtoseconds
 
 
+def _is_ndarray(value: object) -> bool:
+    """Check if a value is a numpy array without importing numpy.
+
+    If numpy has not been imported, then the value cannot be an array.
+
+    Parameters
+    ----------
+    value : object
+        The value to check
+
+    Returns
+    -------
+    bool
+        True if the value is a `numpy.ndarray`
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _is_gpstime_array(value: object) -> bool:
+    """Check if a value is a `GPSTimeArray` without importing numpy.
+
+    If the arrays module has not been imported, then the value cannot be a
+    `GPSTimeArray`.
+
+    Parameters
+    ----------
+    value : object
+        The value to check
+
+    Returns
+    -------
+    bool
+        True if the value is a `GPSTimeArray`
+    """
+    arrays = sys.modules.get(__package__ + ".arrays")
+    return arrays is not None and isinstance(value, arrays.GPSTimeArray)
+
+
+def _reconstruct_gpstime(
+    cls: type, week_number: int, seconds: int, femtoseconds: int
+) -> GPSTime:
+    """Unpickle a `GPSTime` from the values written by `GPSTime.__reduce__()`."""
+    return cls._from_normalized(week_number, seconds, femtoseconds)
+
+
+def _normalize(
+    week_number: int, seconds: int, femtoseconds: int
+) -> Tuple[int, int, int]:
+    """Carry out-of-range femtoseconds and seconds into the larger units.
+
+    This is equivalent to `GPSTime.correct_time()`, but it only uses integer
+    arithmetic and does not require a `GPSTime`.
+
+    Parameters
+    ----------
+    week_number : int
+        The week number
+    seconds : int
+        The seconds of week, possibly outside of [0, 604800)
+    femtoseconds : int
+        The femtoseconds, possibly outside of [0, 1e15)
+
+    Returns
+    -------
+    Tuple[int, int, int]
+        The normalized week number, seconds, and femtoseconds
+    """
+    if femtoseconds >= _FEMTO_SEC_IN_SEC or femtoseconds < 0:
+        carry, femtoseconds = divmod(femtoseconds, _FEMTO_SEC_IN_SEC)
+        seconds += carry
+    if seconds >= _SEC_IN_WEEK or seconds < 0:
+        carry, seconds = divmod(seconds, _SEC_IN_WEEK)
+        week_number += carry
+    return week_number, seconds, femtoseconds
+
+
+def _datetime_to_fields(time: datetime.datetime) -> Tuple[int, int, int]:
+    """Convert a datetime to the fields of a `GPSTime`.
+
+    Parameters
+    ----------
+    time : datetime.datetime
+        The datetime
+
+    Returns
+    -------
+    Tuple[int, int, int]
+        The normalized week number, seconds, and femtoseconds
+    """
+    week_num, tow = datetime2tow(time)
+    seconds, femtoseconds = _tow2sec(tow)
+    return _normalize(week_num, seconds, femtoseconds)
+
+
+def _fields_to_datetime(fields: Tuple[int, int, int]) -> datetime.datetime:
+    """Convert the fields of a `GPSTime` to a datetime.
+
+    Parameters
+    ----------
+    fields : Tuple[int, int, int]
+        The week number, seconds, and femtoseconds
+
+    Returns
+    -------
+    datetime.datetime
+        The datetime, as for `GPSTime.to_datetime()`
+    """
+    week_number, seconds, femtoseconds = fields
+    return tow2datetime(week_number, float(seconds + femtoseconds * _FEMTO_SEC_TO_SEC))
+
+
+_from_datetime_memo = _memoize("from_datetime", _datetime_to_fields)
+_to_datetime_memo = _memoize("to_datetime", _fields_to_datetime)
+
+
+class GPSTimeDelta:
+    """Exact duration between GPS times.
+
+    The duration is held as integer seconds and femtoseconds, so sums,
+    differences, and integer multiples are exact and do not drift, however
+    many are accumulated. Like `datetime.timedelta`, only the seconds may be
+    negative; the femtoseconds are always in [0, 1e15).
+
+    Parameters
+    ----------
+    seconds : Union[int, float]
+        The number of seconds. Floats are split into seconds and femtoseconds
+        as the time of week is for `GPSTime`.
+    femtoseconds : int
+        The number of femtoseconds to add to the seconds
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        For various operators if the other operand is not a supported type
+    """
+
+    seconds: int
+    femtoseconds: int
+
+    __slots__ = ("seconds", "femtoseconds")
+
+    def __init__(self, seconds: Union[int, float] = 0, femtoseconds: int = 0) -> None:
+        """Object constructor.
+
+        Parameters
+        ----------
+        seconds : Union[int, float], optional
+            The number of seconds, by default 0
+        femtoseconds : int, optional
+            The number of femtoseconds, by default 0
+        """
+        if isinstance(seconds, float):
+            seconds, extra_femtoseconds = _tow2sec(seconds)
+            femtoseconds = int(femtoseconds) + extra_femtoseconds
+        carry, self.femtoseconds = divmod(int(femtoseconds), _FEMTO_SEC_IN_SEC)
+        self.seconds = int(seconds) + carry
+
+    @classmethod
+    def _from_femtoseconds(cls, femtoseconds: int) -> GPSTimeDelta:
+        """Create a `GPSTimeDelta` from a total number of femtoseconds."""
+        out = object.__new__(cls)
+        out.seconds, out.femtoseconds = divmod(femtoseconds, _FEMTO_SEC_IN_SEC)
+        return out
+
+    @classmethod
+    def from_timedelta(cls, delta: datetime.timedelta) -> GPSTimeDelta:
+        """Create a `GPSTimeDelta` from a timedelta.
+
+        Parameters
+        ----------
+        delta : datetime.timedelta
+            The timedelta
+
+        Returns
+        -------
+        GPSTimeDelta
+            The same duration. This is a lossless conversion.
+        """
+        return cls(
+            delta.days * 86400 + delta.seconds, delta.microseconds * 1000000000
+        )
+
+    def to_timedelta(self) -> datetime.timedelta:
+        """Convert the duration to a timedelta.
+
+        Returns
+        -------
+        datetime.timedelta
+            The duration, rounded to the microsecond
+        """
+        return datetime.timedelta(
+            seconds=self.seconds,
+            microseconds=round(fractions.Fraction(self.femtoseconds, 1000000000)),
+        )
+
+    def total_femtoseconds(self) -> int:
+        """The duration as an integer number of femtoseconds."""
+        return self.seconds * _FEMTO_SEC_IN_SEC + self.femtoseconds
+
+    def total_seconds(self) -> float:
+        """The duration as a float number of seconds."""
+        return float(self.seconds + self.femtoseconds * _FEMTO_SEC_TO_SEC)
+
+    def __add__(
+        self, other: Union[GPSTimeDelta, GPSTime, datetime.timedelta]
+    ) -> Union[GPSTimeDelta, GPSTime]:
+        """Addition.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, GPSTime, datetime.timedelta]
+            The duration or time to add
+
+        Returns
+        -------
+        Union[GPSTimeDelta, GPSTime]
+            The total duration, or the time moved by this duration if other is
+            a `GPSTime`
+        """
+        if isinstance(other, GPSTime):
+            return other + self
+        if isinstance(other, datetime.timedelta):
+            other = GPSTimeDelta.from_timedelta(other)
+        elif not isinstance(other, GPSTimeDelta):
+            return NotImplemented
+        return GPSTimeDelta(
+            self.seconds + other.seconds, self.femtoseconds + other.femtoseconds
+        )
+
+    __radd__ = __add__
+
+    def __sub__(
+        self, other: Union[GPSTimeDelta, datetime.timedelta]
+    ) -> GPSTimeDelta:
+        """Subtraction.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, datetime.timedelta]
+            The duration to subtract
+
+        Returns
+        -------
+        GPSTimeDelta
+            The difference of the durations
+        """
+        if isinstance(other, datetime.timedelta):
+            other = GPSTimeDelta.from_timedelta(other)
+        elif not isinstance(other, GPSTimeDelta):
+            return NotImplemented
+        return GPSTimeDelta(
+            self.seconds - other.seconds, self.femtoseconds - other.femtoseconds
+        )
+
+    def __rsub__(self, other: datetime.timedelta) -> GPSTimeDelta:
+        """Subtraction from a timedelta."""
+        if isinstance(other, datetime.timedelta):
+            return GPSTimeDelta.from_timedelta(other) - self
+        return NotImplemented
+
+    def __neg__(self) -> GPSTimeDelta:
+        """Negation."""
+        return GPSTimeDelta(-self.seconds, -self.femtoseconds)
+
+    def __pos__(self) -> GPSTimeDelta:
+        """Unary plus."""
+        return self
+
+    def __abs__(self) -> GPSTimeDelta:
+        """Absolute value."""
+        return -self if self.seconds < 0 else self
+
+    def __mul__(self, other: Union[int, float, fractions.Fraction]) -> GPSTimeDelta:
+        """Scale the duration.
+
+        Integer multiples are exact. Other factors are converted exactly to
+        fractions and the product is rounded to the nearest femtosecond.
+
+        Parameters
+        ----------
+        other : Union[int, float, fractions.Fraction]
+            The scale factor
+
+        Returns
+        -------
+        GPSTimeDelta
+            The scaled duration
+        """
+        if isinstance(other, bool):
+            return NotImplemented
+        if isinstance(other, int):
+            return GPSTimeDelta(self.seconds * other, self.femtoseconds * other)
+        if isinstance(other, (float, fractions.Fraction)):
+            return GPSTimeDelta._from_femtoseconds(
+                round(self.total_femtoseconds() * fractions.Fraction(other))
+            )
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(
+        self, other: Union[GPSTimeDelta, int, float, fractions.Fraction]
+    ) -> Union[float, GPSTimeDelta]:
+        """Division.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, int, float, fractions.Fraction]
+            The duration or the number to divide by
+
+        Returns
+        -------
+        Union[float, GPSTimeDelta]
+            The ratio of the durations, or the duration divided by the number
+            and rounded to the nearest femtosecond
+        """
+
+        """
+        Raises
+        ------
+        ZeroDivisionError
+            If other is zero
+        """
+        if isinstance(other, GPSTimeDelta):
+            return self.total_femtoseconds() / other.total_femtoseconds()
+        if isinstance(other, bool):
+            return NotImplemented
+        if isinstance(other, (int, float, fractions.Fraction)):
+            return GPSTimeDelta._from_femtoseconds(
+                round(self.total_femtoseconds() / fractions.Fraction(other))
+            )
+        return NotImplemented
+
+    def __floordiv__(self, other: Union[GPSTimeDelta, int]) -> Union[int, GPSTimeDelta]:
+        """Floor division.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, int]
+            The duration or integer to divide by
+
+        Returns
+        -------
+        Union[int, GPSTimeDelta]
+            The number of whole `other` durations in this one, or the duration
+            divided by the integer and floored to the femtosecond
+        """
+
+        """
+        Raises
+        ------
+        ZeroDivisionError
+            If other is zero
+        """
+        if isinstance(other, GPSTimeDelta):
+            return self.total_femtoseconds() // other.total_femtoseconds()
+        if isinstance(other, int) and not isinstance(other, bool):
+            return GPSTimeDelta._from_femtoseconds(self.total_femtoseconds() // other)
+        return NotImplemented
+
+    def __mod__(self, other: GPSTimeDelta) -> GPSTimeDelta:
+        """The remainder of the floor division by another duration."""
+        if isinstance(other, GPSTimeDelta):
+            return GPSTimeDelta._from_femtoseconds(
+                self.total_femtoseconds() % other.total_femtoseconds()
+            )
+        return NotImplemented
+
+    def _key(self, other: Union[GPSTimeDelta, datetime.timedelta]):
+        """Get the (seconds, femtoseconds) key of the other operand.
+
+        Parameters
+        ----------
+        other : Union[GPSTimeDelta, datetime.timedelta]
+            The object to compare. Timedeltas are converted to `GPSTimeDelta`
+
+        Returns
+        -------
+        Tuple[int, int]
+            The seconds and femtoseconds of other, or `NotImplemented` if
+            other is not a duration
+        """
+        if isinstance(other, datetime.timedelta):
+            other = GPSTimeDelta.from_timedelta(other)
+        elif not isinstance(other, GPSTimeDelta):
+            return NotImplemented
+        return other.seconds, other.femtoseconds
+
+    def __lt__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Less Than, i.e. shorter."""
+        key = self._key(other)
+        if key is NotImplemented:
+            return NotImplemented
+        return (self.seconds, self.femtoseconds) < key
+
+    def __le__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Less Than or Equals."""
+        key = self._key(other)
+        if key is NotImplemented:
+            return NotImplemented
+        return (self.seconds, self.femtoseconds) <= key
+
+    def __gt__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Greater Than, i.e. longer."""
+        key = self._key(other)
+        if key is NotImplemented:
+            return NotImplemented
+        return (self.seconds, self.femtoseconds) > key
+
+    def __ge__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Greater Than or Equals."""
+        key = self._key(other)
+        if key is NotImplemented:
+            return NotImplemented
+        return (self.seconds, self.femtoseconds) >= key
+
+    def __eq__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Equality."""
+        key = self._key(other)
+        if key is NotImplemented:
+            return NotImplemented
+        return (self.seconds, self.femtoseconds) == key
+
+    def __ne__(self, other: Union[GPSTimeDelta, datetime.timedelta]) -> bool:
+        """Comparison: Not Equals."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        """Make GPSTimeDelta hashable.
+
+        Durations of whole microseconds are equal to the `datetime.timedelta`
+        of the same length, so they hash as that timedelta.
+        """
+        if self.femtoseconds % 1000000000 == 0:
+            try:
+                return hash(
+                    datetime.timedelta(
+                        seconds=self.seconds,
+                        microseconds=self.femtoseconds // 1000000000,
+                    )
+                )
+            except OverflowError:
+                # Longer than any timedelta, so equal to none of them
+                pass
+        return hash((self.seconds, self.femtoseconds))
+
+    def __bool__(self) -> bool:
+        """A duration is true if it is not zero."""
+        return bool(self.seconds or self.femtoseconds)
+
+    def __getstate__(self) -> dict:
+        """Get the state of the object for pickling.
+
+        Returns
+        -------
+        dict
+            The seconds and femtoseconds
+        """
+        return {"seconds": self.seconds, "femtoseconds": self.femtoseconds}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state of the object when unpickling.
+
+        Parameters
+        ----------
+        state : dict
+            The seconds and femtoseconds
+        """
+        self.seconds = state["seconds"]
+        self.femtoseconds = state["femtoseconds"]
+
+    def __repr__(self) -> str:
+        """Representation of the object.
+
+        Returns
+        -------
+        str
+            The representation of the object
+
+        """
+        return "GPSTimeDelta(seconds={}, femtoseconds={})".format(
+            self.seconds, self.femtoseconds
+        )
+
+
 class GPSTime:
     """Time representation for GPS.
 
@@ -58,14 +561,10 @@ class GPSTime:
     femtoseconds : int
         The number of femtoseconds into the week. That is, this is the number
         of fractional seconds in the time of week with a scale factor of 1e15.
-    """
-
-    """
-    Todo
-    ----
-    .. todo:: Create a GPSTimeDelta class to handle adding/subtracting with
-        increase accuracy.
 
+    See Also
+    --------
+    `GPSTimeDelta`
     """
 
     """
@@ -81,6 +580,8 @@ class GPSTime:
     seconds: int
     femtoseconds: int
 
+    __slots__ = ("week_number", "seconds", "femtoseconds")
+
     yaml_tag: str = u"!GPSTime"
 
     def __init__(self, week_number: int, *args, **kwargs) -> None:
@@ -122,7 +623,6 @@ class GPSTime:
               used together.
 
         """
-        self.yaml_tag: str = u"!GPSTime"
         if len(args) > 0 and len(kwargs) > 0:
             raise ValueError(
                 "GPSTime does not support both positional and keyword arguments."
@@ -190,6 +690,142 @@ class GPSTime:
         if self.week_number < 0:
             logger.warning("Week number is less than 0")
 
+    @classmethod
+    def _from_normalized(
+        cls, week_number: int, seconds: int, femtoseconds: int
+    ) -> GPSTime:
+        """Create a `GPSTime` from values that are already normalized.
+
+        This is a fast path for internal use that skips the argument parsing
+        and `correct_time()` call of the constructor. The values must be
+        integers with the seconds in [0, 604800) and the femtoseconds in
+        [0, 1e15).
+
+        Parameters
+        ----------
+        week_number : int
+            The week number
+        seconds : int
+            The seconds of week
+        femtoseconds : int
+            The femtoseconds
+
+        Returns
+        -------
+        GPSTime
+            The new `GPSTime`
+        """
+        out = object.__new__(cls)
+        out.week_number = week_number
+        out.seconds = seconds
+        out.femtoseconds = femtoseconds
+        if week_number < 0:
+            logger.warning("Week number is less than 0")
+        return out
+
+    def __reduce__(self) -> Tuple[Callable, tuple]:
+        """Reduce the object for pickling.
+
+        Only the class and the three integers are pickled, and unpickling
+        skips the argument handling of the constructor.
+
+        Returns
+        -------
+        Tuple[Callable, tuple]
+            The function that recreates the object and its arguments
+        """
+        return (
+            _reconstruct_gpstime,
+            (type(self), self.week_number, self.seconds, self.femtoseconds),
+        )
+
+    def __getstate__(self) -> dict:
+        """Get the state of the object for YAML.
+
+        Returns
+        -------
+        dict
+            The week number, seconds, and femtoseconds
+        """
+        return {
+            "week_number": self.week_number,
+            "seconds": self.seconds,
+            "femtoseconds": self.femtoseconds,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state of the object from older pickles.
+
+        This loads instances pickled before `GPSTime` defined `__reduce__()`.
+        Other entries of the state, such as the `yaml_tag` stored by
+        instances pickled before `GPSTime` used `__slots__`, are ignored.
+
+        Parameters
+        ----------
+        state : dict
+            The week number, seconds, and femtoseconds
+        """
+        self.week_number = state["week_number"]
+        self.seconds = state["seconds"]
+        self.femtoseconds = state["femtoseconds"]
+
+    def to_bytes(self) -> bytes:
+        """Encode the time in the compact binary wire format.
+
+        The encoding is 14 bytes: the week number as a uint16, the seconds
+        of week as a uint32, and the femtoseconds as a uint64, little-endian.
+        Unlike pickle, decoding it cannot run code, so it is safe for data
+        received from untrusted sources. Use `gps_time.wire` to encode many
+        times into one buffer.
+
+        Returns
+        -------
+        bytes
+            The encoded time
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If the week number is not within [0, 65535]
+        """
+        if not 0 <= self.week_number <= 0xFFFF:
+            raise ValueError("The week number must be within [0, 65535] to encode it")
+        return _WIRE_FORMAT.pack(self.week_number, self.seconds, self.femtoseconds)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> GPSTime:
+        """Decode a time encoded by `to_bytes()`.
+
+        Parameters
+        ----------
+        data : Union[bytes, bytearray, memoryview]
+            The 14 bytes of the encoded time
+
+        Returns
+        -------
+        GPSTime
+            The decoded time
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If the data is not 14 bytes long or does not hold a normalized
+            time
+        """
+        try:
+            week_number, seconds, femtoseconds = _WIRE_FORMAT.unpack(data)
+        except struct.error:
+            raise ValueError(
+                "A GPSTime is encoded in {} bytes".format(_WIRE_FORMAT.size)
+            )
+        if seconds >= _SEC_IN_WEEK or femtoseconds >= _FEMTO_SEC_IN_SEC:
+            raise ValueError("The encoded time is not normalized")
+        return cls._from_normalized(week_number, seconds, femtoseconds)
+
     @property
     def time_of_week(self) -> float:
         """The time of week as a float."""
@@ -266,6 +902,23 @@ class GPSTime:
 
         return cls(int(week_number), int(seconds), int(femtoseconds))
 
+    @classmethod
+    def to_yaml(
+        cls: type, representer: ruamel.yaml.Representer, node: GPSTime
+    ) -> ruamel.yaml.MappingNode:
+        """YAML Representer.
+
+        This YAML representer is used to dump a GPSTime to a YAML file. It is
+        registered along with `from_yaml()` by `register_class()`. The time is
+        written as a single flow-style mapping of its integer fields, e.g.
+        `!GPSTime {week_number: 2139, seconds: 12345, femtoseconds: 0}`, which
+        is exact and keeps documents holding many times compact.
+
+        """
+        return representer.represent_mapping(
+            cls.yaml_tag, node.__getstate__(), flow_style=True
+        )
+
     def to_datetime(self) -> datetime.datetime:
         """Convert the `GPSTime` to a datetime.
 
@@ -284,6 +937,9 @@ class GPSTime:
             conversion may lose some fidelity.
 
         """
+        cached = _to_datetime_memo.cached
+        if cached is not None:
+            return cached((self.week_number, self.seconds, self.femtoseconds))
         return tow2datetime(self.week_number, self.time_of_week)
 
     @classmethod
@@ -317,9 +973,17 @@ class GPSTime:
         if not isinstance(time, datetime.datetime):
             raise TypeError("time must be a datetime")
 
-        week_num, tow = datetime2tow(time)
+        # Subclasses of datetime may hold more than the datetime fields
+        cached = _from_datetime_memo.cached
+        if cached is not None and type(time) is datetime.datetime:
+            # Aware datetimes that compare equal may be different instants,
+            # e.g. the repeated hour when daylight saving time ends differs
+            # only in fold, so the cache is keyed on the UTC instant
+            if time.utcoffset() is not None:
+                time = time.astimezone(datetime.timezone.utc)
+            return cls._from_normalized(*cached(time))
 
-        return cls(week_num, tow)
+        return cls._from_normalized(*_datetime_to_fields(time))
 
     def to_zcount(self) -> float:
         """Get the current Z-Count.
@@ -374,7 +1038,13 @@ class GPSTime:
     def __add__(
         self,
         other: Union[
-            int, float, GPSTime, datetime.datetime, datetime.timedelta, np.ndarray
+            int,
+            float,
+            GPSTime,
+            GPSTimeDelta,
+            datetime.datetime,
+            datetime.timedelta,
+            np.ndarray,
         ],
     ) -> Union[GPSTime, np.ndarray]:
         """Addition, apply an offset to a `GPSTime`.
@@ -389,11 +1059,12 @@ class GPSTime:
 
         Parameters
         ----------
-        other : Union[int, float, GPSTime, datetime.datetime,
+        other : Union[int, float, GPSTime, GPSTimeDelta, datetime.datetime,
                       datetime.timedelta, np.ndarray]
             The other value to add to the `GPSTime`. `int` and `float` values
-            are the number of seconds to add to the `GPSTime`. `GPSTime` and
-            `datetime.timedelta` have explicit unit definitions that are used.
+            are the number of seconds to add to the `GPSTime`. `GPSTime`,
+            `GPSTimeDelta`, and `datetime.timedelta` have explicit unit
+            definitions that are used. Adding a `GPSTimeDelta` is exact.
              If the value is a datetime.datetime, it is converted to a GPSTime
              before adding.
 
@@ -428,32 +1099,46 @@ class GPSTime:
                 )
             )
         if isinstance(other, int) or isinstance(other, float):
-            gps_time_to_add = GPSTime(0, float(other))
+            week_num = self.week_number
+            seconds, femtoseconds = _tow2sec(float(other))
+        elif isinstance(other, GPSTimeDelta):
+            week_num = self.week_number
+            seconds = other.seconds
+            femtoseconds = other.femtoseconds
         elif isinstance(other, datetime.timedelta):
-            gps_time_to_add = GPSTime(0, other.total_seconds())
-        elif isinstance(other, datetime.datetime):
-            gps_time_to_add = GPSTime.from_datetime(other)
-        elif isinstance(other, GPSTime):
-            gps_time_to_add = other
-        elif isinstance(other, np.ndarray):
+            week_num = self.week_number
+            seconds, femtoseconds = _tow2sec(other.total_seconds())
+        elif isinstance(other, (datetime.datetime, GPSTime)):
+            if isinstance(other, datetime.datetime):
+                other = GPSTime.from_datetime(other)
+            week_num = self.week_number + other.week_number
+            seconds = other.seconds
+            femtoseconds = other.femtoseconds
+        elif _is_ndarray(other):
+            import numpy as np
+
             input = np.array([self])
             return input + other
         else:
-            raise TypeError(
-                "unsupported operand type(s) for +: '{}' and '{}'".format(
-                    type(self), type(other)
-                )
-            )
+            # Let the other operand, e.g. a GPSTimeDeltaArray, handle it
+            return NotImplemented
 
-        week_num = self.week_number + gps_time_to_add.week_number
-        seconds = self.seconds + gps_time_to_add.seconds
-        femtoseconds = self.femtoseconds + gps_time_to_add.femtoseconds
-        return GPSTime(week_num, seconds, femtoseconds)
+        return GPSTime._from_normalized(
+            *_normalize(
+                week_num, self.seconds + seconds, self.femtoseconds + femtoseconds
+            )
+        )
 
     def __sub__(
         self,
         other: Union[
-            int, float, GPSTime, datetime.datetime, datetime.timedelta, np.ndarray
+            int,
+            float,
+            GPSTime,
+            GPSTimeDelta,
+            datetime.datetime,
+            datetime.timedelta,
+            np.ndarray,
         ],
     ) -> Union[GPSTime, float, np.ndarray]:
         """Subtraction.
@@ -464,12 +1149,12 @@ class GPSTime:
 
         Parameters
         ----------
-        other : Union[int, float, GPSTime, datetime.datetime,
+        other : Union[int, float, GPSTime, GPSTimeDelta, datetime.datetime,
                       datetime.timedelta, np.ndarray]
             The other value to subtract from the `GPSTime`. `int` and `float`
             values are the number of seconds to subtract from the `GPSTime`.
-            `GPSTime` and `datetime.timedelta` have explicit unit definitions
-            that are used. If the value is a datetime.datetime, it is
+            `GPSTime`, `GPSTimeDelta`, and `datetime.timedelta` have explicit
+            unit definitions that are used. If the value is a datetime.datetime, it is
             converted to a GPSTime before subtracting.
 
         Returns
@@ -504,19 +1189,32 @@ class GPSTime:
         if isinstance(other, int) or isinstance(other, float):
             sec_to_sub, femto_to_sub = _tow2sec(float(other))
 
-            return GPSTime(
-                self.week_number,
-                self.seconds - sec_to_sub,
-                self.femtoseconds - femto_to_sub,
+            return GPSTime._from_normalized(
+                *_normalize(
+                    self.week_number,
+                    self.seconds - sec_to_sub,
+                    self.femtoseconds - femto_to_sub,
+                )
+            )
+
+        elif isinstance(other, GPSTimeDelta):
+            return GPSTime._from_normalized(
+                *_normalize(
+                    self.week_number,
+                    self.seconds - other.seconds,
+                    self.femtoseconds - other.femtoseconds,
+                )
             )
 
         elif isinstance(other, datetime.timedelta):
             sec_to_sub, femto_to_sub = _tow2sec(float(other.total_seconds()))
 
-            return GPSTime(
-                self.week_number,
-                self.seconds - sec_to_sub,
-                self.femtoseconds - femto_to_sub,
+            return GPSTime._from_normalized(
+                *_normalize(
+                    self.week_number,
+                    self.seconds - sec_to_sub,
+                    self.femtoseconds - femto_to_sub,
+                )
             )
 
         elif isinstance(other, datetime.datetime):
@@ -539,7 +1237,9 @@ class GPSTime:
                 weeks_diff * _SEC_IN_WEEK + sec_diff + femto_diff * _FEMTO_SEC_TO_SEC
             )
 
-        elif isinstance(other, np.ndarray):
+        elif _is_ndarray(other):
+            import numpy as np
+
             if other.dtype == object:
                 _type = np.reshape(other, sum([i for i in other.shape]))[0].__class__
 
@@ -556,6 +1256,10 @@ class GPSTime:
                 input = np.array([self])
                 return np.array(input - other, dtype=object)
 
+        elif _is_gpstime_array(other):
+            # GPSTimeArray.__rsub__ gives the seconds to each of its times
+            return NotImplemented
+
         else:
             raise TypeError(
                 "unsupported operand type(s) for -: '{}' and '{}'".format(
@@ -563,6 +1267,79 @@ class GPSTime:
                 )
             )
 
+    def delta(self, other: GPSTime) -> GPSTimeDelta:
+        """Get the exact duration since another time.
+
+        Unlike subtraction of `GPSTime` objects, which gives a float, this
+        does not round the result.
+
+        Parameters
+        ----------
+        other : GPSTime
+            The earlier time
+
+        Returns
+        -------
+        GPSTimeDelta
+            The duration from `other` to this time, negative if `other` is
+            later
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If other is not a `GPSTime`
+        """
+        if not isinstance(other, GPSTime):
+            raise TypeError("other must be a GPSTime")
+        return GPSTimeDelta(
+            (self.week_number - other.week_number) * _SEC_IN_WEEK
+            + self.seconds
+            - other.seconds,
+            self.femtoseconds - other.femtoseconds,
+        )
+
+    def _comparison_operand(
+        self, other: Union[GPSTime, datetime.datetime], operator: str
+    ) -> GPSTime:
+        """Get the `GPSTime` to compare against for a non-`GPSTime` operand.
+
+        The comparison operators compare the (week number, seconds,
+        femtoseconds) tuples of the times, which is exact because the times
+        are normalized.
+
+        Parameters
+        ----------
+        other : datetime.datetime
+            The object to compare, which will be converted to `GPSTime`
+        operator : str
+            The comparison operator, used in the error message
+
+        Returns
+        -------
+        GPSTime
+            The time to compare against, or `NotImplemented` if other is a
+            `GPSTimeArray`, so that Python uses its reflected operator
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If an invalid type
+
+        """
+        if isinstance(other, datetime.datetime):
+            return GPSTime.from_datetime(other)
+        if _is_gpstime_array(other):
+            return NotImplemented
+        raise TypeError(
+            "'{}' not supported between instances of '{}' and '{}'".format(
+                operator, type(self), type(other)
+            )
+        )
+
     def __lt__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Less Than.
 
@@ -586,17 +1363,15 @@ class GPSTime:
             If an invalid type
 
         """
-        if isinstance(other, datetime.datetime):
-            other_time = GPSTime.from_datetime(other)
-        elif isinstance(other, GPSTime):
-            other_time = other
-        else:
-            raise TypeError(
-                "'<' not supported between instances of '{}' and '{}'".format(
-                    type(self), type(other)
-                )
-            )
-        return (self - other_time) < 0
+        if not isinstance(other, GPSTime):
+            other = self._comparison_operand(other, "<")
+            if other is NotImplemented:
+                return NotImplemented
+        return (self.week_number, self.seconds, self.femtoseconds) < (
+            other.week_number,
+            other.seconds,
+            other.femtoseconds,
+        )
 
     def __gt__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Greater Than.
@@ -621,17 +1396,15 @@ class GPSTime:
             If an invalid type
 
         """
-        if isinstance(other, datetime.datetime):
-            other_time = GPSTime.from_datetime(other)
-        elif isinstance(other, GPSTime):
-            other_time = other
-        else:
-            raise TypeError(
-                "'>' not supported between instances of '{}' and '{}'".format(
-                    type(self), type(other)
-                )
-            )
-        return (self - other_time) > 0
+        if not isinstance(other, GPSTime):
+            other = self._comparison_operand(other, ">")
+            if other is NotImplemented:
+                return NotImplemented
+        return (self.week_number, self.seconds, self.femtoseconds) > (
+            other.week_number,
+            other.seconds,
+            other.femtoseconds,
+        )
 
     def __eq__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Equality.
@@ -656,22 +1429,20 @@ class GPSTime:
             If an invalid type
 
         """
-        if isinstance(other, datetime.datetime):
-            other_time = GPSTime.from_datetime(other)
-        elif isinstance(other, GPSTime):
-            other_time = other
-        else:
-            raise TypeError(
-                "'>' not supported between instances of '{}' and '{}'".format(
-                    type(self), type(other)
-                )
-            )
-        return (self - other_time) == 0
+        if not isinstance(other, GPSTime):
+            other = self._comparison_operand(other, "==")
+            if other is NotImplemented:
+                return NotImplemented
+        return (self.week_number, self.seconds, self.femtoseconds) == (
+            other.week_number,
+            other.seconds,
+            other.femtoseconds,
+        )
 
     def __le__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Less Than or Equals.
 
-        Calls the `__lt__()` and `__eq__()` methods
+        Compares the (week number, seconds, femtoseconds) of both times.
 
         Parameters
         ----------
@@ -692,12 +1463,20 @@ class GPSTime:
             If an invalid type
 
         """
-        return self.__lt__(other) or self.__eq__(other)
+        if not isinstance(other, GPSTime):
+            other = self._comparison_operand(other, "<=")
+            if other is NotImplemented:
+                return NotImplemented
+        return (self.week_number, self.seconds, self.femtoseconds) <= (
+            other.week_number,
+            other.seconds,
+            other.femtoseconds,
+        )
 
     def __ge__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Greater Than or Equals.
 
-        Calls the `__gt__()` and `__eq__()` methods
+        Compares the (week number, seconds, femtoseconds) of both times.
 
         Parameters
         ----------
@@ -718,7 +1497,15 @@ class GPSTime:
             If an invalid type
 
         """
-        return self.__gt__(other) or self.__eq__(other)
+        if not isinstance(other, GPSTime):
+            other = self._comparison_operand(other, ">=")
+            if other is NotImplemented:
+                return NotImplemented
+        return (self.week_number, self.seconds, self.femtoseconds) >= (
+            other.week_number,
+            other.seconds,
+            other.femtoseconds,
+        )
 
     def __ne__(self, other: Union[GPSTime, datetime.datetime]) -> bool:
         """Comparison: Not Equals.
@@ -743,11 +1530,12 @@ class GPSTime:
             If an invalid type
 
         """
-        return not (self.__eq__(other))
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
     def __hash__(self):
         """Make GPSTime hashable."""
-        return hash(str(self.week_number) + str(self.seconds) + str(self.femtoseconds))
+        return hash((self.week_number, self.seconds, self.femtoseconds))
 
     def __repr__(self) -> str:
         """Representation of the object.
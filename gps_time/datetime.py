@@ -1,21 +1,39 @@
 
-__all__ = ['ISO_FMT', 'cast_to_datetime', 'datetime_to_iso', 'array_time_difference', 'correct_week', 'arange_datetime',
+from __future__ import annotations
+__all__ = ['ISO_FMT', 'cast_to_datetime', 'datetime_to_iso', 'array_time_difference', 'correct_week', 'correct_week_array', 'arange_datetime',
+           'arange_datetime_chunks',
            'diff_seconds', 'subtract_timedelta', 'datetime2tow', 'subtract_timedelta_as_tow', 'tow2datetime',
-           'tow2zcount', 'zcount2tow', 'datetime2zcount', 'zcount2datetime']
+           'tow2zcount', 'zcount2tow', 'datetime2zcount', 'zcount2datetime', 'datetime2tow_array',
+           'tow2datetime_array', 'tow2zcount_array', 'zcount2tow_array', 'datetime2zcount_array',
+           'zcount2datetime_array', 'gps_seconds2zcount_array', 'zcount2gps_seconds_array',
+           'parse_iso_array']
 
 
 """Copyright 2020 The Aerospace Corporation"""
 
 
 import re, datetime
-import numpy as np
 
-from typing import Iterable, List, Tuple, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 _gps_epoch_datetime: datetime.datetime = datetime.datetime(year=1980, month=1, day=6, tzinfo=datetime.timezone.utc)
 
 
+def _gps_epoch_datetime64() -> np.datetime64:
+    """The GPS epoch as a `numpy.datetime64[us]`.
+
+    This is a function, rather than a constant, so that numpy is only
+    imported when one of the array functions is used.
+    """
+    import numpy as np
+
+    return np.datetime64("1980-01-06T00:00:00", "us")
+
+
 ISO_FMT = r"([0-9]{4})-?([0-9]{2})-?([0-9]{2})[T| ]?([0-9]{2}):?([0-9]{2}):?([0-9]{2})\.?([0-9]{6})?"  # noqa: E501
 
 
@@ -99,6 +117,13 @@ def array_time_difference(
     \(T_{1} - T_{2}\) in seconds. If a single DateTime object is given for
     one of the arguments, it is converted to a single element numpy array.
 
+    If either argument is a `numpy.datetime64` array, or a `GPSTimeArray`,
+    the difference is computed with integer NumPy operations rather than
+    element by element. For datetime64 arrays with microsecond units the
+    result is identical to that for the same times as datetime objects.
+    A datetime given with a datetime64 array is converted to UTC, as
+    datetime64 values are taken to be UTC. NaT values give NaN.
+
     Parameters
     ----------
     datetime_array1 : np.ndarray
@@ -120,6 +145,16 @@ def array_time_difference(
     TypeError
         If the inputs are not arrays of datetimes
     """
+    import numpy as np
+    from .arrays import GPSTimeArray
+
+    if isinstance(datetime_array1, GPSTimeArray):
+        return datetime_array1 - datetime_array2
+    if isinstance(datetime_array2, GPSTimeArray):
+        return -(datetime_array2 - datetime_array1)
+    if _is_datetime64(datetime_array1) or _is_datetime64(datetime_array2):
+        return _datetime64_difference(datetime_array1, datetime_array2)
+
     if isinstance(datetime_array1, datetime.datetime):
         datetime_array1 = np.array([datetime_array1])
     if isinstance(datetime_array2, datetime.datetime):
@@ -209,8 +244,11 @@ def correct_week(week_num: int, tow: float, year: int) -> int:
 
 
 def arange_datetime(
-    start_datetime: datetime.datetime, duration_s: float, step_ms: float
-) -> List[datetime.datetime]:
+    start_datetime: datetime.datetime,
+    duration_s: float,
+    step_ms: float,
+    output: str = "list",
+) -> Union[List[datetime.datetime], np.ndarray]:
     """Create a list of datetimes in sequence.
 
     The purpose of this function is to create a list that represents a
@@ -228,10 +266,13 @@ def arange_datetime(
         The duration of the sequence, in seconds
     step_ms : float
         The step size, in milliseconds
+    output : str, optional
+        The form of the sequence. "list" builds a list of datetimes and
+        "datetime64" returns a `numpy.datetime64[us]` array, by default "list"
 
     Returns
     -------
-    List[datetime.datetime]
+    Union[List[datetime.datetime], np.ndarray]
         The sequence of datetime
 
     Notes
@@ -240,17 +281,37 @@ def arange_datetime(
     the start is at 0 with a duration of 5 and step of 1, the sequence would
     return [0, 1, 2, 3, 4]
 
+    The "datetime64" output holds the same instants as the "list" output.
+    Like all datetime64 values they carry no time zone, so a time zone aware
+    start is converted to UTC.
+
     See Also
     --------
     `numpy.arange()`
     `arange_gpstime()`
+    `arange_datetime_chunks()`
 
-    Todo
-    ----
-    .. todo:: Determine if this still works if a np.ndarray is returned
-        instead of a list
+    """
 
     """
+    Raises
+    ------
+    ValueError
+        If the output is not recognized, or if the step is not positive for
+        the "datetime64" output
+    """
+    if output == "datetime64":
+        import numpy as np
+
+        start, step_us, length = _arange_datetime64_args(
+            start_datetime, duration_s, step_ms
+        )
+        return start + np.arange(length, dtype=np.int64).astype(
+            "timedelta64[us]"
+        ) * step_us
+    elif output != "list":
+        raise ValueError("output must be 'list' or 'datetime64'")
+
     times = []
     dt = datetime.timedelta(milliseconds=step_ms)
     duration = datetime.timedelta(seconds=duration_s)
@@ -264,6 +325,113 @@ def arange_datetime(
     return times
 
 
+def _arange_datetime64_args(
+    start_datetime: datetime.datetime, duration_s: float, step_ms: float
+) -> Tuple[np.datetime64, int, int]:
+    """Get the start, step, and length of a datetime64 sequence.
+
+    The step and duration are rounded to the microsecond exactly as
+    `datetime.timedelta` rounds them, so the sequence matches the one built by
+    the `arange_datetime()` loop.
+
+    Parameters
+    ----------
+    start_datetime : datetime.datetime
+        The datetime to start the sequence
+    duration_s : float
+        The duration of the sequence, in seconds
+    step_ms : float
+        The step size, in milliseconds
+
+    Returns
+    -------
+    Tuple[np.datetime64, int, int]
+        The start as a UTC `numpy.datetime64[us]`, the step in microseconds,
+        and the number of elements in the sequence
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the step is not positive
+    """
+    import numpy as np
+
+    one_us = datetime.timedelta(microseconds=1)
+    step_us = datetime.timedelta(milliseconds=step_ms) // one_us
+    duration_us = datetime.timedelta(seconds=duration_s) // one_us
+    if step_us <= 0:
+        raise ValueError("step_ms must be at least one microsecond")
+
+    if isinstance(start_datetime, datetime.datetime) and (
+        start_datetime.tzinfo is not None
+    ):
+        start_datetime = start_datetime.astimezone(datetime.timezone.utc).replace(
+            tzinfo=None
+        )
+    start = np.datetime64(start_datetime, "us")
+    length = max(0, -(-duration_us // step_us))
+    return start, step_us, length
+
+
+def arange_datetime_chunks(
+    start_datetime: datetime.datetime,
+    duration_s: float,
+    step_ms: float,
+    chunk_size: int = 1000000,
+) -> Iterator[np.ndarray]:
+    """Generate a sequence of datetimes in chunks.
+
+    This yields the "datetime64" output of `arange_datetime()` in consecutive
+    pieces of at most `chunk_size` elements, so that very long sequences can
+    be streamed without holding them in memory.
+
+    Parameters
+    ----------
+    start_datetime : datetime.datetime
+        The datetime to start the sequence
+    duration_s : float
+        The duration of the sequence, in seconds
+    step_ms : float
+        The step size, in milliseconds
+    chunk_size : int, optional
+        The maximum number of elements in each chunk, by default 1000000
+
+    Returns
+    -------
+    Iterator[np.ndarray]
+        `numpy.datetime64[us]` arrays that together form the sequence
+
+    See Also
+    --------
+    `arange_datetime()`
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the step is not positive or the chunk size is less than one
+    """
+    import numpy as np
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least one")
+    start, step_us, length = _arange_datetime64_args(
+        start_datetime, duration_s, step_ms
+    )
+
+    def _chunks() -> Iterator[np.ndarray]:
+        for first in range(0, length, chunk_size):
+            indices = np.arange(first, min(first + chunk_size, length), dtype=np.int64)
+            yield start + indices.astype("timedelta64[us]") * step_us
+
+    return _chunks()
+
+
 def diff_seconds(
     dt_obj: datetime.datetime, dt_array: Iterable[datetime.datetime]
 ) -> np.ndarray:
@@ -287,6 +455,14 @@ def diff_seconds(
         dt_array
 
     """
+    import numpy as np
+    from .arrays import GPSTimeArray
+
+    if isinstance(dt_array, GPSTimeArray):
+        return -(dt_array - dt_obj)
+    if _is_datetime64(dt_array):
+        return _datetime64_difference(dt_obj, dt_array)
+
     return np.array([(dt_obj - dt).total_seconds() for dt in dt_array])
 
 
@@ -298,6 +474,12 @@ def subtract_timedelta(
     This function is used to subtract an array of time deltas in seconds from
     an array of datetimes.
 
+    For a `numpy.datetime64` array, the time deltas are rounded to whole
+    microseconds as `datetime.timedelta` does and subtracted with NumPy
+    operations, so the result is a datetime64 array holding the same times
+    as for datetime objects. A `timedelta64` array of time deltas is
+    subtracted as is. For a `GPSTimeArray`, the result is a `GPSTimeArray`.
+
     Parameters
     ----------
     datetime_array : np.ndarray
@@ -314,6 +496,17 @@ def subtract_timedelta(
     .. todo:: Add checks for inputs
 
     """
+    import numpy as np
+    from .arrays import GPSTimeArray
+
+    if isinstance(datetime_array, GPSTimeArray):
+        return datetime_array - np.asarray(time_delta)
+    if _is_datetime64(datetime_array):
+        time_delta = np.asarray(time_delta)
+        if time_delta.dtype.kind != "m":
+            time_delta = _seconds_to_us(time_delta).astype("timedelta64[us]")
+        return datetime_array - time_delta
+
     return datetime_array - np.array(
         [datetime.timedelta(seconds=s) for s in time_delta]
     )
@@ -373,7 +566,8 @@ def subtract_timedelta_as_tow(
     This function is used to subtract an array of time deltas in seconds from
     an array of datetimes. It does this by calling subtract_timedelta() to get
     an array of new datetimes then using datetime2tow() to cast the datetimes
-    in terms of week numbers and times of week.
+    in terms of week numbers and times of week. For `numpy.datetime64` arrays
+    and `GPSTimeArray`, both steps are done with NumPy operations.
 
     Parameters
     ----------
@@ -389,7 +583,14 @@ def subtract_timedelta_as_tow(
         datetime array with the time delta subtracted from them
 
     """
+    import numpy as np
+    from .arrays import GPSTimeArray
+
     d = subtract_timedelta(datetime_array, time_delta)
+    if isinstance(d, GPSTimeArray):
+        return np.column_stack((d.week_number, d.time_of_week))
+    if _is_datetime64(d):
+        return np.column_stack(datetime2tow_array(d))
     return np.array([datetime2tow(_d) for _d in d])
 
 
@@ -560,3 +761,781 @@ def zcount2datetime(
     date_time = tow2datetime(week_num, tow)
 
     return date_time
+
+
+_US_IN_SEC: int = 1000000
+_US_IN_WEEK: int = 7 * 86400 * _US_IN_SEC
+
+
+def _datetime64_offset(date_times: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Get the integer offset of datetime64 values from the GPS epoch.
+
+    Parameters
+    ----------
+    date_times : np.ndarray
+        An array of `numpy.datetime64` values
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        The int64 offsets from 6 Jan 1980 in the units of the array (or
+        seconds for units coarser than a second) and the number of those
+        units in one second
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not a datetime64 array
+    ValueError
+        If the input holds NaT
+    """
+    import numpy as np
+
+    date_times = np.asarray(date_times)
+    if date_times.dtype.kind != "M":
+        raise TypeError("date_times must be a numpy datetime64 array")
+    if np.isnat(date_times).any():
+        # NaT is the minimum int64, which would give an arbitrary time
+        raise ValueError("date_times must not hold NaT")
+
+    unit, _ = np.datetime_data(date_times.dtype)
+    if unit not in ("s", "ms", "us", "ns"):
+        unit = "ns" if unit in ("ps", "fs", "as") else "s"
+        date_times = date_times.astype("datetime64[{}]".format(unit))
+
+    units_per_second = int(np.timedelta64(1, "s") / np.timedelta64(1, unit))
+    offset = (date_times - _gps_epoch_datetime64().astype(date_times.dtype)).view(
+        np.int64
+    )
+    return offset, units_per_second
+
+
+def _is_datetime64(value: object) -> bool:
+    """Check if a value is a `numpy.datetime64` array or scalar."""
+    import numpy as np
+
+    return isinstance(value, (np.ndarray, np.datetime64)) and value.dtype.kind == "M"
+
+
+def _datetime64_difference(
+    date_times1: Union[np.ndarray, datetime.datetime],
+    date_times2: Union[np.ndarray, datetime.datetime],
+) -> np.ndarray:
+    """Get the seconds between datetime64 values.
+
+    The difference is taken in the integer units of the values and divided
+    by the number of those units in a second once, which for microseconds
+    rounds the same way as `datetime.timedelta.total_seconds()`.
+
+    Parameters
+    ----------
+    date_times1 : Union[np.ndarray, datetime.datetime]
+        The first datetime64 values, or a single datetime
+    date_times2 : Union[np.ndarray, datetime.datetime]
+        The second datetime64 values, or a single datetime
+
+    Returns
+    -------
+    np.ndarray
+        The float seconds from the second values to the first, or NaN where
+        either is NaT
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the inputs are not datetime64 values or datetimes
+    """
+    import numpy as np
+
+    values = []
+    for date_times in (date_times1, date_times2):
+        if isinstance(date_times, datetime.datetime):
+            if date_times.tzinfo is not None:
+                date_times = date_times.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            date_times = np.datetime64(date_times, "us")
+        if not _is_datetime64(date_times):
+            raise TypeError("Both arguments must be datetime64 arrays or datetimes")
+        values.append(date_times)
+
+    delta = np.asarray(values[0] - values[1])
+    unit, _ = np.datetime_data(delta.dtype)
+    if unit not in ("s", "ms", "us", "ns"):
+        unit = "ns" if unit in ("ps", "fs", "as") else "s"
+        delta = delta.astype("timedelta64[{}]".format(unit))
+
+    units_per_second = int(np.timedelta64(1, "s") / np.timedelta64(1, unit))
+    seconds = delta.view(np.int64) / units_per_second
+    return np.where(np.isnat(delta), np.nan, seconds)
+
+
+def _seconds_to_us(seconds: np.ndarray) -> np.ndarray:
+    """Convert float seconds to integer microseconds.
+
+    The rounding is identical to that of `datetime.timedelta(seconds=...)`,
+    i.e. the fractional second is rounded half to even.
+
+    Parameters
+    ----------
+    seconds : np.ndarray
+        The float seconds
+
+    Returns
+    -------
+    np.ndarray
+        The int64 microseconds
+
+    """
+    import numpy as np
+
+    fraction, whole = np.modf(np.asarray(seconds, dtype=np.float64))
+    return whole.astype(np.int64) * _US_IN_SEC + np.rint(
+        fraction * _US_IN_SEC
+    ).astype(np.int64)
+
+
+def datetime2tow_array(date_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert an array of datetimes to GPS Week and Time of Week.
+
+    This is the vectorized form of `datetime2tow()`. It operates on
+    `numpy.datetime64` arrays, which carry no time zone and are taken to be
+    UTC, and never creates `datetime.datetime` objects. For times that a
+    `datetime.datetime` can represent, the results are identical to those of
+    `datetime2tow()`.
+
+    Parameters
+    ----------
+    date_times : np.ndarray
+        An array of `numpy.datetime64` values, e.g. with units of `[ns]` or
+        `[us]`
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Two arrays: 1) The int64 GPS Week Numbers and 2) the float times of
+        week
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not a datetime64 array
+    ValueError
+        If the input holds NaT
+    """
+    import numpy as np
+
+    offset, units_per_second = _datetime64_offset(date_times)
+    units_per_week = 7 * 86400 * units_per_second
+
+    week_num = np.floor_divide(offset, units_per_week)
+    time_of_week = (offset - week_num * units_per_week) / units_per_second
+
+    return week_num, time_of_week
+
+
+def _year_start_us(year: np.ndarray) -> np.ndarray:
+    """Microseconds from the GPS epoch to 1 January of each year."""
+    import numpy as np
+
+    start = (year - 1970).astype("datetime64[Y]").astype("datetime64[us]")
+    return (start - _gps_epoch_datetime64()).astype(np.int64)
+
+
+def correct_week_array(
+    week_num: np.ndarray, tow: np.ndarray, year: np.ndarray, rollover: int = 1024
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Correct arrays of week numbers for week rollovers.
+
+    This is the vectorized form of `correct_week()`. Rather than adding
+    rollover periods one at a time, the number of periods needed to reach
+    the year is computed directly. A year is shorter than a rollover period,
+    so there is at most one full week for each row. Rows where the week
+    number and year are inconsistent are reported in a mask instead of
+    raising an error.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The truncated week numbers
+    tow : np.ndarray
+        The times of week
+    year : np.ndarray
+        The years
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 (the legacy
+        navigation message) or 8192 (CNAV), by default 1024
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The full GPS week numbers and a boolean mask that is True for rows
+        where the week number and year are inconsistent. The week numbers of
+        those rows are left uncorrected.
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the years are not integers
+    ValueError
+        If the rollover is not 1024 or 8192
+    """
+    import numpy as np
+
+    year = np.asarray(year)
+    if not np.issubdtype(year.dtype, np.integer):
+        raise ValueError("The year must be an int")
+    if rollover not in (1024, 8192):
+        raise ValueError("The rollover must be 1024 or 8192")
+
+    week_num, tow, year = np.broadcast_arrays(
+        np.asarray(week_num, dtype=np.int64), tow, year.astype(np.int64)
+    )
+    offset = week_num * _US_IN_WEEK + _seconds_to_us(tow)
+    period = rollover * _US_IN_WEEK
+
+    # The smallest non-negative number of periods that reaches the year
+    year_start = _year_start_us(year)
+    periods = np.maximum(-((offset - year_start) // period), 0)
+
+    bad = offset + periods * period >= _year_start_us(year + 1)
+    return np.where(bad, week_num, week_num + periods * rollover), bad
+
+
+def tow2datetime_array(
+    week_num: np.ndarray,
+    tow: np.ndarray,
+    year: Optional[np.ndarray] = None,
+    rollover: int = 1024,
+) -> np.ndarray:
+    """Convert arrays of GPS Week and Time of Week to datetime64.
+
+    This is the vectorized form of `tow2datetime()`. The time of week is
+    rounded to the microsecond exactly as `tow2datetime()` rounds it, so the
+    results are identical, but no `datetime.datetime` objects are created.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        GPS Week Numbers (not limited to 1024)
+    tow : np.ndarray
+        Times of Week (seconds since midnight Sunday Morning)
+    year : Optional[np.ndarray], optional
+        If not None, used to correct the week numbers from truncated weeks to
+        the actual week numbers with `correct_week_array()`, by default None
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 or 8192, by
+        default 1024. Only used if `year` is given.
+
+    Returns
+    -------
+    np.ndarray
+        A `numpy.datetime64[us]` array of UTC times. Like all datetime64
+        values, these carry no time zone. If `year` is given, rows where the
+        week number and year are inconsistent are NaT.
+
+    """
+    import numpy as np
+
+    bad = None
+    if year is not None:
+        week_num, bad = correct_week_array(week_num, tow, year, rollover)
+
+    week_num = np.asarray(week_num, dtype=np.int64)
+    offset = week_num * _US_IN_WEEK + _seconds_to_us(tow)
+    date_times = _gps_epoch_datetime64() + offset.astype("timedelta64[us]")
+    if bad is not None:
+        date_times = np.where(bad, np.datetime64("NaT", "us"), date_times)
+    return date_times
+
+
+_US_IN_ZCOUNT: int = 1500000
+
+
+def _correct_week_or_raise(
+    week_num: np.ndarray, tow: np.ndarray, year: Optional[np.ndarray], rollover: int
+) -> np.ndarray:
+    """Correct week numbers for rollovers, as `correct_week()` does.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The week numbers
+    tow : np.ndarray
+        The times of week
+    year : Optional[np.ndarray]
+        The years, or None to leave the week numbers as they are
+    rollover : int
+        The period of the truncated week numbers
+
+    Returns
+    -------
+    np.ndarray
+        The int64 week numbers
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If any week number is inconsistent with its year
+    """
+    import numpy as np
+
+    if year is None:
+        return np.asarray(week_num, dtype=np.int64)
+    week_num, bad = correct_week_array(week_num, tow, year, rollover)
+    if bad.any():
+        raise ValueError(
+            "Week number inconsistent with year for {} of {} rows".format(
+                np.count_nonzero(bad), bad.size
+            )
+        )
+    return week_num
+
+
+def tow2zcount_array(
+    week_num: np.ndarray,
+    tow: np.ndarray,
+    year: Optional[np.ndarray] = None,
+    rollover: int = 1024,
+    integer: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert arrays of week numbers and times of week to Z-counts.
+
+    This is the vectorized form of `tow2zcount()`, whose float Z-counts it
+    reproduces exactly. With `integer=True`, the Z-counts are instead the
+    int64 number of whole 1.5 second epochs since the start of the week,
+    computed from the time of week in integer microseconds (rounded as in
+    `tow2datetime_array()`) so that they are not subject to the rounding of
+    a float division.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The week numbers
+    tow : np.ndarray
+        The times of week (seconds)
+    year : Optional[np.ndarray], optional
+        If not None, used to correct the week numbers for rollovers with
+        `correct_week_array()`, by default None
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 or 8192, by
+        default 1024. Only used if `year` is given.
+    integer : bool, optional
+        If True, return int64 Z-counts of whole epochs, by default False
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The int64 week numbers and the Z-counts
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If `year` is given and any week number is inconsistent with it
+    """
+    import numpy as np
+
+    week_num = _correct_week_or_raise(week_num, tow, year, rollover)
+    if integer:
+        zcount = np.floor_divide(_seconds_to_us(tow), _US_IN_ZCOUNT)
+    else:
+        zcount = np.asarray(tow, dtype=np.float64) / 1.5
+    return np.broadcast_arrays(week_num, zcount)
+
+
+def zcount2tow_array(
+    week_num: np.ndarray,
+    zcount: np.ndarray,
+    year: Optional[np.ndarray] = None,
+    rollover: int = 1024,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert arrays of week numbers and Z-counts to times of week.
+
+    This is the vectorized form of `zcount2tow()`. Integer and float
+    Z-counts are both accepted; the times of week of integer Z-counts are
+    exact.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The week numbers
+    zcount : np.ndarray
+        The Z-counts (1.5 sec epochs)
+    year : Optional[np.ndarray], optional
+        If not None, used to correct the week numbers for rollovers with
+        `correct_week_array()`, by default None
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 or 8192, by
+        default 1024. Only used if `year` is given.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The int64 week numbers and the float times of week
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If `year` is given and any week number is inconsistent with it
+    """
+    import numpy as np
+
+    tow = np.asarray(zcount, dtype=np.float64) * 1.5
+    week_num = _correct_week_or_raise(week_num, tow, year, rollover)
+    return np.broadcast_arrays(week_num, tow)
+
+
+def datetime2zcount_array(
+    date_times: np.ndarray, integer: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert an array of datetimes to week numbers and Z-counts.
+
+    This is the vectorized form of `datetime2zcount()`. Like
+    `datetime2tow_array()`, it operates on `numpy.datetime64` arrays, which
+    are taken to be UTC. With `integer=True`, the Z-counts are the int64
+    number of whole 1.5 second epochs since the start of the week, computed
+    in the integer units of the array.
+
+    Parameters
+    ----------
+    date_times : np.ndarray
+        An array of `numpy.datetime64` values
+    integer : bool, optional
+        If True, return int64 Z-counts of whole epochs, by default False
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The int64 week numbers and the Z-counts
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not a datetime64 array
+    ValueError
+        If the input holds NaT
+    """
+    import numpy as np
+
+    if not integer:
+        week_num, tow = datetime2tow_array(date_times)
+        return week_num, tow / 1.5
+
+    offset, units_per_second = _datetime64_offset(date_times)
+    week_num, units = np.divmod(offset, 7 * 86400 * units_per_second)
+    # 1.5 seconds is not a whole number of units when they are seconds
+    return week_num, (2 * units) // (3 * units_per_second)
+
+
+def zcount2datetime_array(
+    week_num: np.ndarray,
+    zcount: np.ndarray,
+    year: Optional[np.ndarray] = None,
+    rollover: int = 1024,
+) -> np.ndarray:
+    """Convert arrays of week numbers and Z-counts to datetime64.
+
+    This is the vectorized form of `zcount2datetime()`, and gives the same
+    times without creating `datetime.datetime` objects.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The week numbers
+    zcount : np.ndarray
+        The Z-counts (1.5 sec epochs)
+    year : Optional[np.ndarray], optional
+        If not None, used to correct the week numbers for rollovers with
+        `correct_week_array()`, by default None
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 or 8192, by
+        default 1024. Only used if `year` is given.
+
+    Returns
+    -------
+    np.ndarray
+        A `numpy.datetime64[us]` array of UTC times. If `year` is given, rows
+        where the week number and year are inconsistent are NaT.
+
+    """
+    import numpy as np
+
+    zcount = np.asarray(zcount)
+    if np.issubdtype(zcount.dtype, np.integer):
+        week_num, bad = np.asarray(week_num, dtype=np.int64), None
+        if year is not None:
+            week_num, bad = correct_week_array(week_num, zcount * 1.5, year, rollover)
+        offset = week_num * _US_IN_WEEK + zcount.astype(np.int64) * _US_IN_ZCOUNT
+        date_times = _gps_epoch_datetime64() + offset.astype("timedelta64[us]")
+        if bad is not None:
+            date_times = np.where(bad, np.datetime64("NaT", "us"), date_times)
+        return date_times
+
+    return tow2datetime_array(week_num, zcount * 1.5, year, rollover)
+
+
+def gps_seconds2zcount_array(
+    gps_seconds: np.ndarray, integer: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert seconds since the GPS epoch to week numbers and Z-counts.
+
+    Integer seconds are split into weeks exactly. With `integer=True`, the
+    Z-counts are the int64 number of whole 1.5 second epochs since the start
+    of the week.
+
+    Parameters
+    ----------
+    gps_seconds : np.ndarray
+        The seconds since 6 Jan 1980, as integers or floats
+    integer : bool, optional
+        If True, return int64 Z-counts of whole epochs, by default False
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The int64 week numbers and the Z-counts
+
+    """
+    import numpy as np
+
+    gps_seconds = np.asarray(gps_seconds)
+    week_num, tow = np.divmod(gps_seconds, 604800)
+    week_num = week_num.astype(np.int64)
+    if not integer:
+        return week_num, tow / 1.5
+    if np.issubdtype(gps_seconds.dtype, np.integer):
+        return week_num, (2 * tow.astype(np.int64)) // 3
+    return week_num, np.floor_divide(_seconds_to_us(tow), _US_IN_ZCOUNT)
+
+
+def zcount2gps_seconds_array(
+    week_num: np.ndarray,
+    zcount: np.ndarray,
+    year: Optional[np.ndarray] = None,
+    rollover: int = 1024,
+) -> np.ndarray:
+    """Convert week numbers and Z-counts to seconds since the GPS epoch.
+
+    Parameters
+    ----------
+    week_num : np.ndarray
+        The week numbers
+    zcount : np.ndarray
+        The Z-counts (1.5 sec epochs)
+    year : Optional[np.ndarray], optional
+        If not None, used to correct the week numbers for rollovers with
+        `correct_week_array()`, by default None
+    rollover : int, optional
+        The period of the truncated week numbers, either 1024 or 8192, by
+        default 1024. Only used if `year` is given.
+
+    Returns
+    -------
+    np.ndarray
+        The float seconds since 6 Jan 1980, which are exact for integer
+        Z-counts
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If `year` is given and any week number is inconsistent with it
+    """
+    week_num, tow = zcount2tow_array(week_num, zcount, year, rollover)
+    return week_num * 604800.0 + tow
+
+
+# Positions of the digits and separators in YYYY-MM-DDTHH:MM:SS.SSSSSS
+_ISO_DIGITS = {
+    "year": [0, 1, 2, 3],
+    "month": [5, 6],
+    "day": [8, 9],
+    "hour": [11, 12],
+    "minute": [14, 15],
+    "second": [17, 18],
+}
+_ISO_SEPARATORS = {4: "-", 7: "-", 10: "T| ", 13: ":", 16: ":"}
+
+
+def _iso_fields_fixed_width(
+    codes: np.ndarray,
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Parse ISO strings laid out in the canonical fixed-width positions.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        A 2-D uint32 array of the unicode code points of the strings, with at
+        least 26 columns
+
+    Returns
+    -------
+    Tuple[np.ndarray, List[np.ndarray]]
+        A mask of the rows in canonical layout and the int64 year, month,
+        day, hour, minute, second, and microsecond fields (only valid where
+        the mask is set)
+
+    """
+    import numpy as np
+
+    digits = codes[:, :26] - ord("0")
+    is_digit = digits < 10
+
+    canonical = np.ones(len(codes), dtype=bool)
+    for position, characters in _ISO_SEPARATORS.items():
+        matches = np.zeros(len(codes), dtype=bool)
+        for character in characters:
+            matches |= codes[:, position] == ord(character)
+        canonical &= matches
+
+    def _number(positions: List[int]) -> np.ndarray:
+        value = np.zeros(len(codes), dtype=np.int64)
+        for position in positions:
+            value = value * 10 + digits[:, position]
+        return value
+
+    fields = []
+    for positions in _ISO_DIGITS.values():
+        canonical &= is_digit[:, positions].all(axis=1)
+        fields.append(_number(positions))
+
+    # As with ISO_FMT, the microseconds and their leading "." are optional
+    # and anything that follows a match is ignored
+    undotted = is_digit[:, 19:25].all(axis=1)
+    dotted = (codes[:, 19] == ord(".")) & is_digit[:, 20:26].all(axis=1)
+    fields.append(
+        np.where(
+            undotted,
+            _number(list(range(19, 25))),
+            np.where(dotted, _number(list(range(20, 26))), 0),
+        )
+    )
+    return canonical, fields
+
+
+def parse_iso_array(
+    iso_strings: Iterable[str], output: str = "datetime64"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Cast a sequence of ISO strings to datetimes in bulk.
+
+    This is the vectorized form of `cast_to_datetime()` and accepts the same
+    strings, i.e. those matching `ISO_FMT`. Strings in the canonical fixed
+    width layout, YYYY-MM-DDTHH:MM:SS or YYYY-MM-DDTHH:MM:SS.SSSSSS with
+    optional trailing characters, are parsed with array operations and the
+    remainder with the regular expression.
+
+    Rather than raising on the first malformed string, the indices of all of
+    the strings that could not be parsed are returned.
+
+    Parameters
+    ----------
+    iso_strings : Iterable[str]
+        A sequence or array of ISO strings
+    output : str, optional
+        The form of the result. "datetime64" returns a
+        `numpy.datetime64[us]` array and "gpstime" returns a `GPSTimeArray`,
+        by default "datetime64"
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Two arrays: 1) The times, in which the malformed rows are NaT for
+        "datetime64" or the GPS epoch for "gpstime" and 2) the int64 indices
+        of the malformed rows
+
+    See Also
+    --------
+    `cast_to_datetime()`
+    `ISO_FMT`
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the output is not recognized or the strings are not 1-D
+    """
+    import numpy as np
+
+    if output not in ("datetime64", "gpstime"):
+        raise ValueError("output must be 'datetime64' or 'gpstime'")
+
+    iso_strings = np.asarray(iso_strings)
+    if iso_strings.ndim != 1:
+        raise ValueError("iso_strings must be one dimensional")
+    if iso_strings.dtype.kind == "S":
+        iso_strings = np.char.decode(iso_strings, "ascii", "replace")
+    elif iso_strings.dtype.kind != "U":
+        iso_strings = np.array(
+            [s if isinstance(s, str) else "" for s in iso_strings], dtype=str
+        )
+    if iso_strings.dtype.itemsize < 26 * 4:
+        iso_strings = iso_strings.astype("U26")
+    codes = (
+        np.ascontiguousarray(iso_strings)
+        .view(np.uint32)
+        .reshape(len(iso_strings), iso_strings.dtype.itemsize // 4)
+    )
+
+    parsed, fields = _iso_fields_fixed_width(codes)
+    for i in np.flatnonzero(~parsed):
+        m = re.match(ISO_FMT, str(iso_strings[i]))
+        if m is not None:
+            for field, value in zip(fields, m.groups()):
+                field[i] = int(value) if value is not None else 0
+            parsed[i] = True
+
+    year, month, day, hour, minute, second, microsecond = fields
+    months = np.where(parsed, (year - 1970) * 12 + month - 1, 0)
+    month_start = months.astype("datetime64[M]").astype("datetime64[D]")
+    days_in_month = (
+        (months + 1).astype("datetime64[M]").astype("datetime64[D]") - month_start
+    ).astype(np.int64)
+    valid = (
+        parsed
+        & (year >= 1)
+        & (month >= 1) & (month <= 12)
+        & (day >= 1) & (day <= days_in_month)
+        & (hour < 24) & (minute < 60) & (second < 60)
+    )
+
+    offset = (
+        (day - 1) * 86400 + hour * 3600 + minute * 60 + second
+    ) * _US_IN_SEC + microsecond
+    date_times = month_start.astype("datetime64[us]") + offset.astype(
+        "timedelta64[us]"
+    )
+    date_times[~valid] = np.datetime64("NaT")
+    bad_indices = np.flatnonzero(~valid)
+
+    if output == "gpstime":
+        from .arrays import GPSTimeArray
+
+        date_times[~valid] = _gps_epoch_datetime64()
+        return GPSTimeArray.from_datetime64(date_times), bad_indices
+    return date_times, bad_indices
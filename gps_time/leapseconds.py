@@ -1,21 +1,223 @@
 
-__all__ = ['logger', 'LeapSeconds', 'gps2utc', 'utc2gps']
+from __future__ import annotations
+__all__ = ['logger', 'LeapSeconds', 'gps2utc', 'utc2gps', 'gps2utc_array', 'utc2gps_array']
 
 
 """Copyright 2020 The Aerospace Corporation"""
 
 
+import os
+import re
+import bisect
+import struct
 import datetime
 
-from typing import List, Union, Optional, Tuple
+from typing import TYPE_CHECKING, List, Union, Optional, Tuple
 from logging import getLogger
 
-from .core import GPSTime
+from .cache import _memoize, clear_cache
+from .core import GPSTime, _SEC_IN_WEEK
+from .datetime import _datetime64_offset, _gps_epoch_datetime, _gps_epoch_datetime64
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 logger = getLogger(__name__)
 
 
+_BUNDLED_LEAP_SECONDS: List[Tuple[int, int]] = [
+    (46828800, 1),  # 1 Jul 1981
+    (78364800, 2),  # 1 Jul 1982
+    (109900800, 3),  # 1 Jul 1983
+    (173059200, 4),  # 1 Jul 1985
+    (252028800, 5),  # 1 Jan 1988
+    (315187200, 6),  # 1 Jan 1990
+    (346723200, 7),  # 1 Jan 1991
+    (393984000, 8),  # 1 Jul 1992
+    (425520000, 9),  # 1 Jul 1993
+    (457056000, 10),  # 1 Jul 1994
+    (504489600, 11),  # 1 Jan 1996
+    (551750400, 12),  # 1 Jul 1997
+    (599184000, 13),  # 1 Jan 1999
+    (820108800, 14),  # 1 Jan 2006
+    (914803200, 15),  # 1 Jan 2009
+    (1025136000, 16),  # 1 Jul 2012
+    (1119744000, 17),  # 1 Jul 2015
+    (1167264000, 18),  # 1 Jan 2017
+]
+"""Whole GPS seconds since 6 Jan 1980 of the midnight at which each leap second takes effect, and the number of leap seconds from then on."""
+
+_BUNDLED_EXPIRATION_KEY: int = 1451260799
+"""Whole GPS seconds since 6 Jan 1980 of 31 Dec 2025 23:59:59."""
+
+_NTP_GPS_EPOCH: int = 2524953600
+"""Seconds from the NTP epoch, 1 Jan 1900, to the GPS epoch."""
+
+_MJD_GPS_EPOCH: int = 44244
+"""Modified Julian Date of the GPS epoch."""
+
+_TAI_MINUS_GPS: int = 19
+"""TAI - GPS in seconds, used to convert TAI - UTC to the number of leap seconds."""
+
+_CACHE_HEADER = struct.Struct("<8sqqqq")
+"""Magic, file modification time (ns), file size, expiration, and entry count."""
+
+_CACHE_MAGIC: bytes = b"GPSLEAP1"
+
+
+def _parse_leap_second_file(text: str) -> Tuple[List[Tuple[int, int]], int]:
+    """Parse a `leap-seconds.list` or `Leap_Second.dat` file.
+
+    In `leap-seconds.list`, each entry is the NTP time at which TAI - UTC
+    changes and the new TAI - UTC, and the `#@` line holds the NTP time at
+    which the file expires. In `Leap_Second.dat`, each entry is the Modified
+    Julian Date, day, month, and year at which TAI - UTC changes and the new
+    TAI - UTC, and a comment states the date on which the file expires.
+    Entries before the GPS epoch are skipped.
+
+    Parameters
+    ----------
+    text : str
+        The contents of the file
+
+    Returns
+    -------
+    Tuple[List[Tuple[int, int]], int]
+        The whole GPS seconds since 6 Jan 1980 at which each leap second
+        takes effect and the number of leap seconds from then on, and the
+        whole GPS seconds at which the table expires
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the file contains no leap seconds, an unrecognized line, entries
+        out of order, or no expiration date
+    """
+    table = []
+    expiration_key = None
+    for line in text.splitlines():
+        if line.startswith("#@"):
+            expiration_key = int(line[2:].split()[0]) - _NTP_GPS_EPOCH
+            continue
+        match = re.search(r"File expires on\s+(\d+\s+\w+\s+\d{4})", line)
+        if match:
+            expires = datetime.datetime.strptime(match.group(1), "%d %B %Y").replace(
+                tzinfo=datetime.timezone.utc
+            )
+            expiration_key = (expires - _gps_epoch_datetime) // datetime.timedelta(seconds=1)
+            continue
+
+        fields = line.split("#")[0].split()
+        try:
+            if len(fields) == 2:
+                key = int(fields[0]) - _NTP_GPS_EPOCH
+            elif len(fields) == 5:
+                key = (int(float(fields[0])) - _MJD_GPS_EPOCH) * 86400
+            elif not fields:
+                continue
+            else:
+                raise ValueError
+            count = int(fields[-1]) - _TAI_MINUS_GPS
+        except ValueError:
+            raise ValueError("Unrecognized leap second entry: {!r}".format(line))
+
+        if count > 0:
+            if table and (key <= table[-1][0] or count <= table[-1][1]):
+                raise ValueError("Leap second entries are not in order")
+            table.append((key, count))
+
+    if not table:
+        raise ValueError("No leap seconds found")
+    if expiration_key is None:
+        raise ValueError("No expiration date found")
+    return table, expiration_key
+
+
+def _default_cache_dir() -> str:
+    """The default directory of the cached leap second tables."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "gps_time")
+
+
+def _read_leap_second_file(
+    path: str, cache_dir: Optional[str] = None
+) -> Tuple[List[Tuple[int, int]], int]:
+    """Read a leap second file, using the cached table if it is current.
+
+    Parameters
+    ----------
+    path : str
+        The path of the `leap-seconds.list` or `Leap_Second.dat` file
+    cache_dir : Optional[str], optional
+        The directory of the cached tables, by default `_default_cache_dir()`
+
+    Returns
+    -------
+    Tuple[List[Tuple[int, int]], int]
+        The leap second table and expiration, as for
+        `_parse_leap_second_file()`
+
+    """
+
+    """
+    Raises
+    ------
+    OSError
+        If the file cannot be read
+    ValueError
+        If the file is not a valid leap second file
+    """
+    import hashlib
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    cache_path = os.path.join(
+        cache_dir or _default_cache_dir(),
+        "leapseconds-{}.bin".format(hashlib.sha1(path.encode()).hexdigest()[:16]),
+    )
+
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        magic, mtime_ns, size, expiration_key, count = _CACHE_HEADER.unpack_from(data)
+        if (magic, mtime_ns, size) == (_CACHE_MAGIC, stat.st_mtime_ns, stat.st_size):
+            values = struct.unpack_from("<{}q".format(2 * count), data, _CACHE_HEADER.size)
+            return list(zip(values[:count], values[count:])), expiration_key
+    except (OSError, struct.error):
+        pass
+
+    with open(path) as f:
+        table, expiration_key = _parse_leap_second_file(f.read())
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temporary_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        with open(temporary_path, "wb") as f:
+            f.write(
+                _CACHE_HEADER.pack(
+                    _CACHE_MAGIC, stat.st_mtime_ns, stat.st_size, expiration_key, len(table)
+                )
+            )
+            f.write(
+                struct.pack(
+                    "<{}q".format(2 * len(table)),
+                    *[key for key, _ in table],
+                    *[count for _, count in table],
+                )
+            )
+        os.replace(temporary_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not cache the leap second table: {}".format(e))
+
+    return table, expiration_key
+
+
 class LeapSeconds:
     """Determine the number of leap seconds.
 
@@ -23,31 +225,147 @@ class LeapSeconds:
     information. It has two methods: one to get the number of leap seconds at
     a given time and one to get the next leap second.
 
+    The table bundled with `gps_time` can be replaced with a newer one by
+    loading a `leap-seconds.list` or `Leap_Second.dat` file with `load()`.
+    If the `GPS_TIME_LEAP_SECONDS` environment variable holds the path of
+    such a file, it is loaded when `gps_time.leapseconds` is imported.
+
 
     """
 
-    _leap_seconds: List[List[Union[GPSTime, int]]] = [
-        [GPSTime.from_datetime(time=datetime.datetime(year=1981, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 1],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1982, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 2],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1983, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 3],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1985, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 4],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1987, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 5],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1989, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 6],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1990, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 7],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1992, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 8],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1993, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 9],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1994, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 10],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1995, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 11],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1997, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 12],
-        [GPSTime.from_datetime(time=datetime.datetime(year=1998, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 13],
-        [GPSTime.from_datetime(time=datetime.datetime(year=2005, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 14],
-        [GPSTime.from_datetime(time=datetime.datetime(year=2008, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 15],
-        [GPSTime.from_datetime(time=datetime.datetime(year=2012, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 16],
-        [GPSTime.from_datetime(time=datetime.datetime(year=2015, month=6, day=30, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 17],
-        [GPSTime.from_datetime(time=datetime.datetime(year=2016, month=12, day=31, hour=23, minute=59, second=59, tzinfo=datetime.timezone.utc)) + 1, 18],
-    ]
+    _leap_seconds: List[List[Union[GPSTime, int]]] = []
     """Table of Leap Seconds, note that the leap second occues at midnight, but before the next day."""
 
+    _leap_second_keys: List[int] = []
+    """Whole GPS seconds since 6 Jan 1980 of each entry in `_leap_seconds`, in order."""
+
+    _leap_second_counts: List[int] = [0]
+    """Leap seconds in effect before the first entry and after each entry of `_leap_seconds`."""
+
+    _expiration_key: int = 0
+    """Whole GPS seconds since 6 Jan 1980 after which the table may be out of date."""
+
+    _expiration_message: str = ""
+    """The warning logged for times after `_expiration_key`."""
+
+    @classmethod
+    def _build_index(cls) -> None:
+        """Precompute the integer lookup table from `_leap_seconds`.
+
+        The lookups compare whole GPS seconds against this table using a
+        binary search. This must be called whenever `_leap_seconds` changes.
+
+        Returns
+        -------
+        None
+
+        """
+        cls._leap_second_keys = [
+            _ls[0].week_number * _SEC_IN_WEEK + _ls[0].seconds
+            for _ls in cls._leap_seconds
+        ]
+        cls._leap_second_counts = [0] + [_ls[1] for _ls in cls._leap_seconds]
+        clear_cache("gps2utc")
+
+    @classmethod
+    def _set_table(cls, table: List[Tuple[int, int]], expiration_key: int) -> None:
+        """Replace the leap second table.
+
+        Parameters
+        ----------
+        table : List[Tuple[int, int]]
+            The whole GPS seconds since 6 Jan 1980 at which each leap second
+            takes effect and the number of leap seconds from then on, in order
+        expiration_key : int
+            The whole GPS seconds since 6 Jan 1980 after which the table may
+            be out of date
+
+        Returns
+        -------
+        None
+
+        """
+        cls._leap_seconds = [
+            [GPSTime._from_normalized(key // _SEC_IN_WEEK, key % _SEC_IN_WEEK, 0), count]
+            for key, count in table
+        ]
+        cls._expiration_key = expiration_key
+        expiration = _gps_epoch_datetime + datetime.timedelta(seconds=expiration_key)
+        cls._expiration_message = (
+            "Leap seconds only current through {:%d %b %Y}. Any future leap "
+            "seconds not included. Update when available.".format(expiration)
+        )
+        cls._build_index()
+
+    @classmethod
+    def load(cls, path: str, cache_dir: Optional[str] = None) -> None:
+        """Load the leap second table from a file.
+
+        The file may be either the `leap-seconds.list` distributed by IERS
+        and NIST, or the IERS `Leap_Second.dat`. The expiration date stated
+        in the file replaces that of the bundled table.
+
+        Parsing the file once stores a compact binary copy of the table in
+        the cache directory. Later loads of the same path use this copy as
+        long as the modification time and size of the file are unchanged. If
+        the cache cannot be written, the file is parsed on every load.
+
+        Parameters
+        ----------
+        path : str
+            The path of the `leap-seconds.list` or `Leap_Second.dat` file
+        cache_dir : Optional[str], optional
+            The directory of the cached tables, by default `gps_time` in
+            `$XDG_CACHE_HOME` or `~/.cache`
+
+        Returns
+        -------
+        None
+
+        """
+
+        """
+        Raises
+        ------
+        OSError
+            If the file cannot be read
+        ValueError
+            If the file is not a valid leap second file
+        """
+        cls._set_table(*_read_leap_second_file(path, cache_dir))
+
+    @classmethod
+    def reset(cls) -> None:
+        """Restore the leap second table bundled with `gps_time`.
+
+        Returns
+        -------
+        None
+
+        """
+        cls._set_table(_BUNDLED_LEAP_SECONDS, _BUNDLED_EXPIRATION_KEY)
+
+    @classmethod
+    def _check_expiration(cls, seconds: int, femtoseconds: int) -> None:
+        """Warn if a time is after the leap second table expires.
+
+        Parameters
+        ----------
+        seconds : int
+            The whole GPS seconds since 6 Jan 1980
+        femtoseconds : int
+            The femtoseconds
+
+        Returns
+        -------
+        None
+
+        """
+        if seconds > cls._expiration_key or (
+            seconds == cls._expiration_key and femtoseconds > 0
+        ):
+            logger.warning(cls._expiration_message)
+
     @classmethod
     def get_leap_seconds(cls, time: GPSTime) -> int:
         """Get the current number of leap seconds.
@@ -63,18 +381,46 @@ class LeapSeconds:
             The number of leap seconds at time
 
         """
-        if time > datetime.datetime(2025, 12, 31, 23, 59, 59):
-            logger.warning(
-                "Leap seconds only current through 31 Dec 2025. Any future "
-                "leap seconds not included. Update when available."
-            )
+        seconds = time.week_number * _SEC_IN_WEEK + time.seconds
+        cls._check_expiration(seconds, time.femtoseconds)
+
+        index = bisect.bisect_right(cls._leap_second_keys, seconds)
+        return cls._leap_second_counts[index]
+
+    @classmethod
+    def get_leap_seconds_array(
+        cls, gps_seconds: np.ndarray, units_per_second: int = 1
+    ) -> np.ndarray:
+        """Get the number of leap seconds for an array of times.
+
+        This is the vectorized form of `get_leap_seconds()`. It uses
+        `numpy.searchsorted()` against the precomputed table.
+
+        Parameters
+        ----------
+        gps_seconds : np.ndarray
+            The integer times since 6 Jan 1980 at which to find the number of
+            leap seconds
+        units_per_second : int, optional
+            The number of units of `gps_seconds` in a second, e.g. 1000000 if
+            the times are in microseconds, by default 1
+
+        Returns
+        -------
+        np.ndarray
+            The int64 number of leap seconds at each time
+
+        """
+        import numpy as np
+
+        gps_seconds = np.asarray(gps_seconds, dtype=np.int64)
+        expiration = cls._expiration_key * units_per_second
+        if np.any(gps_seconds > expiration):
+            logger.warning(cls._expiration_message)
 
-        if time < cls._leap_seconds[0][0]:
-            return 0
-        else:
-            for _ls in cls._leap_seconds[::-1]:
-                if time >= _ls[0]:
-                    return _ls[1]
+        keys = np.asarray(cls._leap_second_keys, dtype=np.int64) * units_per_second
+        counts = np.asarray(cls._leap_second_counts, dtype=np.int64)
+        return counts[np.searchsorted(keys, gps_seconds, side="right")]
 
     @classmethod
     def get_next_leap_second(cls, time: GPSTime) -> Optional[Tuple[GPSTime, int]]:
@@ -99,20 +445,34 @@ class LeapSeconds:
             the desired time is not known, than None is returned.
 
         """
-        if time > datetime.datetime(2025, 12, 31, 23, 59, 59):
+        seconds = time.week_number * _SEC_IN_WEEK + time.seconds
+        cls._check_expiration(seconds, time.femtoseconds)
+
+        index = bisect.bisect_right(cls._leap_second_keys, seconds)
+        if index == len(cls._leap_seconds):
+            return None
+        return cls._leap_seconds[index]
+
+
+def _load_from_environment() -> None:
+    """Load the leap second file named by `GPS_TIME_LEAP_SECONDS`, if any.
+
+    If the file cannot be loaded, a warning is logged and the bundled table
+    is kept.
+    """
+    path = os.environ.get("GPS_TIME_LEAP_SECONDS")
+    if path:
+        try:
+            LeapSeconds.load(path)
+        except (OSError, ValueError) as e:
             logger.warning(
-                "Leap seconds only current through 31 Dec 2025. Any future "
-                "leap seconds not included. Update when available."
+                "Could not load GPS_TIME_LEAP_SECONDS, using the bundled leap "
+                "seconds: {}".format(e)
             )
 
-        if time < cls._leap_seconds[0][0]:
-            return cls._leap_seconds[0]
-        elif time > cls._leap_seconds[-1][0]:
-            return None
-        else:
-            for _ls in cls._leap_seconds:
-                if time < _ls[0]:
-                    return _ls
+
+LeapSeconds.reset()
+_load_from_environment()
 
 
 def gps2utc(gps_time: Union[GPSTime, datetime.datetime]) -> datetime.datetime:
@@ -139,12 +499,52 @@ def gps2utc(gps_time: Union[GPSTime, datetime.datetime]) -> datetime.datetime:
 
     assert isinstance(gps_time, GPSTime), "gps_time must be a GPSTime or datetime"
 
+    cached = _gps2utc_memo.cached
+    if cached is not None:
+        return cached((gps_time.week_number, gps_time.seconds, gps_time.femtoseconds))
+    return _gps2utc(gps_time)
+
+
+def _gps2utc(gps_time: GPSTime) -> datetime.datetime:
+    """Convert GPS Time to UTC Time without the cache.
+
+    Parameters
+    ----------
+    gps_time : GPSTime
+        The current GPS Time
+
+    Returns
+    -------
+    datetime.datetime
+        The UTC Time
+
+    """
     leap_seconds = LeapSeconds.get_leap_seconds(gps_time)
     utc_time = gps_time - leap_seconds
 
     return utc_time.to_datetime()
 
 
+def _gps2utc_fields(fields: Tuple[int, int, int]) -> datetime.datetime:
+    """Convert the fields of a `GPSTime` to UTC, as `gps2utc()` does.
+
+    Parameters
+    ----------
+    fields : Tuple[int, int, int]
+        The week number, seconds, and femtoseconds of the GPS Time
+
+    Returns
+    -------
+    datetime.datetime
+        The UTC Time
+
+    """
+    return _gps2utc(GPSTime._from_normalized(*fields))
+
+
+_gps2utc_memo = _memoize("gps2utc", _gps2utc_fields)
+
+
 def utc2gps(utc_time: datetime.datetime) -> GPSTime:
     """Convert UTC Time to GPS Time
 
@@ -171,3 +571,110 @@ def utc2gps(utc_time: datetime.datetime) -> GPSTime:
     gps_time = GPSTime.from_datetime(utc_time) + leap_seconds
 
     return gps_time
+
+
+def _shift_leap_seconds(times: np.ndarray, sign: int) -> np.ndarray:
+    """Shift an array of times by the number of leap seconds at each time.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Integer seconds since 6 Jan 1980 or a `numpy.datetime64` array
+    sign : int
+        -1 to subtract the leap seconds, 1 to add them
+
+    Returns
+    -------
+    np.ndarray
+        The shifted times, with the same type as the input. Datetimes with
+        units coarser than a second are returned in seconds.
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not an integer or datetime64 array
+    ValueError
+        If a datetime64 input holds NaT
+    """
+    import numpy as np
+
+    times = np.asarray(times)
+    if times.dtype.kind == "M":
+        offset, units_per_second = _datetime64_offset(times)
+        leap_seconds = LeapSeconds.get_leap_seconds_array(offset, units_per_second)
+        shifted = offset + sign * leap_seconds * units_per_second
+        unit = {1: "s", 1000: "ms", 1000000: "us", 1000000000: "ns"}[units_per_second]
+        epoch = _gps_epoch_datetime64().astype("datetime64[{}]".format(unit))
+        return epoch + shifted.astype("timedelta64[{}]".format(unit))
+    elif times.dtype.kind in "iu":
+        times = times.astype(np.int64)
+        return times + sign * LeapSeconds.get_leap_seconds_array(times)
+    raise TypeError("times must be an integer or datetime64 array")
+
+
+def gps2utc_array(gps_times: np.ndarray) -> np.ndarray:
+    """Convert an array of GPS Times to UTC Times
+
+    This is the vectorized form of `gps2utc()`. It looks up the number of
+    leap seconds for every element with a single `numpy.searchsorted()`
+    call, including times exactly at a leap second boundary.
+
+    Parameters
+    ----------
+    gps_times : np.ndarray
+        Either an integer array of GPS seconds since 6 Jan 1980 or a
+        `numpy.datetime64` array of GPS times
+
+    Returns
+    -------
+    np.ndarray
+        The UTC Times, as the same type as the input. Integer arrays give the
+        UTC seconds since 6 Jan 1980. Datetimes keep their units unless they
+        are coarser than a second.
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not an integer or datetime64 array
+    ValueError
+        If a datetime64 input holds NaT
+    """
+    return _shift_leap_seconds(gps_times, -1)
+
+
+def utc2gps_array(utc_times: np.ndarray) -> np.ndarray:
+    """Convert an array of UTC Times to GPS Times
+
+    This is the vectorized form of `utc2gps()`. As with `utc2gps()`, the
+    number of leap seconds is looked up at the UTC time.
+
+    Parameters
+    ----------
+    utc_times : np.ndarray
+        Either an integer array of UTC seconds since 6 Jan 1980 or a
+        `numpy.datetime64` array of UTC times
+
+    Returns
+    -------
+    np.ndarray
+        The GPS Times, as the same type as the input. Integer arrays give the
+        GPS seconds since 6 Jan 1980. Datetimes keep their units unless they
+        are coarser than a second.
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the input is not an integer or datetime64 array
+    ValueError
+        If a datetime64 input holds NaT
+    """
+    return _shift_leap_seconds(utc_times, 1)
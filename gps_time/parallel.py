@@ -0,0 +1,295 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+import os
+import datetime
+
+import numpy as np
+
+from typing import Iterable, List, Optional, Tuple, Union
+from logging import getLogger
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from .arrays import GPSTimeArray
+from .datetime import _gps_epoch_datetime, _gps_epoch_datetime64, parse_iso_array
+
+
+__all__ = ['logger', 'to_gpstime_array']
+
+
+logger = getLogger(__name__)
+
+
+_gps_epoch_naive: datetime.datetime = _gps_epoch_datetime.replace(tzinfo=None)
+_ONE_US: datetime.timedelta = datetime.timedelta(microseconds=1)
+
+
+def _as_input_array(
+    values: Union[np.ndarray, Iterable[str], Iterable[datetime.datetime]]
+) -> np.ndarray:
+    """Cast the input to a datetime64 or unicode string array.
+
+    Datetimes are encoded as microseconds since the GPS epoch in a single
+    pass, which takes a fraction of the time that pickling them for worker
+    processes would. Naive datetimes are taken to be UTC, as in
+    `datetime2tow()`.
+
+    Parameters
+    ----------
+    values : Union[np.ndarray, Iterable[str], Iterable[datetime.datetime]]
+        The datetime64 array, ISO strings, or datetimes
+
+    Returns
+    -------
+    np.ndarray
+        A one dimensional datetime64 or unicode string array
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the values are neither datetime64 values, strings, nor datetimes
+    ValueError
+        If the values are not one dimensional
+    """
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+        if values and not isinstance(values[0], str):
+            try:
+                offsets = np.fromiter(
+                    (
+                        (d - (_gps_epoch_naive if d.tzinfo is None else _gps_epoch_datetime))
+                        // _ONE_US
+                        for d in values
+                    ),
+                    dtype=np.int64,
+                    count=len(values),
+                )
+            except AttributeError:
+                raise TypeError("values must be datetime64 values, strings, or datetimes")
+            return _gps_epoch_datetime64() + offsets.astype("timedelta64[us]")
+        values = np.asarray(values, dtype=str)
+
+    if values.ndim != 1:
+        raise ValueError("values must be one dimensional")
+    if values.dtype.kind not in "MU":
+        raise TypeError("values must be datetime64 values, strings, or datetimes")
+    return values
+
+
+def _convert(values: np.ndarray) -> Tuple[GPSTimeArray, np.ndarray]:
+    """Convert a datetime64 or unicode string array in this process.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The datetime64 values or ISO strings
+
+    Returns
+    -------
+    Tuple[GPSTimeArray, np.ndarray]
+        The times and the indices of the strings that could not be parsed
+    """
+    if values.dtype.kind == "M":
+        return GPSTimeArray.from_datetime64(values), np.empty(0, dtype=np.int64)
+    return parse_iso_array(values, output="gpstime")
+
+
+def _output_columns(buffer: memoryview, size: int) -> List[np.ndarray]:
+    """The week number, seconds, femtoseconds, and malformed row columns.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        The shared memory holding the columns
+    size : int
+        The number of rows
+
+    Returns
+    -------
+    List[np.ndarray]
+        Three int64 columns and a boolean column
+    """
+    columns = [
+        np.ndarray((size,), dtype=np.int64, buffer=buffer, offset=8 * size * i)
+        for i in range(3)
+    ]
+    columns.append(np.ndarray((size,), dtype=np.bool_, buffer=buffer, offset=24 * size))
+    return columns
+
+
+def _convert_chunk(
+    input_name: str, dtype: str, output_name: str, size: int, start: int, stop: int
+) -> None:
+    """Convert rows [start, stop) of a shared array into shared columns.
+
+    This runs in the worker processes. Only the names of the shared memory
+    blocks and the bounds of the chunk are pickled.
+
+    Parameters
+    ----------
+    input_name : str
+        The name of the shared memory holding the input array
+    dtype : str
+        The dtype of the input array
+    output_name : str
+        The name of the shared memory holding the output columns
+    size : int
+        The number of rows of the input array
+    start : int
+        The first row to convert
+    stop : int
+        The row after the last row to convert
+    """
+    # The chunk is copied out of the shared memory so that no views of it
+    # are left if the conversion raises, as views prevent closing it
+    input_memory = SharedMemory(name=input_name)
+    try:
+        values = np.ndarray((size,), dtype=dtype, buffer=input_memory.buf)
+        chunk = values[start:stop].copy()
+        del values
+    finally:
+        input_memory.close()
+
+    times, bad = _convert(chunk)
+
+    output_memory = SharedMemory(name=output_name)
+    try:
+        week_number, seconds, femtoseconds, malformed = _output_columns(
+            output_memory.buf, size
+        )
+        week_number[start:stop] = times.week_number
+        seconds[start:stop] = times.seconds
+        femtoseconds[start:stop] = times.femtoseconds
+        malformed[start + bad] = True
+        del week_number, seconds, femtoseconds, malformed
+    finally:
+        output_memory.close()
+
+
+def to_gpstime_array(
+    values: Union[np.ndarray, Iterable[str], Iterable[datetime.datetime]],
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    min_parallel_size: int = 100000,
+    executor: Optional[Executor] = None,
+) -> Tuple[GPSTimeArray, np.ndarray]:
+    """Convert a large batch of times to a `GPSTimeArray` with a process pool.
+
+    ISO strings are parsed in chunks by worker processes. The strings and the
+    resulting columns are held in shared memory, so only the names of the
+    memory blocks and the bounds of each chunk are sent to the workers, and
+    the results are in the original order. Inputs smaller than
+    `min_parallel_size` are converted in this process, where starting the
+    pool would take longer than the conversion.
+
+    Datetime64 values and datetimes are always converted in this process.
+    `GPSTimeArray.from_datetime64()` is vectorized and converts millions of
+    values in less time than copying them to the workers takes. Datetimes
+    are encoded as microseconds in a single pass, which is much faster than
+    `GPSTime.from_datetime()` but is not parallelized, as pickling them for
+    the workers would take several times longer than encoding them.
+
+    The conversions are those of `GPSTimeArray.from_datetime64()` and
+    `parse_iso_array()`, and are exact to the microsecond. Naive datetimes
+    and datetime64 values are taken to be UTC, as elsewhere in `gps_time`.
+
+    Parameters
+    ----------
+    values : Union[np.ndarray, Iterable[str], Iterable[datetime.datetime]]
+        A datetime64 array, or a sequence of ISO strings or datetimes
+    max_workers : Optional[int], optional
+        The number of worker processes, by default the number of CPUs. Only
+        used if `executor` is None.
+    chunk_size : Optional[int], optional
+        The number of rows converted by each task, by default a quarter of
+        the rows per worker
+    min_parallel_size : int, optional
+        The fewest ISO strings that are parsed with the process pool, by
+        default 100000
+    executor : Optional[Executor], optional
+        A process pool to use instead of starting one, by default None
+
+    Returns
+    -------
+    Tuple[GPSTimeArray, np.ndarray]
+        Two arrays: 1) the times, in which strings that could not be parsed
+        are the GPS epoch and 2) the int64 indices of those strings
+
+    See Also
+    --------
+    `parse_iso_array()`
+    `GPSTimeArray.from_datetime64()`
+
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the values are neither datetime64 values, strings, nor datetimes
+    ValueError
+        If the values are not one dimensional, hold NaT, or the sizes are not
+        positive
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1 or (chunk_size is not None and chunk_size < 1):
+        raise ValueError("max_workers and chunk_size must be at least 1")
+
+    values = _as_input_array(values)
+    size = len(values)
+    if (
+        values.dtype.kind == "M"
+        or size == 0
+        or size < min_parallel_size
+        or (max_workers == 1 and executor is None)
+    ):
+        return _convert(values)
+
+    if chunk_size is None:
+        chunk_size = -(-size // (4 * max_workers))
+
+    input_memory = SharedMemory(create=True, size=values.nbytes)
+    output_memory = SharedMemory(create=True, size=25 * size)
+    shared_values = columns = None
+    try:
+        shared_values = np.ndarray(values.shape, dtype=values.dtype, buffer=input_memory.buf)
+        shared_values[:] = values
+        columns = _output_columns(output_memory.buf, size)
+        columns[3][:] = False
+
+        pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                pool.submit(
+                    _convert_chunk,
+                    input_memory.name,
+                    values.dtype.str,
+                    output_memory.name,
+                    size,
+                    start,
+                    min(start + chunk_size, size),
+                )
+                for start in range(0, size, chunk_size)
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        times = GPSTimeArray._from_normalized(*(column.copy() for column in columns[:3]))
+        bad = np.flatnonzero(columns[3])
+    finally:
+        # The views must be released before the shared memory is closed
+        shared_values = columns = None
+        input_memory.close()
+        input_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+
+    return times, bad
@@ -0,0 +1,421 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+import os
+import json
+
+import numpy as np
+
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from logging import getLogger
+
+from .core import GPSTime
+from .arrays import GPSTimeArray
+
+
+__all__ = ['logger', 'GPSTimeStore']
+
+
+logger = getLogger(__name__)
+
+
+_TIME_COLUMNS = ("week_number", "seconds", "femtoseconds")
+_METADATA_FILE = "store.json"
+_VERSION = 1
+
+
+def _column_path(path: str, name: str) -> str:
+    """The path of the file holding a column of a store."""
+    return os.path.join(path, name + ".bin")
+
+
+class GPSTimeStore:
+    """Memory-mapped, time sorted column store of GPS times.
+
+    A store is a directory holding the week number, seconds, and
+    femtoseconds of each time as raw little-endian int64 column files, any
+    other columns of fixed-width values, one element per time, and a small
+    `store.json` file recording the number of rows and the column dtypes.
+    The rows are kept sorted by time, so the sorted columns are themselves
+    the index: `index_range()` finds the rows within a range of times by
+    binary search, touching only a few pages of each file, and `query()`
+    returns views of the memory maps rather than copies. A store can hold
+    many more times than fit in memory.
+
+    Open an existing store with the constructor, and create one with
+    `GPSTimeStore.create()`. The columns are opened read-only; `append()`
+    adds later times to the end of the files.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The directory of the store
+    """
+
+    """
+    Raises
+    ------
+    FileNotFoundError
+        If the directory does not hold a store
+    ValueError
+        If the store was written by an unsupported version, or a column file
+        is shorter than the recorded number of rows
+    """
+
+    path: str
+    dtypes: Dict[str, np.dtype]
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """Object constructor.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The directory of the store
+        """
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, _METADATA_FILE), "r") as f:
+            metadata = json.load(f)
+        if metadata.get("version") != _VERSION:
+            raise ValueError(
+                "Unsupported GPSTimeStore version {!r}".format(metadata.get("version"))
+            )
+        self.dtypes = {name: np.dtype(str_) for name, str_ in metadata["columns"].items()}
+        self._map(metadata["length"])
+
+    def _map(self, length: int) -> None:
+        """Memory map the first `length` rows of each column.
+
+        Parameters
+        ----------
+        length : int
+            The number of rows
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If a column file is shorter than `length` rows
+        """
+        self._length = length
+        self._columns: Dict[str, np.ndarray] = {}
+        for name, dtype in self.dtypes.items():
+            column_path = _column_path(self.path, name)
+            if os.path.getsize(column_path) < length * dtype.itemsize:
+                raise ValueError("Column {!r} of the store is truncated".format(name))
+            if length == 0:
+                # Empty files cannot be memory mapped
+                self._columns[name] = np.empty(0, dtype=dtype)
+            else:
+                self._columns[name] = np.memmap(
+                    column_path, dtype=dtype, mode="r", shape=(length,)
+                )
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, os.PathLike],
+        times: GPSTimeArray,
+        columns: Optional[Mapping[str, np.ndarray]] = None,
+    ) -> GPSTimeStore:
+        """Create a store from times and the other columns of their rows.
+
+        The rows are sorted by time before they are written; rows with equal
+        times keep their order.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The directory of the store, which is created if it does not exist
+        times : GPSTimeArray
+            The times of the rows
+        columns : Optional[Mapping[str, np.ndarray]], optional
+            The other columns, by name, each a one dimensional array with one
+            element per time, by default None
+
+        Returns
+        -------
+        GPSTimeStore
+            The new store, opened for reading
+        """
+
+        """
+        Raises
+        ------
+        FileExistsError
+            If the directory already holds a store
+        ValueError
+            If a column does not have one element per time, has an invalid
+            name, or holds Python objects
+        """
+        path = os.fspath(path)
+        columns = dict(columns or {})
+        _check_columns(times, columns)
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, _METADATA_FILE)):
+            raise FileExistsError("{} already holds a GPSTimeStore".format(path))
+
+        order = times.argsort()
+        dtypes = {name: np.dtype(np.int64).newbyteorder("<") for name in _TIME_COLUMNS}
+        dtypes.update(
+            (name, np.asarray(values).dtype.newbyteorder("<"))
+            for name, values in columns.items()
+        )
+        for name, values in _rows(times, columns).items():
+            with open(_column_path(path, name), "wb") as f:
+                np.asarray(values[order], dtype=dtypes[name]).tofile(f)
+        _write_metadata(path, len(times), dtypes)
+        return cls(path)
+
+    def append(
+        self, times: GPSTimeArray, columns: Optional[Mapping[str, np.ndarray]] = None
+    ) -> None:
+        """Add rows at or after the last time of the store.
+
+        The rows are sorted by time and written to the end of the column
+        files, and the number of rows is only recorded once they have been
+        written, so an interrupted append leaves the store as it was. Views
+        returned before the append keep referring to the earlier rows.
+
+        Parameters
+        ----------
+        times : GPSTimeArray
+            The times of the rows
+        columns : Optional[Mapping[str, np.ndarray]], optional
+            The other columns, by name, which must be those of the store, by
+            default None
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If a time is before the last time of the store, or the columns
+            are not those of the store or do not have one element per time
+        """
+        columns = dict(columns or {})
+        _check_columns(times, columns)
+        if set(columns) != set(self.columns):
+            raise ValueError(
+                "Appended rows must have the columns {}".format(sorted(self.columns))
+            )
+        if len(times) == 0:
+            return
+        order = times.argsort()
+        if self._length and times[int(order[0])] < self.times[-1]:
+            raise ValueError("Appended times must not be before the last time of the store")
+
+        for name, values in _rows(times, columns).items():
+            with open(_column_path(self.path, name), "r+b") as f:
+                # Overwrite any rows left by an interrupted append
+                f.seek(self._length * self.dtypes[name].itemsize)
+                np.asarray(values[order], dtype=self.dtypes[name]).tofile(f)
+                f.truncate()
+        length = self._length + len(times)
+        _write_metadata(self.path, length, self.dtypes)
+        self._map(length)
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the columns other than the times."""
+        return [name for name in self.dtypes if name not in _TIME_COLUMNS]
+
+    @property
+    def times(self) -> GPSTimeArray:
+        """All of the times, as a read-only view of the memory maps."""
+        return GPSTimeArray._from_normalized(
+            *(self._columns[name] for name in _TIME_COLUMNS)
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """Get all of a column, as a read-only view of its memory map.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column, which may be one of the time columns
+
+        Returns
+        -------
+        np.ndarray
+            The column
+        """
+
+        """
+        Raises
+        ------
+        KeyError
+            If the store has no such column
+        """
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        """The number of rows in the store."""
+        return self._length
+
+    def _lower_bound(self, time: GPSTime) -> int:
+        """Find the first row whose time is at or after a time.
+
+        Each time column is binary searched within the rows that match the
+        time in the columns before it, which orders the rows exactly as
+        `GPSTime` comparisons do.
+
+        Parameters
+        ----------
+        time : GPSTime
+            The time
+
+        Returns
+        -------
+        int
+            The index of the row, or the number of rows if every time is
+            before `time`
+        """
+
+        """
+        Raises
+        ------
+        TypeError
+            If the time is not a `GPSTime`
+        """
+        if not isinstance(time, GPSTime):
+            raise TypeError("GPSTimeStore is searched with GPSTime bounds")
+        low, high = 0, self._length
+        for name in _TIME_COLUMNS:
+            segment = self._columns[name][low:high]
+            value = getattr(time, name)
+            low, high = (
+                low + int(np.searchsorted(segment, value, side="left")),
+                low + int(np.searchsorted(segment, value, side="right")),
+            )
+        return low
+
+    def index_range(
+        self, start: Optional[GPSTime] = None, stop: Optional[GPSTime] = None
+    ) -> slice:
+        """Find the rows whose times are within [start, stop).
+
+        Parameters
+        ----------
+        start : Optional[GPSTime], optional
+            The first time selected, by default None, which does not bound
+            the times from below
+        stop : Optional[GPSTime], optional
+            The time after the last time selected, by default None, which does
+            not bound the times from above
+
+        Returns
+        -------
+        slice
+            The rows within the range
+        """
+        low = 0 if start is None else self._lower_bound(start)
+        high = self._length if stop is None else self._lower_bound(stop)
+        return slice(low, max(low, high))
+
+    def query(
+        self,
+        start: Optional[GPSTime] = None,
+        stop: Optional[GPSTime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Tuple[GPSTimeArray, Dict[str, np.ndarray]]:
+        """Get the rows whose times are within [start, stop).
+
+        The results are views of the memory maps, so only the pages that
+        are accessed are read from disk. Copy them to keep them in memory or
+        to modify them.
+
+        Parameters
+        ----------
+        start : Optional[GPSTime], optional
+            The first time selected, by default None
+        stop : Optional[GPSTime], optional
+            The time after the last time selected, by default None
+        columns : Optional[List[str]], optional
+            The other columns to get, by default None, which gets all of them
+
+        Returns
+        -------
+        Tuple[GPSTimeArray, Dict[str, np.ndarray]]
+            The times within the range, in order, and the other columns of
+            their rows, by name
+        """
+
+        """
+        Raises
+        ------
+        KeyError
+            If the store has no such column
+        """
+        rows = self.index_range(start, stop)
+        names = self.columns if columns is None else columns
+        return self.times[rows], {name: self._columns[name][rows] for name in names}
+
+    def __repr__(self) -> str:
+        """Representation of the store."""
+        return "GPSTimeStore({!r}, rows={}, columns={})".format(
+            self.path, self._length, self.columns
+        )
+
+
+def _check_columns(times: GPSTimeArray, columns: Dict[str, np.ndarray]) -> None:
+    """Check the other columns of the rows of a store.
+
+    Parameters
+    ----------
+    times : GPSTimeArray
+        The times of the rows
+    columns : Dict[str, np.ndarray]
+        The other columns, by name
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If a column does not have one element per time, has an invalid name,
+        or holds Python objects
+    """
+    for name, values in columns.items():
+        values = np.asarray(values)
+        if name in _TIME_COLUMNS or not name.isidentifier():
+            raise ValueError("Invalid column name {!r}".format(name))
+        if values.shape != (len(times),):
+            raise ValueError("Column {!r} must have one element per time".format(name))
+        if values.dtype.hasobject:
+            raise ValueError("Column {!r} must not hold Python objects".format(name))
+
+
+def _rows(times: GPSTimeArray, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Collect the time columns and the other columns of rows by name."""
+    rows = {name: getattr(times, name) for name in _TIME_COLUMNS}
+    rows.update((name, np.asarray(values)) for name, values in columns.items())
+    return rows
+
+
+def _write_metadata(path: str, length: int, dtypes: Dict[str, np.dtype]) -> None:
+    """Replace the metadata of a store.
+
+    The file is replaced atomically, so readers see either the old or the
+    new number of rows.
+
+    Parameters
+    ----------
+    path : str
+        The directory of the store
+    length : int
+        The number of rows
+    dtypes : Dict[str, np.dtype]
+        The dtypes of the columns, by name
+    """
+    metadata = {
+        "version": _VERSION,
+        "length": length,
+        "columns": {name: dtype.str for name, dtype in dtypes.items()},
+    }
+    temporary = os.path.join(path, _METADATA_FILE + ".tmp")
+    with open(temporary, "w") as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(temporary, os.path.join(path, _METADATA_FILE))
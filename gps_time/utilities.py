@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../10_utilities.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'arange_gpstime', 'validate_gps_week']
+__all__ = ['logger', 'GPSTimeRange', 'arange_gpstime', 'validate_gps_week']
 
 # %% ../10_utilities.ipynb 2
 """Copyright 2020 The Aerospace Corporation"""
@@ -9,19 +9,191 @@ __all__ = ['logger', 'arange_gpstime', 'validate_gps_week']
 # %% ../10_utilities.ipynb 4
 import numpy as np
 
-from typing import List
+from typing import Iterator, List, Union
+from collections.abc import Sequence
 from logging import getLogger
 
-from .core import GPSTime
+from .core import GPSTime, _normalize, _SEC_IN_WEEK, _FEMTO_SEC_IN_SEC
+from .arrays import GPSTimeArray
 
 
 # %% ../10_utilities.ipynb 5
 logger = getLogger(__name__)
 
 # %% ../10_utilities.ipynb 6
+class GPSTimeRange(Sequence):
+    """A lazy, evenly spaced sequence of GPSTimes.
+
+    This is the `GPSTime` analogue of the built-in `range`. Elements are
+    computed when they are accessed, so the range holds no `GPSTime` objects
+    and uses constant memory regardless of its length. The step is an exact
+    integer number of femtoseconds, so there is no floating point drift.
+
+    Parameters
+    ----------
+    start : GPSTime
+        The first time in the range
+    step_femtoseconds : int
+        The spacing between times, in femtoseconds. May be negative.
+    length : int
+        The number of times in the range
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the step is zero or the length is negative
+    """
+
+    def __init__(self, start: GPSTime, step_femtoseconds: int, length: int) -> None:
+        """Object constructor.
+
+        Parameters
+        ----------
+        start : GPSTime
+            The first time in the range
+        step_femtoseconds : int
+            The spacing between times, in femtoseconds
+        length : int
+            The number of times in the range
+        """
+        if int(step_femtoseconds) == 0:
+            raise ValueError("GPSTimeRange step must not be zero")
+        if int(length) < 0:
+            raise ValueError("GPSTimeRange length must not be negative")
+        self.start = start
+        self.step_femtoseconds = int(step_femtoseconds)
+        self.length = int(length)
+
+    def _start_femtoseconds(self) -> int:
+        """The start time in femtoseconds since 6 Jan 1980."""
+        return (
+            self.start.week_number * _SEC_IN_WEEK + self.start.seconds
+        ) * _FEMTO_SEC_IN_SEC + self.start.femtoseconds
+
+    def __len__(self) -> int:
+        """The number of times in the range."""
+        return self.length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[GPSTime, "GPSTimeRange"]:
+        """Get a time or a sub-range.
+
+        Parameters
+        ----------
+        key : Union[int, slice]
+            The index or slice
+
+        Returns
+        -------
+        Union[GPSTime, GPSTimeRange]
+            A `GPSTime` for an index, or a `GPSTimeRange` for a slice
+        """
+
+        """
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        if isinstance(key, slice):
+            indices = range(self.length)[key]
+            start = self[indices.start] if len(indices) > 0 else self.start
+            return GPSTimeRange(
+                start, self.step_femtoseconds * indices.step, len(indices)
+            )
+
+        index = range(self.length)[key]
+        return GPSTime._from_normalized(
+            *_normalize(
+                self.start.week_number,
+                self.start.seconds,
+                self.start.femtoseconds + index * self.step_femtoseconds,
+            )
+        )
+
+    def __iter__(self) -> Iterator[GPSTime]:
+        """Iterate over the times in order."""
+        week_number = self.start.week_number
+        seconds = self.start.seconds
+        femtoseconds = self.start.femtoseconds
+        for _ in range(self.length):
+            yield GPSTime._from_normalized(week_number, seconds, femtoseconds)
+            week_number, seconds, femtoseconds = _normalize(
+                week_number, seconds, femtoseconds + self.step_femtoseconds
+            )
+
+    def index(self, value: GPSTime) -> int:
+        """Get the index of a time in the range.
+
+        Parameters
+        ----------
+        value : GPSTime
+            The time to find
+
+        Returns
+        -------
+        int
+            The index of the time
+        """
+
+        """
+        Raises
+        ------
+        ValueError
+            If the time is not in the range
+        """
+        if isinstance(value, GPSTime):
+            offset = (
+                (value.week_number * _SEC_IN_WEEK + value.seconds) * _FEMTO_SEC_IN_SEC
+                + value.femtoseconds
+                - self._start_femtoseconds()
+            )
+            index, remainder = divmod(offset, self.step_femtoseconds)
+            if remainder == 0 and 0 <= index < self.length:
+                return index
+        raise ValueError("{} is not in range".format(value))
+
+    def __contains__(self, value: GPSTime) -> bool:
+        """Check whether a time is in the range, without iterating over it."""
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+
+    def count(self, value: GPSTime) -> int:
+        """Count the occurrences of a time in the range (0 or 1)."""
+        return int(value in self)
+
+    def to_array(self) -> GPSTimeArray:
+        """Convert the range to a `GPSTimeArray`.
+
+        Returns
+        -------
+        GPSTimeArray
+            The times of the range as integer columns
+        """
+        return GPSTimeArray.from_range(self.start, self.step_femtoseconds, self.length)
+
+    def __repr__(self) -> str:
+        """Representation of the object.
+
+        Returns
+        -------
+        str
+            The representation of the object
+
+        """
+        return "GPSTimeRange(start={}, step_femtoseconds={}, length={})".format(
+            self.start, self.step_femtoseconds, self.length
+        )
+
+# %% ../10_utilities.ipynb 7
 def arange_gpstime(
-    start_gpstime: GPSTime, duration_s: float, step_ms: float
-) -> List[GPSTime]:
+    start_gpstime: GPSTime, duration_s: float, step_ms: float, output: str = "list"
+) -> Union[List[GPSTime], GPSTimeRange, GPSTimeArray]:
     """Create a list of GPSTimes in sequence.
 
     The purpose of this function is to create a list that represents a
@@ -39,10 +211,14 @@ def arange_gpstime(
         The duration of the sequence, in seconds
     step_ms : float
         The step size, in milliseconds
+    output : str, optional
+        The form of the sequence. "list" builds a list of GPSTimes, "range"
+        returns a lazy `GPSTimeRange`, and "array" returns a `GPSTimeArray`,
+        by default "list"
 
     Returns
     -------
-    List[GPSTime]
+    Union[List[GPSTime], GPSTimeRange, GPSTimeArray]
         The sequence of GPSTimes
 
     Notes
@@ -51,20 +227,40 @@ def arange_gpstime(
     the start is at 0 with a duration of 5 and step of 1, the sequence would
     return [0, 1, 2, 3, 4]
 
+    The "range" and "array" outputs round the duration and step to whole
+    femtoseconds and step exactly in integers, while the "list" output adds
+    floating point offsets to the start time.
+
     See Also
     --------
     `numpy.arange()`
     `arange_datetime()`
 
-    Todo
-    ----
-    .. todo:: Determine if this still works if a np.ndarray is returned
-        instead of a list
+    """
 
     """
-    return list(start_gpstime + np.arange(0, duration_s, step_ms / 1000))
+    Raises
+    ------
+    ValueError
+        If the output is not recognized or the step is zero
+    """
+    if output == "list":
+        return list(start_gpstime + np.arange(0, duration_s, step_ms / 1000))
+    elif output not in ("range", "array"):
+        raise ValueError("output must be 'list', 'range', or 'array'")
 
-# %% ../10_utilities.ipynb 7
+    step_femtoseconds = int(round(step_ms * 1e12))
+    duration_femtoseconds = int(round(duration_s * 1e15))
+    if step_femtoseconds == 0:
+        raise ValueError("step_ms must not be zero")
+    length = max(0, -(-duration_femtoseconds // step_femtoseconds))
+
+    time_range = GPSTimeRange(start_gpstime, step_femtoseconds, length)
+    if output == "array":
+        return time_range.to_array()
+    return time_range
+
+# %% ../10_utilities.ipynb 8
 def validate_gps_week(full_week: int, gps_week: int) -> None:
     """Validate that the week numbers are consistent.
 
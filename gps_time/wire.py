@@ -0,0 +1,230 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+
+import numpy as np
+
+from typing import Iterable, Iterator, Union
+from logging import getLogger
+
+from .core import GPSTime, _WIRE_FORMAT, _SEC_IN_WEEK, _FEMTO_SEC_IN_SEC
+from .arrays import GPSTimeArray
+
+
+__all__ = ['logger', 'WIRE_DTYPE', 'RECORD_SIZE', 'pack', 'pack_into', 'unpack', 'iter_unpack']
+
+
+logger = getLogger(__name__)
+
+
+WIRE_DTYPE: np.dtype = np.dtype(
+    [("week_number", "<u2"), ("seconds", "<u4"), ("femtoseconds", "<u8")]
+)
+"""Structured dtype of one GPS time in the binary wire format.
+
+Each record is the 14 bytes of `GPSTime.to_bytes()`: the week number
+(uint16), seconds of week (uint32), and femtoseconds (uint64), little-endian
+and without padding. A batch is the records back to back, with no header.
+"""
+
+RECORD_SIZE: int = _WIRE_FORMAT.size
+"""The number of bytes in each record of the wire format."""
+
+
+def _as_array(times: Union[GPSTimeArray, Iterable[GPSTime]]) -> GPSTimeArray:
+    """Convert the times to encode to a `GPSTimeArray`.
+
+    Parameters
+    ----------
+    times : Union[GPSTimeArray, Iterable[GPSTime]]
+        The times
+
+    Returns
+    -------
+    GPSTimeArray
+        The times, checked to fit in the wire format
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If a week number is not within [0, 65535]
+    """
+    if not isinstance(times, GPSTimeArray):
+        times = GPSTimeArray.from_gpstimes(times)
+    if len(times) and (times.week_number.min() < 0 or times.week_number.max() > 0xFFFF):
+        raise ValueError("week numbers must be within [0, 65535] to encode them")
+    return times
+
+
+def _write(times: GPSTimeArray, records: np.ndarray) -> None:
+    """Write the columns of the times into the records of `WIRE_DTYPE`."""
+    records["week_number"] = times.week_number
+    records["seconds"] = times.seconds
+    records["femtoseconds"] = times.femtoseconds
+
+
+def pack(times: Union[GPSTimeArray, Iterable[GPSTime]]) -> bytes:
+    """Encode GPS times in the binary wire format.
+
+    The encoding is the concatenation of `GPSTime.to_bytes()` for each time,
+    written column by column without creating a `GPSTime` per record.
+
+    Parameters
+    ----------
+    times : Union[GPSTimeArray, Iterable[GPSTime]]
+        The times
+
+    Returns
+    -------
+    bytes
+        `RECORD_SIZE` bytes per time
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If a week number is not within [0, 65535]
+    TypeError
+        If the times are not a `GPSTimeArray` or `GPSTime` objects
+    """
+    times = _as_array(times)
+    records = np.empty(len(times), dtype=WIRE_DTYPE)
+    _write(times, records)
+    return records.tobytes()
+
+
+def pack_into(
+    times: Union[GPSTimeArray, Iterable[GPSTime]],
+    buffer: Union[bytes, bytearray, memoryview],
+    offset: int = 0,
+) -> int:
+    """Encode GPS times into a writable buffer.
+
+    This is `pack()` without the intermediate bytes, e.g. to fill a
+    preallocated `bytearray` or a shared memory block before sending it.
+
+    Parameters
+    ----------
+    times : Union[GPSTimeArray, Iterable[GPSTime]]
+        The times
+    buffer : Union[bytes, bytearray, memoryview]
+        A writable object supporting the buffer protocol
+    offset : int, optional
+        The byte offset in the buffer of the first record, by default 0
+
+    Returns
+    -------
+    int
+        The number of bytes written
+    """
+
+    """
+    Raises
+    ------
+    TypeError
+        If the buffer is read-only
+    ValueError
+        If the buffer is too small, or a week number is not within
+        [0, 65535]
+    """
+    times = _as_array(times)
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        raise TypeError("buffer must be writable")
+    size = len(times) * RECORD_SIZE
+    if offset < 0 or offset + size > view.nbytes:
+        raise ValueError(
+            "pack_into requires a buffer of at least {} bytes after offset {}".format(
+                size, offset
+            )
+        )
+    _write(times, np.frombuffer(view, dtype=WIRE_DTYPE, count=len(times), offset=offset))
+    return size
+
+
+def unpack(
+    buffer: Union[bytes, bytearray, memoryview], offset: int = 0, count: int = -1
+) -> GPSTimeArray:
+    """Decode GPS times from the binary wire format.
+
+    The records are decoded with `numpy.frombuffer`, so a buffer of millions
+    of records is decoded into the three columns of a `GPSTimeArray` without
+    creating a Python object per record. Use `iter_unpack()` to get `GPSTime`
+    objects instead. The records are checked to hold normalized times, as
+    the buffer may come from an untrusted source.
+
+    Parameters
+    ----------
+    buffer : Union[bytes, bytearray, memoryview]
+        An object supporting the buffer protocol, e.g. the bytes received
+        from a socket
+    offset : int, optional
+        The byte offset in the buffer of the first record, by default 0
+    count : int, optional
+        The number of records to decode, by default -1, which decodes all of
+        the records after the offset
+
+    Returns
+    -------
+    GPSTimeArray
+        The times, with columns that do not share memory with the buffer
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the buffer does not hold whole records, or a record does not hold
+        a normalized time
+    """
+    view = memoryview(buffer).cast("B")
+    if offset < 0 or offset > view.nbytes:
+        raise ValueError("offset must be within the buffer")
+    if count < 0:
+        if (view.nbytes - offset) % RECORD_SIZE:
+            raise ValueError(
+                "buffer size must be a multiple of {} bytes".format(RECORD_SIZE)
+            )
+        count = (view.nbytes - offset) // RECORD_SIZE
+    elif offset + count * RECORD_SIZE > view.nbytes:
+        raise ValueError("buffer is too small for {} records".format(count))
+    records = np.frombuffer(view, dtype=WIRE_DTYPE, count=count, offset=offset)
+    seconds = records["seconds"].astype(np.int64)
+    femtoseconds = records["femtoseconds"]
+    if count and (seconds.max() >= _SEC_IN_WEEK or femtoseconds.max() >= _FEMTO_SEC_IN_SEC):
+        raise ValueError("buffer holds times that are not normalized")
+    return GPSTimeArray._from_normalized(
+        records["week_number"].astype(np.int64), seconds, femtoseconds.astype(np.int64)
+    )
+
+
+def iter_unpack(buffer: Union[bytes, bytearray, memoryview]) -> Iterator[GPSTime]:
+    """Decode GPS times from the binary wire format one at a time.
+
+    Parameters
+    ----------
+    buffer : Union[bytes, bytearray, memoryview]
+        An object supporting the buffer protocol, holding whole records
+
+    Yields
+    ------
+    GPSTime
+        The times, in order
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the buffer does not hold whole records, or a record does not hold
+        a normalized time
+    """
+    view = memoryview(buffer).cast("B")
+    if view.nbytes % RECORD_SIZE:
+        raise ValueError("buffer size must be a multiple of {} bytes".format(RECORD_SIZE))
+    for start in range(0, view.nbytes, RECORD_SIZE):
+        yield GPSTime.from_bytes(view[start:start + RECORD_SIZE])
@@ -0,0 +1,207 @@
+"""Copyright 2020 The Aerospace Corporation"""
+
+
+from __future__ import annotations
+import os
+import itertools
+
+from typing import TYPE_CHECKING, Any, IO, Iterable, Iterator, Optional, Union
+from logging import getLogger
+
+from .core import GPSTime
+
+if TYPE_CHECKING:
+    import ruamel.yaml
+
+
+__all__ = ['logger', 'yaml_loader', 'load_records', 'dump_records']
+
+
+logger = getLogger(__name__)
+
+
+def yaml_loader(typ: str = "rt", pure: bool = False) -> ruamel.yaml.YAML:
+    """Create a YAML instance with `GPSTime` registered.
+
+    The default round-trip instance preserves comments and key order, and is
+    implemented in Python. With `typ="safe"`, ruamel.yaml parses and emits
+    with libyaml when the `ruamel.yaml.clib` package is installed, which is
+    several times faster, and otherwise falls back to its pure Python safe
+    loader. `GPSTime` is loaded by `GPSTime.from_yaml()` and dumped by
+    `GPSTime.to_yaml()` with either; the safe dumper writes the fields of
+    each time in alphabetical order.
+
+    The line width is raised so that each flow-style `GPSTime` is written on
+    a single line.
+
+    Parameters
+    ----------
+    typ : str, optional
+        The ruamel.yaml loader and dumper, "rt" (round trip) or "safe", by
+        default "rt"
+    pure : bool, optional
+        If True, use the pure Python parser and emitter even if libyaml is
+        available, by default False
+
+    Returns
+    -------
+    ruamel.yaml.YAML
+        A YAML instance that loads and dumps `GPSTime` objects
+    """
+    import ruamel.yaml
+
+    yaml = ruamel.yaml.YAML(typ=typ, pure=pure)
+    yaml.register_class(GPSTime)
+    yaml.width = 4096
+    return yaml
+
+
+def load_records(
+    stream: Union[str, os.PathLike, IO[str]],
+    yaml: Optional[ruamel.yaml.YAML] = None,
+) -> Iterator[Any]:
+    """Load the records of a YAML stream one at a time.
+
+    A record is each item of a document whose root is a sequence, or else the
+    whole document. The stream is read incrementally, and each record is
+    composed and constructed on its own, so the memory used is bounded by
+    the largest record rather than the size of the file. A file of
+    `!GPSTime` entries written by `dump_records()`, or any multi-document
+    stream, can therefore be processed even if it does not fit in memory.
+
+    Anchors defined in one record may be referenced by later records of the
+    same document, which construct their own copies of the objects. Root
+    sequences that have a tag or an anchor are loaded as a single record.
+
+    Parameters
+    ----------
+    stream : Union[str, os.PathLike, IO[str]]
+        The path of the YAML file, or an open text stream
+    yaml : Optional[ruamel.yaml.YAML], optional
+        The YAML instance used to construct the records, by default one
+        created by `yaml_loader()`. It must use the pure Python parser, e.g.
+        `yaml_loader("safe", pure=True)`, as the records are composed one at
+        a time from the parser's events, which libyaml does not expose.
+
+    Yields
+    ------
+    Any
+        The records, in order
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the YAML instance uses libyaml to parse
+    """
+    from ruamel.yaml.parser import Parser
+    from ruamel.yaml.events import SequenceStartEvent, SequenceEndEvent
+
+    if yaml is None:
+        yaml = yaml_loader()
+    if not issubclass(yaml.Parser, Parser):
+        raise ValueError(
+            "load_records() needs the pure Python parser, e.g. yaml_loader('safe', pure=True)"
+        )
+    if isinstance(stream, (str, os.PathLike)):
+        with open(stream, "r") as f:
+            yield from load_records(f, yaml)
+        return
+
+    constructor, parser = yaml.get_constructor_parser(stream)
+    composer = constructor.composer
+    try:
+        while composer.check_node():
+            composer.anchors = {}
+            # Drop the DOCUMENT-START event
+            parser.get_event()
+            event = parser.peek_event()
+            if (
+                isinstance(event, SequenceStartEvent)
+                and event.tag is None
+                and event.anchor is None
+            ):
+                parser.get_event()
+                while not parser.check_event(SequenceEndEvent):
+                    yield constructor.construct_document(composer.compose_node(None, None))
+                parser.get_event()
+            else:
+                yield constructor.construct_document(composer.compose_node(None, None))
+            # Drop the DOCUMENT-END event
+            parser.get_event()
+    finally:
+        parser.dispose()
+        yaml.reader.reset_reader()
+        yaml.scanner.reset_scanner()
+
+
+def dump_records(
+    records: Iterable[Any],
+    stream: Union[str, os.PathLike, IO[str]],
+    yaml: Optional[ruamel.yaml.YAML] = None,
+    chunk_size: int = 1000,
+) -> int:
+    """Dump records to a YAML stream as the items of a root sequence.
+
+    The records are consumed from the iterable and written in chunks, so a
+    generator of any length can be written with bounded memory. Each
+    `GPSTime` is written in the compact flow style of `GPSTime.to_yaml()`;
+    other collections are written in block style, whatever the default flow
+    style of `yaml`.
+    The result is a single YAML document that `load_records()` reads back
+    one record at a time, and that `ruamel.yaml.YAML.load()` reads as a
+    list.
+
+    Parameters
+    ----------
+    records : Iterable[Any]
+        The records, which must be representable by `yaml`
+    stream : Union[str, os.PathLike, IO[str]]
+        The path of the YAML file, which is overwritten, or an open text
+        stream
+    yaml : Optional[ruamel.yaml.YAML], optional
+        The YAML instance used to represent the records, by default one
+        created by `yaml_loader()`
+    chunk_size : int, optional
+        The number of records represented at a time, by default 1000
+
+    Returns
+    -------
+    int
+        The number of records written
+
+    """
+
+    """
+    Raises
+    ------
+    ValueError
+        If the chunk size is not positive
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(stream, (str, os.PathLike)):
+        with open(stream, "w") as f:
+            return dump_records(records, f, yaml, chunk_size)
+
+    if yaml is None:
+        yaml = yaml_loader()
+    records = iter(records)
+    count = 0
+    # The block sequences of consecutive chunks concatenate into one sequence,
+    # but the safe dumper writes a chunk of scalars as a flow sequence unless
+    # block style is forced
+    representer = yaml.representer
+    default_flow_style = representer.default_flow_style
+    representer.default_flow_style = False
+    try:
+        for chunk in iter(lambda: list(itertools.islice(records, chunk_size)), []):
+            yaml.dump(chunk, stream)
+            count += len(chunk)
+    finally:
+        representer.default_flow_style = default_flow_style
+    if count == 0:
+        stream.write("[]\n")
+    return count
@@ -0,0 +1,480 @@
+import pytest
+
+import datetime
+import numpy as np
+
+from gps_time.core import GPSTime, GPSTimeDelta
+from gps_time import arrays
+from gps_time.arrays import GPSTimeArray, GPSTimeDeltaArray
+
+
+@pytest.fixture
+def times():
+    """A short list of GPSTimes that are not in order."""
+    return [
+        GPSTime(2000, 10, 500),
+        GPSTime(1999, 604799, 999999999999999),
+        GPSTime(2000, 10, 499),
+        GPSTime(2001, 0, 0),
+        GPSTime(2000, 10, 500),
+    ]
+
+
+def test_GPSTimeArray_constructor():
+    """Test the GPSTimeArray constructor.
+
+    Verifies that the columns are int64, that scalars are broadcast, and that
+    out of range values are carried into the week number.
+    """
+    t = GPSTimeArray([1500, 1500], [604799, 604800], [0, 0])
+    assert t.week_number.dtype == np.int64
+    np.testing.assert_array_equal(t.week_number, [1500, 1501])
+    np.testing.assert_array_equal(t.seconds, [604799, 0])
+
+    t = GPSTimeArray(1500, np.array([0, 1, 2]))
+    np.testing.assert_array_equal(t.week_number, [1500, 1500, 1500])
+    np.testing.assert_array_equal(t.femtoseconds, [0, 0, 0])
+
+    t = GPSTimeArray(1500, np.array([-1.5, 604799.9]))
+    assert t[0] == GPSTime(1500, -1.5)
+    assert t[1] == GPSTime(1500, 604799.9)
+
+    t = GPSTimeArray([1500], [0], [-1])
+    assert t[0] == GPSTime(1499, 604799, 999999999999999)
+
+    with pytest.raises(ValueError):
+        GPSTimeArray(np.zeros((2, 2)), 0, 0)
+
+
+def test_GPSTimeArray_constructor_no_copy():
+    """Test that normalized int64 columns are used without copying."""
+    weeks = np.array([1, 2, 3], dtype=np.int64)
+    seconds = np.array([4, 5, 6], dtype=np.int64)
+    femtoseconds = np.array([7, 8, 9], dtype=np.int64)
+    t = GPSTimeArray(weeks, seconds, femtoseconds)
+    assert np.shares_memory(t.week_number, weeks)
+    assert np.shares_memory(t.seconds, seconds)
+    assert np.shares_memory(t.femtoseconds, femtoseconds)
+
+
+def test_GPSTimeArray_pickle(times):
+    """Test pickling, with the columns as out-of-band buffers."""
+    import pickle
+    t = GPSTimeArray.from_gpstimes(times * 100)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(t, protocol=protocol))
+        assert isinstance(loaded, GPSTimeArray)
+        assert loaded.to_gpstimes() == t.to_gpstimes()
+
+    buffers = []
+    data = pickle.dumps(t, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+    assert len(data) < 500
+    loaded = pickle.loads(data, buffers=buffers)
+    assert np.shares_memory(loaded.week_number, t.week_number)
+    assert np.shares_memory(loaded.seconds, t.seconds)
+    assert np.shares_memory(loaded.femtoseconds, t.femtoseconds)
+
+    # Strided views are pickled as contiguous columns
+    buffers = []
+    data = pickle.dumps(t[::3], protocol=5, buffer_callback=buffers.append)
+    assert [b.raw().nbytes for b in buffers] == [len(t[::3]) * 8] * 3
+    assert pickle.loads(data, buffers=buffers).to_gpstimes() == t[::3].to_gpstimes()
+
+
+def test_GPSTimeArray_gpstime_round_trip(times):
+    """Test lossless conversion to and from lists of GPSTime."""
+    t = GPSTimeArray.from_gpstimes(times)
+    assert len(t) == len(times)
+    assert t.to_gpstimes() == times
+    assert t.tolist() == times
+    assert list(t) == times
+    np.testing.assert_array_equal(
+        t.time_of_week, [x.time_of_week for x in times]
+    )
+
+    with pytest.raises(TypeError):
+        GPSTimeArray.from_gpstimes([GPSTime(0, 0), 1])
+
+
+def test_GPSTimeArray_indexing(times):
+    """Test that integer indexing returns GPSTime and slices return views."""
+    t = GPSTimeArray.from_gpstimes(times)
+    assert isinstance(t[1], GPSTime)
+    assert t[1] == times[1]
+    assert t[-1] == times[-1]
+
+    s = t[1:4]
+    assert isinstance(s, GPSTimeArray)
+    assert s.to_gpstimes() == times[1:4]
+    assert np.shares_memory(s.week_number, t.week_number)
+    assert np.shares_memory(s.femtoseconds, t.femtoseconds)
+
+    mask = t > GPSTime(2000, 10, 499)
+    assert t[mask].to_gpstimes() == [times[0], times[3], times[4]]
+
+    t[0] = GPSTime(5, 6, 7)
+    assert s.to_gpstimes() == times[1:4]
+    assert t[0] == GPSTime(5, 6, 7)
+    t[1:3] = GPSTimeArray([8, 9], [0, 0], [0, 0])
+    assert s[0] == GPSTime(8, 0)
+    with pytest.raises(TypeError):
+        t[0] = 1
+
+
+@pytest.mark.parametrize(
+    "offset", [1, -1, 0.5, 1e-9, 604800 * 3.25, datetime.timedelta(seconds=-1.25)]
+)
+def test_GPSTimeArray_add_matches_scalar(times, offset):
+    """Test that adding an offset matches GPSTime addition element by element."""
+    t = GPSTimeArray.from_gpstimes(times)
+    assert (t + offset).to_gpstimes() == [x + offset for x in times]
+    if not isinstance(offset, datetime.timedelta):
+        assert (offset + t).to_gpstimes() == [x + offset for x in times]
+    assert (t - offset).to_gpstimes() == [x - offset for x in times]
+
+
+def test_GPSTimeArray_add_arrays(times):
+    """Test adding arrays of offsets."""
+    t = GPSTimeArray.from_gpstimes(times)
+
+    offsets = np.array([1, -1, 604800, 0, -604801])
+    assert (t + offsets).to_gpstimes() == [x + int(o) for x, o in zip(times, offsets)]
+    assert (t - offsets).to_gpstimes() == [x - int(o) for x, o in zip(times, offsets)]
+
+    offsets = np.array([0.25, -1.5, 1e-6, 0.0, 3.75])
+    assert (t + offsets).to_gpstimes() == [
+        x + float(o) for x, o in zip(times, offsets)
+    ]
+
+    offsets = np.array([1, -1500, 10**12, 0, 7], dtype="timedelta64[ns]")
+    expected = [
+        GPSTime(
+            x.week_number,
+            x.seconds + int(o) // 10**9,
+            x.femtoseconds + int(o) % 10**9 * 1000000,
+        )
+        for x, o in zip(times, offsets.astype(np.int64))
+    ]
+    assert (t + offsets).to_gpstimes() == expected
+
+
+@pytest.mark.parametrize(
+    "offset, seconds, femtoseconds",
+    [
+        (np.timedelta64(1500, "ns"), 0, 1500000000),
+        (np.timedelta64(-1, "ns"), -1, 999999999000000),
+        (np.timedelta64(1, "ms"), 0, 1000000000000),
+        (np.timedelta64(2500, "ms"), 2, 500000000000000),
+        (np.timedelta64(3, "s"), 3, 0),
+    ],
+)
+def test_GPSTimeArray_add_timedelta64_scalar(offset, seconds, femtoseconds):
+    """Test that timedelta64 scalars are offsets in their own units."""
+    t = GPSTimeArray([2000, 2001], [1, 604799], [0, 0])
+    delta = GPSTimeDelta(seconds, femtoseconds)
+    assert (t + offset).to_gpstimes() == [x + delta for x in t]
+    assert (t - offset).to_gpstimes() == [x - delta for x in t]
+    assert (t + offset == t + np.array([offset, offset])).all()
+
+
+def test_GPSTimeArray_add_numpy_left_operand(times):
+    """Test that NumPy arrays and scalars on the left defer to GPSTimeArray."""
+    t = GPSTimeArray.from_gpstimes(times)
+    offsets = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    assert (offsets + t == t + offsets).all()
+    assert (np.int64(3) + t == t + 3).all()
+    assert (np.float64(0.5) + t == t + 0.5).all()
+    assert (np.timedelta64(1, "ms") + t == t + 0.001).all()
+    with pytest.raises(TypeError):
+        offsets - t
+
+
+def test_GPSTimeArray_add_errors(times):
+    """Test offsets of unsupported types."""
+    t = GPSTimeArray.from_gpstimes(times)
+    with pytest.raises(TypeError):
+        t + True
+    with pytest.raises(TypeError):
+        t + "1"
+    with pytest.raises(TypeError):
+        t + np.array([True] * len(times))
+
+
+def test_GPSTimeArray_subtract_times(times):
+    """Test that the difference of times matches the scalar float result."""
+    t = GPSTimeArray.from_gpstimes(times)
+    reference = GPSTime(1990, 1234, 5678)
+    diff = t - reference
+    assert diff.dtype == np.float64
+    np.testing.assert_array_equal(diff, [x - reference for x in times])
+
+    other = t[::-1]
+    np.testing.assert_array_equal(
+        t - other, [a - b for a, b in zip(times, times[::-1])]
+    )
+
+
+def test_GPSTimeArray_comparisons(times):
+    """Test element-wise comparisons match the GPSTime operators."""
+    t = GPSTimeArray.from_gpstimes(times)
+    for reference in times:
+        np.testing.assert_array_equal(t < reference, [x < reference for x in times])
+        np.testing.assert_array_equal(t <= reference, [x <= reference for x in times])
+        np.testing.assert_array_equal(t > reference, [x > reference for x in times])
+        np.testing.assert_array_equal(t >= reference, [x >= reference for x in times])
+        np.testing.assert_array_equal(t == reference, [x == reference for x in times])
+        np.testing.assert_array_equal(t != reference, [x != reference for x in times])
+
+    other = t[::-1]
+    np.testing.assert_array_equal(
+        t < other, [a < b for a, b in zip(times, times[::-1])]
+    )
+
+    assert not (t == 1)
+    assert t != 1
+    with pytest.raises(TypeError):
+        t < 1
+
+
+def test_GPSTimeArray_reflected_gpstime(times):
+    """Test operators with a GPSTime on the left."""
+    t = GPSTimeArray.from_gpstimes(times)
+    other = GPSTime(2000, 10, 500)
+    np.testing.assert_array_equal(other < t, t > other)
+    np.testing.assert_array_equal(other <= t, t >= other)
+    np.testing.assert_array_equal(other > t, t < other)
+    np.testing.assert_array_equal(other >= t, t <= other)
+    np.testing.assert_array_equal(other == t, t == other)
+    np.testing.assert_array_equal(other != t, t != other)
+    np.testing.assert_array_equal(other - t, [other - x for x in times])
+    np.testing.assert_array_equal(other - t, -(t - other))
+    with pytest.raises(TypeError):
+        np.array([1.0]) - t
+
+
+def test_GPSTimeArray_sort(times):
+    """Test sorting, argsort, min, and max."""
+    t = GPSTimeArray.from_gpstimes(times)
+    order = t.argsort()
+    np.testing.assert_array_equal(order, [1, 2, 0, 4, 3])
+
+    assert t.min() == GPSTime(1999, 604799, 999999999999999)
+    assert t.max() == GPSTime(2001, 0, 0)
+
+    s = t.copy()
+    s.sort()
+    assert s.to_gpstimes() == [times[i] for i in order]
+    assert t.to_gpstimes() == times
+
+    with pytest.raises(ValueError):
+        t[:0].min()
+
+
+def test_GPSTimeArray_from_datetime64():
+    """Test that from_datetime64 converts exactly."""
+    rng = np.random.default_rng(0)
+    offsets = rng.integers(-10**15, 10**16, 1000)
+    date_times = np.datetime64("1980-01-06T00:00:00", "us") + offsets.astype(
+        "timedelta64[us]"
+    )
+    t = GPSTimeArray.from_datetime64(date_times)
+    expected = []
+    for offset in offsets.tolist():
+        week_number, microseconds = divmod(offset, 604800 * 10**6)
+        expected.append(
+            GPSTime(week_number, microseconds // 10**6, microseconds % 10**6 * 10**9)
+        )
+    assert t.to_gpstimes() == expected
+    for x, d in zip(t[:10], date_times[:10].astype(datetime.datetime)):
+        assert x.to_datetime().replace(tzinfo=None) == d
+
+    t = GPSTimeArray.from_datetime64(
+        np.array(["1980-01-05T23:59:59.999999999"], dtype="datetime64[ns]")
+    )
+    assert t[0] == GPSTime(-1, 604799, 999999999000000)
+
+    with pytest.raises(TypeError):
+        GPSTimeArray.from_datetime64(np.array([1.0]))
+
+
+def test_GPSTimeArray_concatenate(times):
+    """Test joining arrays."""
+    t = GPSTimeArray.from_gpstimes(times)
+    joined = GPSTimeArray.concatenate([t, t[:2]])
+    assert joined.to_gpstimes() == times + times[:2]
+
+
+def test_GPSTimeArray_repr():
+    """Test the representation."""
+    t = GPSTimeArray([1], [2], [3])
+    assert repr(t) == "GPSTimeArray(week_number=[1], seconds=[2], femtoseconds=[3])"
+
+
+def test_GPSTimeDeltaArray():
+    """Test that GPSTimeDeltaArray matches GPSTimeDelta element by element."""
+    deltas = [
+        GPSTimeDelta(-1, 5),
+        GPSTimeDelta(0, 10**15 // 3),
+        GPSTimeDelta(604800 * 1000, 999999999999999),
+        GPSTimeDelta(-2.25),
+    ]
+    a = GPSTimeDeltaArray.from_deltas(deltas)
+    assert len(a) == 4
+    assert a.to_deltas() == deltas
+    assert list(a[1:3]) == deltas[1:3]
+    np.testing.assert_array_equal(a.total_seconds(), [d.total_seconds() for d in deltas])
+
+    assert (a + a[::-1]).to_deltas() == [x + y for x, y in zip(deltas, deltas[::-1])]
+    assert (a - deltas[1]).to_deltas() == [x - deltas[1] for x in deltas]
+    assert (deltas[1] - a).to_deltas() == [deltas[1] - x for x in deltas]
+    assert (deltas[1] + a).to_deltas() == [deltas[1] + x for x in deltas]
+    assert (-a).to_deltas() == [-x for x in deltas]
+    multipliers = np.array([3, -7, 10**9, 0])
+    assert (a * multipliers).to_deltas() == [
+        x * int(k) for x, k in zip(deltas, multipliers)
+    ]
+    assert (5 * a).to_deltas() == [x * 5 for x in deltas]
+
+    for reference in deltas:
+        np.testing.assert_array_equal(a < reference, [x < reference for x in deltas])
+        np.testing.assert_array_equal(a <= reference, [x <= reference for x in deltas])
+        np.testing.assert_array_equal(a > reference, [x > reference for x in deltas])
+        np.testing.assert_array_equal(a >= reference, [x >= reference for x in deltas])
+        np.testing.assert_array_equal(a == reference, [x == reference for x in deltas])
+        np.testing.assert_array_equal(a != reference, [x != reference for x in deltas])
+
+    t = GPSTime(2000, 0)
+    assert (a + t).to_gpstimes() == [t + x for x in deltas]
+    assert (t + a).to_gpstimes() == [t + x for x in deltas]
+
+    for bad in [1, 1.5, True, "x", np.array([1.0] * 4)]:
+        with pytest.raises(TypeError):
+            a + bad
+        with pytest.raises(TypeError):
+            a - bad
+        with pytest.raises(TypeError):
+            bad - a
+        if not isinstance(bad, (int, np.ndarray)) or isinstance(bad, bool):
+            with pytest.raises(TypeError):
+                a * bad
+    with pytest.raises(TypeError):
+        a * np.array([1.0] * 4)
+    with pytest.raises(TypeError):
+        a < 1
+    assert not np.any(a == 1)
+    assert a != 1
+    with pytest.raises(TypeError):
+        GPSTimeDeltaArray.from_deltas([1])
+    with pytest.raises(ValueError):
+        GPSTimeDeltaArray(np.zeros((2, 2), dtype=np.int64))
+    assert repr(GPSTimeDeltaArray([1], [2])) == (
+        "GPSTimeDeltaArray(seconds=[1], femtoseconds=[2])"
+    )
+
+
+def test_GPSTimeDeltaArray_constructor():
+    """Test the GPSTimeDeltaArray constructor."""
+    a = GPSTimeDeltaArray(np.array([-1.5, 2.25]))
+    assert a.to_deltas() == [GPSTimeDelta(-1.5), GPSTimeDelta(2.25)]
+    a = GPSTimeDeltaArray(np.array([1, 2]))
+    assert a.to_deltas() == [GPSTimeDelta(1), GPSTimeDelta(2)]
+    a = GPSTimeDeltaArray(0, np.array([-1, 10**15]))
+    assert a.to_deltas() == [GPSTimeDelta(0, -1), GPSTimeDelta(1)]
+
+
+def test_GPSTimeDeltaArray_cumsum():
+    """Test that running totals are exact without int64 overflow."""
+    step = GPSTimeDelta(0, 999999999999999)
+    a = GPSTimeDeltaArray(np.zeros(100000, dtype=np.int64), step.femtoseconds)
+    totals = a.cumsum()
+    assert totals[-1] == step * 100000
+    assert totals[12345] == step * 12346
+    assert a.sum() == step * 100000
+    assert a[:0].sum() == GPSTimeDelta()
+
+    deltas = [GPSTimeDelta(-3, 7), GPSTimeDelta(2, 999999999999999), GPSTimeDelta(-1)]
+    assert GPSTimeDeltaArray.from_deltas(deltas).cumsum().to_deltas() == [
+        deltas[0], deltas[0] + deltas[1], deltas[0] + deltas[1] + deltas[2]
+    ]
+
+
+def test_GPSTimeArray_delta(times):
+    """Test exact differences and duration offsets for GPSTimeArray."""
+    t = GPSTimeArray.from_gpstimes(times)
+    reference = GPSTime(1990, 1234, 5678)
+    d = t.delta(reference)
+    assert isinstance(d, GPSTimeDeltaArray)
+    assert d.to_deltas() == [x.delta(reference) for x in times]
+    assert t.delta(t[::-1]).to_deltas() == [
+        x.delta(y) for x, y in zip(times, times[::-1])
+    ]
+    assert (reference + d).to_gpstimes() == times
+    assert (t - d).to_gpstimes() == [reference] * len(times)
+    assert (t + GPSTimeDelta(1.5)).to_gpstimes() == [x + GPSTimeDelta(1.5) for x in times]
+    with pytest.raises(TypeError):
+        t.delta(1)
+
+
+def test_records_round_trip(times, tmp_path):
+    """Test conversion to and from the structured dtype, including files."""
+    records = arrays.gpstimes_to_records(times)
+    assert records.dtype == arrays.GPSTIME_DTYPE
+    assert records.dtype.itemsize == 16
+    assert arrays.records_to_gpstimes(records) == times
+
+    path = tmp_path / "times.npy"
+    np.save(path, records)
+    mapped = np.load(path, mmap_mode="r+")
+    assert arrays.records_to_gpstimes(mapped) == times
+    arrays.gpstime_add(mapped[1:3], 1.5, out=mapped[1:3])
+    mapped.flush()
+    assert arrays.records_to_gpstimes(np.load(path)) == (
+        times[:1] + [x + 1.5 for x in times[1:3]] + times[3:]
+    )
+
+    with pytest.raises(TypeError):
+        GPSTimeArray.from_records(np.zeros(3))
+    with pytest.raises(ValueError):
+        GPSTimeArray([2**31], [0], [0]).to_records()
+    assert len(GPSTimeArray.from_gpstimes([]).to_records()) == 0
+
+
+def test_records_operations(times):
+    """Test that the structured array functions match GPSTimeArray."""
+    t = GPSTimeArray.from_gpstimes(times)
+    records = t.to_records()
+    other = records[::-1]
+
+    assert arrays.records_to_gpstimes(arrays.gpstime_add(records, 2.25)) == (
+        t + 2.25
+    ).to_gpstimes()
+    assert arrays.records_to_gpstimes(arrays.gpstime_subtract(records, 2.25)) == (
+        t - 2.25
+    ).to_gpstimes()
+    np.testing.assert_array_equal(
+        arrays.gpstime_subtract(records, other), t - t[::-1]
+    )
+    np.testing.assert_array_equal(
+        arrays.gpstime_subtract(records, times[0]), t - times[0]
+    )
+    for operator, expected in [
+        ("<", t < t[::-1]),
+        ("<=", t <= t[::-1]),
+        (">", t > t[::-1]),
+        (">=", t >= t[::-1]),
+        ("==", t == t[::-1]),
+        ("!=", t != t[::-1]),
+    ]:
+        np.testing.assert_array_equal(
+            arrays.gpstime_compare(records, other, operator), expected
+        )
+    np.testing.assert_array_equal(
+        arrays.gpstime_compare(records, times[0], "=="), t == times[0]
+    )
+    with pytest.raises(ValueError):
+        arrays.gpstime_compare(records, other, "<>")
+
+    assert arrays.gpstime_min(records) == t.min()
+    assert arrays.gpstime_max(records) == t.max()
+    np.testing.assert_array_equal(arrays.gpstime_argsort(records), t.argsort())
@@ -0,0 +1,151 @@
+import pytest
+
+import sys
+import numpy as np
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+from gps_time.core import GPSTime
+from gps_time.arrays import GPSTimeArray
+from gps_time import arrow
+from gps_time.arrow import (
+    gpstime_type,
+    to_arrow,
+    from_arrow,
+    time_filter,
+    write_parquet,
+    read_parquet,
+    scan_parquet,
+)
+
+
+@pytest.fixture
+def times():
+    """100 weeks of times, 1000 per week, in order."""
+    return GPSTimeArray(
+        np.arange(2000, 2100).repeat(1000), np.tile(np.arange(1000) * 600, 100), 7
+    )
+
+
+@pytest.fixture
+def parquet_file(tmp_path, times):
+    """A Parquet file of the times and their indices, in row groups of 10 weeks."""
+    path = tmp_path / "times.parquet"
+    write_parquet(
+        path, times, table=pa.table({"index": np.arange(len(times))}), row_group_size=10000
+    )
+    return path
+
+
+def test_to_arrow(times):
+    """Test that the conversion shares memory and is lossless."""
+    array = to_arrow(times)
+    assert array.type == gpstime_type()
+    assert len(array) == len(times)
+    for name in ("week_number", "seconds", "femtoseconds"):
+        assert np.shares_memory(array.field(name).to_numpy(), getattr(times, name))
+
+    result = from_arrow(array)
+    assert (result == times).all()
+    assert np.shares_memory(result.femtoseconds, times.femtoseconds)
+    assert not result.week_number.flags.writeable
+    result.copy().sort()
+
+    # Slices keep their offset and strided views are copied
+    assert (from_arrow(array[5:9]) == times[5:9]).all()
+    assert (from_arrow(to_arrow(times[::7])) == times[::7]).all()
+
+
+def test_from_arrow_conversions():
+    """Test struct arrays that must be copied."""
+    # Fields in another order, of other types, with other fields, and not
+    # normalized
+    array = pa.StructArray.from_arrays(
+        [
+            pa.array([604800, -1], type=pa.int32()),
+            pa.array([1, 2], type=pa.int32()),
+            pa.array([10**15, 5], type=pa.int64()),
+            pa.array(["a", "b"]),
+        ],
+        names=["seconds", "week_number", "femtoseconds", "other"],
+    )
+    result = from_arrow(array)
+    assert result.to_gpstimes() == [GPSTime(2, 1, 0), GPSTime(1, 604799, 5)]
+
+    chunked = pa.chunked_array([to_arrow(result[:1]), to_arrow(result[1:])])
+    assert (from_arrow(chunked) == result).all()
+    assert (from_arrow(pa.chunked_array([to_arrow(result)])) == result).all()
+    assert len(from_arrow(pa.chunked_array([], type=gpstime_type()))) == 0
+
+
+def test_from_arrow_errors():
+    """Test arrays that are not GPS times."""
+    with pytest.raises(TypeError):
+        from_arrow(pa.array([1, 2]))
+    with pytest.raises(TypeError):
+        from_arrow(pa.array([{"week_number": 1, "seconds": 2}]))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([{"week_number": 1, "seconds": 2, "femtoseconds": 3}, None]))
+    with pytest.raises(ValueError):
+        from_arrow(pa.array([{"week_number": 1, "seconds": None, "femtoseconds": 3}]))
+
+
+def test_import_error(monkeypatch):
+    """Test the message when pyarrow is not installed."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="gps_time\\[arrow\\]"):
+        arrow.gpstime_type()
+
+
+def test_read_parquet(parquet_file, times):
+    """Test reading a range of times."""
+    start, stop = GPSTime(2050, 600, 7), GPSTime(2052, 0)
+    table = read_parquet(parquet_file, start=start, stop=stop)
+    expected = (times >= start) & (times < stop)
+    np.testing.assert_array_equal(table["index"].to_numpy(), np.flatnonzero(expected))
+    assert (from_arrow(table["time"]) == times[expected]).all()
+
+    # The bounds are exact to the femtosecond
+    assert read_parquet(parquet_file, start=GPSTime(2050, 600, 8), stop=stop).num_rows == 1998
+    assert read_parquet(parquet_file, stop=GPSTime(2000, 600, 8)).num_rows == 2
+    assert read_parquet(parquet_file, start=GPSTime(2099, 599400, 7)).num_rows == 1
+
+    # Projection, other filters, and whole files
+    table = read_parquet(
+        parquet_file, columns=["index"], start=start, filter=ds.field("index") < 51000
+    )
+    assert table.column_names == ["index"]
+    assert table.num_rows == 999
+    assert read_parquet(parquet_file, filter=ds.field("index") < 10).num_rows == 10
+    assert read_parquet(ds.dataset(parquet_file)).num_rows == len(times)
+
+
+def test_time_filter_pushdown(parquet_file):
+    """Test that row groups outside of the range are skipped."""
+    fragment = next(ds.dataset(parquet_file).get_fragments())
+    assert len(fragment.split_by_row_group()) == 10
+    expression = time_filter("time", GPSTime(2050, 600), GPSTime(2052, 0))
+    assert len(fragment.split_by_row_group(expression)) == 1
+    assert len(fragment.split_by_row_group(time_filter("time", GPSTime(2095, 0)))) == 1
+    assert len(fragment.split_by_row_group(time_filter())) == 10
+
+
+def test_scan_parquet(parquet_file, times):
+    """Test scanning in batches."""
+    batches = list(scan_parquet(parquet_file, start=GPSTime(2098, 0), batch_size=300))
+    assert all(batch.num_rows <= 300 for batch in batches)
+    scanned = GPSTimeArray.concatenate(from_arrow(batch["time"]) for batch in batches)
+    assert (scanned == times[-2000:]).all()
+
+
+def test_write_parquet(tmp_path, times):
+    """Test writing only times, and mismatched tables."""
+    path = tmp_path / "times.parquet"
+    write_parquet(path, times[::3], column="epoch")
+    table = read_parquet(path, column="epoch", stop=GPSTime(2001, 0))
+    assert table.column_names == ["epoch"]
+    assert (from_arrow(table["epoch"]) == times[:1000:3]).all()
+
+    with pytest.raises(ValueError):
+        write_parquet(path, times, table=pa.table({"index": [1, 2]}))
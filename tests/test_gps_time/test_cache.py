@@ -0,0 +1,174 @@
+import pytest
+
+import datetime
+
+from concurrent.futures import ThreadPoolExecutor
+
+from gps_time import cache
+from gps_time.core import GPSTime
+from gps_time.leapseconds import LeapSeconds, gps2utc
+
+
+@pytest.fixture
+def enabled():
+    """Enable the caches for the test."""
+    cache.enable_cache()
+    yield
+    cache.disable_cache()
+
+
+def test_cache_disabled():
+    """Test that nothing is cached by default."""
+    assert not cache.cache_enabled()
+    GPSTime.from_datetime(datetime.datetime(2020, 1, 1))
+    assert cache.cache_info()["from_datetime"] == cache.CacheInfo(0, 0, 0, 0)
+    cache.clear_cache()
+
+
+def test_cache_from_datetime(enabled):
+    """Test caching GPSTime.from_datetime."""
+    assert cache.cache_enabled()
+    d = datetime.datetime(2020, 1, 1, 12, 30, 15, 123456)
+    first = GPSTime.from_datetime(d)
+    second = GPSTime.from_datetime(d)
+    assert first == second
+    assert cache.cache_info()["from_datetime"] == cache.CacheInfo(1, 1, 4096, 1)
+
+    # A new GPSTime is returned each time, so changing one has no effect
+    assert first is not second
+    first.seconds += 1
+    assert GPSTime.from_datetime(d) == second
+
+    # Equal instants in different time zones give the same time
+    eastern = datetime.timezone(datetime.timedelta(hours=-5))
+    aware = d.replace(tzinfo=datetime.timezone.utc)
+    assert GPSTime.from_datetime(aware.astimezone(eastern)) == GPSTime.from_datetime(aware) == second
+
+    # Subclasses of datetime are not cached
+    class SubDatetime(datetime.datetime):
+        pass
+    info = cache.cache_info()["from_datetime"]
+    assert GPSTime.from_datetime(SubDatetime(2020, 1, 1, 12, 30, 15, 123456)) == second
+    assert cache.cache_info()["from_datetime"] == info
+
+    with pytest.raises(TypeError):
+        GPSTime.from_datetime("2020-01-01")
+
+
+def test_cache_from_datetime_fold(enabled):
+    """Test that the repeated hour at the end of daylight saving time is cached by instant."""
+    zoneinfo = pytest.importorskip("zoneinfo")
+    try:
+        new_york = zoneinfo.ZoneInfo("America/New_York")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("time zone data is not available")
+    first = datetime.datetime(2021, 11, 7, 1, 30, tzinfo=new_york)
+    second = first.replace(fold=1)
+    assert first == second
+
+    expected = [GPSTime(2183, 19800), GPSTime(2183, 23400)]
+    assert [GPSTime.from_datetime(d) for d in (first, second)] == expected
+    assert [GPSTime.from_datetime(d) for d in (second, first)] == expected[::-1]
+    cache.disable_cache()
+    assert [GPSTime.from_datetime(d) for d in (first, second)] == expected
+
+
+def test_cache_to_datetime(enabled):
+    """Test caching GPSTime.to_datetime."""
+    t = GPSTime(2086, 123456, 789000000000)
+    expected = t.to_datetime()
+    assert t.to_datetime() == expected
+    assert cache.cache_info()["to_datetime"].hits == 1
+
+    # The key is the value of the GPSTime, not the object
+    t.seconds += 1
+    assert t.to_datetime() == expected + datetime.timedelta(seconds=1)
+    assert cache.cache_info()["to_datetime"].misses == 2
+
+
+def test_cache_gps2utc(enabled):
+    """Test caching gps2utc and clearing it when the leap seconds change."""
+    t = GPSTime(2086, 123456)
+    expected = gps2utc(t)
+    assert gps2utc(GPSTime(2086, 123456)) == expected
+    assert gps2utc(t.to_datetime()) == expected
+    assert cache.cache_info()["gps2utc"] == cache.CacheInfo(2, 1, 4096, 1)
+
+    LeapSeconds.reset()
+    assert cache.cache_info()["gps2utc"] == cache.CacheInfo(0, 0, 4096, 0)
+    assert gps2utc(t) == expected
+
+
+def test_cache_matches_uncached(enabled):
+    """Test that cached results are identical to uncached ones."""
+    date_times = [
+        datetime.datetime(2016, 12, 31, 23, 59, 59, 999999) + datetime.timedelta(microseconds=7 * i)
+        for i in range(-300, 300)
+    ]
+    cached = [GPSTime.from_datetime(d) for d in date_times * 2]
+    cached_utc = [gps2utc(t) for t in cached]
+    cached_datetimes = [t.to_datetime() for t in cached]
+    cache.disable_cache()
+    assert cached == [GPSTime.from_datetime(d) for d in date_times * 2]
+    assert cached_utc == [gps2utc(t) for t in cached]
+    assert cached_datetimes == [t.to_datetime() for t in cached]
+
+
+def test_cache_eviction():
+    """Test that the least recently used results are evicted."""
+    cache.enable_cache(maxsize=2)
+    try:
+        days = [datetime.datetime(2020, 1, day) for day in (1, 2, 1, 3, 2)]
+        for d in days:
+            GPSTime.from_datetime(d)
+        # Day 2 is evicted by day 3, as day 1 was used more recently
+        assert cache.cache_info()["from_datetime"] == cache.CacheInfo(1, 4, 2, 2)
+    finally:
+        cache.disable_cache()
+
+
+def test_cache_clear(enabled):
+    """Test emptying all or one of the caches."""
+    t = GPSTime.from_datetime(datetime.datetime(2020, 1, 1))
+    t.to_datetime()
+    cache.clear_cache("to_datetime")
+    assert cache.cache_info()["from_datetime"].currsize == 1
+    assert cache.cache_info()["to_datetime"].currsize == 0
+    cache.clear_cache()
+    assert cache.cache_info()["from_datetime"] == cache.CacheInfo(0, 0, 4096, 0)
+
+    # Enabling the caches again replaces them
+    GPSTime.from_datetime(datetime.datetime(2020, 1, 1))
+    cache.enable_cache(maxsize=10)
+    assert cache.cache_info()["from_datetime"] == cache.CacheInfo(0, 0, 10, 0)
+
+
+def test_cache_threads(enabled):
+    """Test using the caches from several threads."""
+    date_times = [datetime.datetime(2020, 1, 1, 0, 0, i % 50) for i in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        times = list(executor.map(GPSTime.from_datetime, date_times))
+    info = cache.cache_info()["from_datetime"]
+    assert info.hits + info.misses == 2000
+    assert info.currsize == 50
+    cache.disable_cache()
+    assert times == [GPSTime.from_datetime(d) for d in date_times]
+
+
+def test_enable_cache_error():
+    """Test that the cache size must be positive."""
+    with pytest.raises(ValueError):
+        cache.enable_cache(maxsize=0)
+    assert not cache.cache_enabled()
+
+
+def test_memoize_while_enabled(enabled):
+    """Test registering a conversion while the caches are enabled."""
+    memo = cache._memoize("square", lambda x: x * x)
+    try:
+        assert memo.cached(3) == 9
+        assert cache.cache_info()["square"] == cache.CacheInfo(0, 1, 4096, 1)
+        cache.disable_cache()
+        assert memo.cached is None
+    finally:
+        del cache._memos["square"]
@@ -4,7 +4,7 @@ import datetime
 import numpy as np
 import ruamel.yaml
 
-from gps_time.core import GPSTime
+from gps_time.core import GPSTime, GPSTimeDelta
 from gps_time.datetime import datetime2tow
 
 
@@ -530,4 +530,147 @@ def test_has_repr():
 
 def test_has_hash():
     """Test __hash__ method."""
-    GPSTime(2080, 604800).__hash__()
\ No newline at end of file
+    GPSTime(2080, 604800).__hash__()
+
+def test_GPSTimeDelta_constructor():
+    """Test the GPSTimeDelta constructor.
+
+    Verifies that femtoseconds are carried into the seconds and that only the
+    seconds are negative.
+    """
+    d = GPSTimeDelta(5, 1500000000000000)
+    assert (d.seconds, d.femtoseconds) == (6, 500000000000000)
+    d = GPSTimeDelta(0, -1)
+    assert (d.seconds, d.femtoseconds) == (-1, 999999999999999)
+    d = GPSTimeDelta(-1.5)
+    assert (d.seconds, d.femtoseconds) == (-2, 500000000000000)
+    assert GPSTimeDelta() == GPSTimeDelta(0, 0)
+    assert not GPSTimeDelta()
+    assert GPSTimeDelta(0, 1)
+
+    d = GPSTimeDelta.from_timedelta(datetime.timedelta(days=-1, microseconds=3))
+    assert (d.seconds, d.femtoseconds) == (-86400, 3000000000)
+    assert d.to_timedelta() == datetime.timedelta(days=-1, microseconds=3)
+    assert GPSTimeDelta(0, 1500000000).to_timedelta() == datetime.timedelta(
+        microseconds=2
+    )
+    assert GPSTimeDelta(1, 5).total_femtoseconds() == 1000000000000005
+    assert GPSTimeDelta(-1.5).total_seconds() == -1.5
+    assert repr(GPSTimeDelta(1, 2)) == "GPSTimeDelta(seconds=1, femtoseconds=2)"
+
+
+def test_GPSTimeDelta_arithmetic():
+    """Test that GPSTimeDelta arithmetic is exact."""
+    step = GPSTimeDelta(0, 10**15 // 3)
+    total = GPSTimeDelta()
+    for _ in range(30000):
+        total += step
+    assert total == step * 30000
+    assert total == 30000 * step
+    assert total == GPSTimeDelta(9999, 999999999990000)
+
+    assert step - total == -(total - step)
+    assert abs(step - total) == total - step
+    assert abs(step) == +step
+    assert datetime.timedelta(seconds=1) + step == GPSTimeDelta(1, 10**15 // 3)
+    assert step + datetime.timedelta(seconds=1) == GPSTimeDelta(1, 10**15 // 3)
+    assert datetime.timedelta(seconds=1) - step == GPSTimeDelta(0, 10**15 - 10**15 // 3)
+    assert step - datetime.timedelta(seconds=1) == GPSTimeDelta(-1, 10**15 // 3)
+
+    assert GPSTimeDelta(3) * 0.5 == GPSTimeDelta(1.5)
+    assert GPSTimeDelta(1) / 3 == GPSTimeDelta(0, 333333333333333)
+    assert GPSTimeDelta(2) / 3 == GPSTimeDelta(0, 666666666666667)
+    assert GPSTimeDelta(3) / GPSTimeDelta(2) == 1.5
+    assert GPSTimeDelta(3) // GPSTimeDelta(2) == 1
+    assert GPSTimeDelta(3) // 2 == GPSTimeDelta(1.5)
+    assert GPSTimeDelta(3) % GPSTimeDelta(2) == GPSTimeDelta(1)
+
+    for bad in [True, "1", None]:
+        with pytest.raises(TypeError):
+            step * bad
+        with pytest.raises(TypeError):
+            step / bad
+        with pytest.raises(TypeError):
+            step // bad
+        with pytest.raises(TypeError):
+            step + bad
+        with pytest.raises(TypeError):
+            step - bad
+        with pytest.raises(TypeError):
+            bad - step
+        with pytest.raises(TypeError):
+            step % bad
+    with pytest.raises(ZeroDivisionError):
+        step / 0
+
+
+def test_GPSTimeDelta_comparisons():
+    """Test GPSTimeDelta comparisons and hashing."""
+    a = GPSTimeDelta(-1, 5)
+    b = GPSTimeDelta(-1, 6)
+    assert a < b and a <= b and b > a and b >= a and a != b
+    assert a == GPSTimeDelta(-1, 5)
+    assert hash(a) == hash(GPSTimeDelta(-1, 5))
+    assert GPSTimeDelta(1) == datetime.timedelta(seconds=1)
+    assert GPSTimeDelta(1) < datetime.timedelta(seconds=1.5)
+    assert sorted([b, a]) == [a, b]
+    for operator in ("<", "<=", ">", ">="):
+        with pytest.raises(TypeError, match="'{}' not supported".format(operator)):
+            eval("a {} 1".format(operator))
+    assert not a == 1 and a != 1
+    assert a != None  # noqa: E711
+
+
+def test_GPSTimeDelta_hash_timedelta():
+    """Test that GPSTimeDeltas hash like the timedeltas they equal."""
+    for delta in [
+        datetime.timedelta(seconds=1),
+        datetime.timedelta(seconds=-1, microseconds=5),
+        datetime.timedelta(days=-3, microseconds=999999),
+        datetime.timedelta(0),
+    ]:
+        d = GPSTimeDelta.from_timedelta(delta)
+        assert d == delta and hash(d) == hash(delta)
+    assert len({GPSTimeDelta(1), datetime.timedelta(seconds=1)}) == 1
+    assert {datetime.timedelta(seconds=2): "a"}[GPSTimeDelta(2)] == "a"
+
+    # Not a whole number of microseconds, or longer than any timedelta
+    assert hash(GPSTimeDelta(-1, 5)) == hash((-1, 5))
+    long = GPSTimeDelta(10 ** 15)
+    assert hash(long) == hash((10 ** 15, 0)) and long == GPSTimeDelta(10 ** 15)
+
+
+def test_GPSTime_delta():
+    """Test exact differences and offsets between GPSTimes."""
+    t1 = GPSTime(2000, 5, 1)
+    t2 = GPSTime(1000, 604799, 999999999999999)
+    d = t1.delta(t2)
+    assert d == GPSTimeDelta(1000 * 604800 - 604795, 2)
+    assert t2.delta(t1) == -d
+    assert t2 + d == t1
+    assert d + t2 == t1
+    assert t1 - d == t2
+    with pytest.raises(TypeError):
+        t1.delta(datetime.datetime(2020, 1, 1))
+
+
+def test_GPSTime_bytes():
+    """Test the binary wire format of a GPSTime."""
+    t = GPSTime(2100, 604799, 999999999999999)
+    data = t.to_bytes()
+    assert len(data) == 14
+    assert data[:2] == (2100).to_bytes(2, "little")
+    assert GPSTime.from_bytes(data) == t
+    assert GPSTime.from_bytes(memoryview(bytearray(data))) == t
+    assert GPSTime.from_bytes(GPSTime(0, 0).to_bytes()) == GPSTime(0, 0)
+
+    with pytest.raises(ValueError):
+        GPSTime(65536, 0).to_bytes()
+    with pytest.raises(ValueError):
+        GPSTime(-1, 0).to_bytes()
+    with pytest.raises(ValueError):
+        GPSTime.from_bytes(data[:13])
+    with pytest.raises(ValueError):
+        GPSTime.from_bytes(data[:2] + (604800).to_bytes(4, "little") + data[6:])
+    with pytest.raises(ValueError):
+        GPSTime.from_bytes(data[:6] + (10**15).to_bytes(8, "little"))
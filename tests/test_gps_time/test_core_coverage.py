@@ -1,6 +1,6 @@
 import pytest
 import ruamel.yaml
-from gps_time.core import GPSTime
+from gps_time.core import GPSTime, GPSTimeDelta
 from io import StringIO
 
 def test_gpstime_constructor_errors():
@@ -103,3 +103,127 @@ def test_correct_weeks_valid_deprecated():
     t.correct_weeks() # Should do nothing
     assert t.week_number == 100
     assert t.time_of_week == 100.0
+
+def test_gpstime_slots():
+    """Test that GPSTime is slotted and keeps yaml_tag on the class only."""
+    t = GPSTime(100, 200, 300)
+    assert not hasattr(t, "__dict__")
+    assert t.yaml_tag == "!GPSTime"
+    with pytest.raises(AttributeError):
+        t.other = 1
+
+def test_gpstime_fast_constructor_results():
+    """Test that arithmetic results are normalized like the constructor."""
+    t = GPSTime(100, 604799, 999999999999999)
+    assert (t + 1e-15).__getstate__() == GPSTime(101, 0, 0).__getstate__()
+    assert (t - 604800.0).__getstate__() == GPSTime(99, 604799, 999999999999999).__getstate__()
+    t = GPSTime(0, 0) - 1
+    assert (t.week_number, t.seconds, t.femtoseconds) == (-1, 604799, 0)
+
+def test_gpstime_pickle():
+    """Test pickling, including states written before GPSTime used slots."""
+    import pickle
+    t = GPSTime(2290, 123456, 789)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(t, protocol=protocol))
+        assert loaded == t
+        assert loaded.femtoseconds == 789
+
+    legacy = GPSTime.__new__(GPSTime)
+    legacy.__setstate__(
+        {"yaml_tag": "!GPSTime", "week_number": 1, "seconds": 2, "femtoseconds": 3}
+    )
+    assert legacy == GPSTime(1, 2, 3)
+
+    # Only the class and the three integers are written
+    assert b"week_number" not in pickle.dumps(t)
+    assert len(pickle.dumps([t, GPSTime(2290, 1)])) - len(pickle.dumps([t])) < 20
+
+    # Pickles written before GPSTime defined __reduce__
+    for data in [
+        b'\x80\x02cgps_time.core\nGPSTime\nq\x00)\x81q\x01}q\x02(X\x0b\x00\x00\x00week_numberq\x03M\xf2'
+        b'\x08X\x07\x00\x00\x00secondsq\x04J@\xe2\x01\x00X\x0c\x00\x00\x00femtosecondsq\x05M\x15\x03ub.',
+        b'\x80\x05\x95W\x00\x00\x00\x00\x00\x00\x00\x8c\rgps_time.core\x94\x8c\x07GPSTime\x94\x93\x94)\x81'
+        b'\x94}\x94(\x8c\x0bweek_number\x94M\xf2\x08\x8c\x07seconds\x94J@\xe2\x01\x00\x8c\x0cfemtoseconds'
+        b'\x94M\x15\x03ub.',
+    ]:
+        assert pickle.loads(data) == t
+
+def test_gpstime_yaml_dump_state():
+    """Test that YAML output holds only the three time fields."""
+    yaml = ruamel.yaml.YAML()
+    yaml.register_class(GPSTime)
+    stream = StringIO()
+    yaml.dump(GPSTime(2290, 123456, 789), stream)
+    assert "yaml_tag" not in stream.getvalue()
+    assert yaml.load(stream.getvalue()) == GPSTime(2290, 123456, 789)
+
+    legacy = """
+    !GPSTime
+    yaml_tag: '!GPSTime'
+    week_number: 2290
+    seconds: 123456
+    femtoseconds: 789
+    """
+    assert yaml.load(legacy) == GPSTime(2290, 123456, 789)
+
+def test_gpstime_negative_week():
+    """Test that negative week numbers are allowed (with a warning)."""
+    t = GPSTime(-1, 0)
+    assert t.week_number == -1
+
+def test_gpstime_comparisons_femtosecond():
+    """Test that comparisons and hashing are exact at femtosecond precision."""
+    import datetime
+    a = GPSTime(3000, 604799, 999999999999998)
+    b = GPSTime(3000, 604799, 999999999999999)
+    assert a < b and a <= b and b > a and b >= a and a != b
+    assert not (a > b or a >= b or b < a or b <= a or a == b)
+    assert a == GPSTime(3000, 604799, 999999999999998)
+    assert hash(a) == hash(GPSTime(3000, 604799, 999999999999998))
+    assert len({a, b, GPSTime(3001, 0, 0) - 2e-15}) == 2
+    assert sorted([b, a, GPSTime(2999, 0, 0)]) == [GPSTime(2999, 0, 0), a, b]
+
+    dt = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    t = GPSTime.from_datetime(dt)
+    assert t == dt and t <= dt and t >= dt and not (t < dt or t > dt)
+
+    for operator in ("<", "<=", ">", ">=", "=="):
+        with pytest.raises(TypeError, match="'{}' not supported".format(operator)):
+            eval("a {} 1".format(operator))
+
+def test_gpstimedelta_pickle():
+    """Test pickling GPSTimeDelta with every protocol."""
+    import pickle
+    d = GPSTimeDelta(-5, 789)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        loaded = pickle.loads(pickle.dumps(d, protocol=protocol))
+        assert loaded == d
+        assert loaded.femtoseconds == 789
+
+def test_import_does_not_load_numpy_or_yaml():
+    """Test that scalar GPSTime use does not import numpy or ruamel.yaml."""
+    import subprocess
+    import sys
+    code = (
+        "import sys, datetime, gps_time, gps_time.leapseconds\n"
+        "t = gps_time.GPSTime(2000, 5) + 1.5\n"
+        "t - t, t - datetime.timedelta(seconds=1), t.to_datetime()\n"
+        "gps_time.leapseconds.gps2utc(t)\n"
+        "assert 'numpy' not in sys.modules\n"
+        "assert 'ruamel.yaml' not in sys.modules\n"
+        "assert gps_time.GPSTimeArray.__name__ == 'GPSTimeArray'\n"
+        "assert 'numpy' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_package_attributes():
+    """Test the lazily imported package attributes."""
+    import gps_time
+    from gps_time.arrays import GPSTimeArray, GPSTimeDeltaArray
+    assert gps_time.GPSTimeArray is GPSTimeArray
+    assert gps_time.GPSTimeDeltaArray is GPSTimeDeltaArray
+    assert "GPSTimeArray" in dir(gps_time)
+    with pytest.raises(AttributeError):
+        gps_time.NotAnAttribute
@@ -141,4 +141,438 @@ def test_zcount2datetime():
     zcount = time.zcount2datetime(0, 4, 1980)
     assert zcount == date + datetime.timedelta(seconds=6)
     zcount = time.zcount2datetime(0, 604800 / 1.5, 1980)
-    assert zcount == date + datetime.timedelta(seconds=604800)
\ No newline at end of file
+    assert zcount == date + datetime.timedelta(seconds=604800)
+
+def _random_datetime64(size: int, seed: int = 0) -> np.ndarray:
+    """Random microsecond datetimes between 1975 and 2100."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("1975-01-01T00:00:00", "us").astype(np.int64)
+    stop = np.datetime64("2100-01-01T00:00:00", "us").astype(np.int64)
+    return rng.integers(start, stop, size).astype("datetime64[us]")
+
+
+def test_datetime2tow_array():
+    """Test that datetime2tow_array matches datetime2tow element by element."""
+    date_times = _random_datetime64(2000)
+    week_num, tow = time.datetime2tow_array(date_times)
+    assert week_num.dtype == np.int64
+    assert tow.dtype == np.float64
+    for d, w, t in zip(date_times.astype(datetime.datetime), week_num, tow):
+        assert time.datetime2tow(d) == (w, t)
+
+    # Other units agree for the same instants
+    week_ns, tow_ns = time.datetime2tow_array(date_times.astype("datetime64[ns]"))
+    np.testing.assert_array_equal(week_ns, week_num)
+    np.testing.assert_array_equal(tow_ns, tow)
+    week_m, tow_m = time.datetime2tow_array(date_times.astype("datetime64[m]"))
+    np.testing.assert_array_equal(tow_m % 60, np.zeros_like(tow_m))
+    near_1970 = np.array(["1970-01-01T00:00:01.25"], dtype="datetime64[us]")
+    week_ps, tow_ps = time.datetime2tow_array(near_1970.astype("datetime64[ps]"))
+    assert (week_ps, tow_ps) == time.datetime2tow_array(near_1970)
+
+    week_num, tow = time.datetime2tow_array(
+        np.array(["1980-01-06", "1980-01-05T23:59:59.5"], dtype="datetime64[ns]")
+    )
+    np.testing.assert_array_equal(week_num, [0, -1])
+    np.testing.assert_array_equal(tow, [0, 604799.5])
+
+    with pytest.raises(TypeError):
+        time.datetime2tow_array(np.array([1, 2, 3]))
+
+
+def test_datetime64_nat():
+    """Test that converting NaT raises rather than giving an arbitrary time."""
+    from gps_time import GPSTimeArray
+    from gps_time.leapseconds import gps2utc_array, utc2gps_array
+    for date_times in [
+        np.array(["2020-01-01", "NaT"], dtype="datetime64[ns]"),
+        np.array(["NaT"], dtype="datetime64[D]"),
+        np.datetime64("NaT", "us"),
+    ]:
+        for function in [
+            time.datetime2tow_array,
+            time.datetime2zcount_array,
+            lambda d: time.datetime2zcount_array(d, integer=True),
+            GPSTimeArray.from_datetime64,
+            gps2utc_array,
+            utc2gps_array,
+        ]:
+            with pytest.raises(ValueError, match="NaT"):
+                function(date_times)
+
+
+def test_tow2datetime_array():
+    """Test that tow2datetime_array matches tow2datetime element by element."""
+    rng = np.random.default_rng(1)
+    week_num = rng.integers(-200, 5000, 2000)
+    tow = rng.uniform(0, 604800, 2000)
+    # Include values that are exactly halfway between microseconds
+    tow[:4] = [0.0000005, 0.0000015, 12.5000025, 604799.9999995]
+    date_times = time.tow2datetime_array(week_num, tow)
+    assert date_times.dtype == np.dtype("datetime64[us]")
+    for d, w, t in zip(date_times.astype(datetime.datetime), week_num, tow):
+        assert d.replace(tzinfo=datetime.timezone.utc) == time.tow2datetime(int(w), float(t))
+
+    # Round trip
+    tow = np.round(tow[4:], 6)
+    week_out, tow_out = time.datetime2tow_array(time.tow2datetime_array(week_num[4:], tow))
+    np.testing.assert_array_equal(week_out, week_num[4:])
+    np.testing.assert_allclose(tow_out, tow, rtol=0, atol=1e-9)
+
+    # Scalars are broadcast
+    np.testing.assert_array_equal(
+        time.tow2datetime_array(0, [0.0, 1.5]),
+        np.array(["1980-01-06T00:00:00", "1980-01-06T00:00:01.5"], dtype="datetime64[us]"),
+    )
+
+
+def test_correct_week_array():
+    """Test that correct_week_array matches correct_week element by element."""
+    rng = np.random.default_rng(2)
+    week_num = rng.integers(0, 1024, 2000)
+    tow = rng.uniform(0, 604800, 2000)
+    year = rng.integers(1978, 2100, 2000)
+    full_week, bad = time.correct_week_array(week_num, tow, year)
+    assert bad.any() and not bad.all()
+    for f, b, w, t, y in zip(full_week, bad, week_num, tow, year):
+        try:
+            expected = time.correct_week(int(w), float(t), int(y))
+        except ValueError:
+            assert b
+            assert f == w
+        else:
+            assert not b
+            assert f == expected
+
+
+def test_correct_week_array_cnav():
+    """Test correct_week_array with mod 8192 week numbers."""
+    full_week, bad = time.correct_week_array(
+        [0, 10, 10, 8191, 100], [0.0, 0.0, 0.0, 604799.0, 0.0], [2137, 1980, 2137, 2137, 1979]
+    )
+    np.testing.assert_array_equal(full_week, [8192, 10, 8202, 8191, 100])
+    np.testing.assert_array_equal(bad, [False, False, False, False, True])
+
+    # Week 8191 ends in 2137, so 2138 is 8192 weeks too late
+    full_week, bad = time.correct_week_array(8191, 604799.0, 2138, rollover=8192)
+    assert bad
+
+    # The mod 1024 rollover gives a different week for the same input
+    full_week, bad = time.correct_week_array(10, 0.0, 2137, rollover=1024)
+    assert full_week == 10 + 1024 * 8 and not bad
+
+
+@pytest.mark.parametrize("year,rollover", [
+    (np.array([2020.0]), 1024),
+    (np.array([True]), 1024),
+    (np.array(["2020"]), 1024),
+    (np.array([2020]), 4096),
+])
+def test_correct_week_array_errors(year, rollover):
+    """Test the argument checks of correct_week_array."""
+    with pytest.raises(ValueError):
+        time.correct_week_array([0], [0.0], year, rollover)
+
+
+def test_tow2datetime_array_year():
+    """Test tow2datetime_array with truncated week numbers."""
+    date_times = time.tow2datetime_array([100, 100, 0], [0.0, 1.5, 0.0], 2021)
+    np.testing.assert_array_equal(
+        date_times,
+        np.array(["2021-03-07T00:00:00", "2021-03-07T00:00:01.5", "NaT"], dtype="datetime64[us]"),
+    )
+    assert date_times[0].astype(datetime.datetime) == time.tow2datetime(100, 0.0, 2021).replace(tzinfo=None)
+
+    np.testing.assert_array_equal(
+        time.tow2datetime_array([2209], [0.0], [2022], rollover=8192),
+        np.array(["2022-05-08"], dtype="datetime64[us]"),
+    )
+
+
+def test_array_time_difference_datetime64():
+    """Test that the datetime64 paths match those for datetime objects."""
+    date_times1 = _random_datetime64(2000)
+    date_times2 = date_times1[::-1].copy()
+    objects1 = date_times1.astype(datetime.datetime)
+    objects2 = date_times2.astype(datetime.datetime)
+    expected = time.array_time_difference(objects1, objects2)
+    np.testing.assert_array_equal(time.array_time_difference(date_times1, date_times2), expected)
+    np.testing.assert_allclose(
+        time.array_time_difference(date_times1.astype("datetime64[ns]"), date_times2), expected,
+        rtol=1e-15,
+    )
+
+    # A datetime is converted to UTC
+    d = datetime.datetime(2020, 3, 1, 1, 2, 3, 456789)
+    eastern = datetime.timezone(datetime.timedelta(hours=-5))
+    aware = d.replace(tzinfo=datetime.timezone.utc).astimezone(eastern)
+    np.testing.assert_array_equal(time.diff_seconds(d, date_times1), time.diff_seconds(d, objects1))
+    np.testing.assert_array_equal(
+        time.array_time_difference(date_times1, aware), time.array_time_difference(objects1, d)
+    )
+
+    # Coarse and fine units, and NaT
+    np.testing.assert_array_equal(
+        time.array_time_difference(
+            np.array(["2020-01-02", "NaT"], dtype="datetime64[D]"), np.datetime64("2020-01-01", "D")
+        ),
+        [86400.0, np.nan],
+    )
+    assert time.array_time_difference(
+        np.array(["2020-01-01T00:00:01"], dtype="datetime64[ps]"),
+        np.datetime64("2020-01-01", "ps"),
+    ) == [1.0]
+
+    with pytest.raises(TypeError):
+        time.array_time_difference(date_times1, [d])
+
+
+def test_subtract_timedelta_datetime64():
+    """Test that the datetime64 paths match those for datetime objects."""
+    date_times = _random_datetime64(2000)
+    objects = date_times.astype(datetime.datetime)
+    rng = np.random.default_rng(2)
+    deltas = np.concatenate([rng.normal(0, 1e6, 1998), [0.0000005, 0.0000015]])
+
+    result = time.subtract_timedelta(date_times, deltas)
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert result.astype(datetime.datetime).tolist() == time.subtract_timedelta(objects, deltas).tolist()
+    np.testing.assert_array_equal(
+        time.subtract_timedelta(date_times, deltas.astype("timedelta64[s]")),
+        date_times - deltas.astype("timedelta64[s]"),
+    )
+    np.testing.assert_array_equal(
+        time.subtract_timedelta_as_tow(date_times, deltas),
+        time.subtract_timedelta_as_tow(objects, deltas),
+    )
+
+
+def test_datetime_functions_gpstime_array():
+    """Test the datetime functions with GPSTimeArray inputs."""
+    from gps_time.arrays import GPSTimeArray
+
+    date_times = _random_datetime64(100)
+    times1 = GPSTimeArray.from_datetime64(date_times)
+    times2 = GPSTimeArray.from_datetime64(date_times[::-1])
+    expected = time.array_time_difference(date_times, date_times[::-1])
+    np.testing.assert_allclose(time.array_time_difference(times1, times2), expected, rtol=0, atol=1e-6)
+
+    t = GPSTime(2086, 123456.5)
+    np.testing.assert_array_equal(time.array_time_difference(t, times1), -(times1 - t))
+    np.testing.assert_array_equal(time.diff_seconds(t, times1), -(times1 - t))
+
+    deltas = np.linspace(-1e6, 1e6, 100)
+    result = time.subtract_timedelta(times1, deltas)
+    assert isinstance(result, GPSTimeArray)
+    assert (result == times1 - deltas).all()
+    tow = time.subtract_timedelta_as_tow(times1, deltas)
+    np.testing.assert_array_equal(tow[:, 0], result.week_number)
+    np.testing.assert_array_equal(tow[:, 1], result.time_of_week)
+
+
+def test_zcount_arrays():
+    """Test that the Z-count array functions match the scalar functions."""
+    date_times = _random_datetime64(2000)
+    week_num, tow = time.datetime2tow_array(date_times)
+    objects = date_times.astype(datetime.datetime)
+
+    week_z, zcount = time.tow2zcount_array(week_num, tow)
+    assert [time.tow2zcount(w, t) for w, t in zip(week_num, tow)] == list(zip(week_z, zcount))
+    week_d, zcount_d = time.datetime2zcount_array(date_times)
+    np.testing.assert_array_equal(week_d, week_z)
+    np.testing.assert_array_equal(zcount_d, zcount)
+    assert [time.datetime2zcount(d) for d in objects[:100]] == list(zip(week_d[:100], zcount_d[:100]))
+
+    week_t, tow_t = time.zcount2tow_array(week_z, zcount)
+    assert [time.zcount2tow(w, z) for w, z in zip(week_z, zcount)] == list(zip(week_t, tow_t))
+    np.testing.assert_array_equal(
+        time.zcount2datetime_array(week_z, zcount),
+        np.array(
+            [time.zcount2datetime(int(w), z).replace(tzinfo=None) for w, z in zip(week_z, zcount)],
+            dtype="datetime64[us]",
+        ),
+    )
+
+
+def test_zcount_arrays_integer():
+    """Test the integer Z-counts of whole 1.5 second epochs."""
+    tow = np.array([0.0, 1.4999, 1.5, 2.9999, 3.0, 604799.0, 604799.9])
+    expected = [0, 0, 1, 1, 2, 403199, 403199]
+    week_num, zcount = time.tow2zcount_array(np.full(7, 2086), tow, integer=True)
+    assert zcount.dtype == np.int64
+    np.testing.assert_array_equal(zcount, expected)
+    # The time of week is first rounded to the microsecond
+    assert time.tow2zcount_array(0, 1.4999999999, integer=True)[1] == 1
+    week_num, zcount = time.tow2zcount_array(2086, np.array([0.0, 1.4999, 4.5]), integer=True)
+    np.testing.assert_array_equal(week_num, [2086] * 3)
+    np.testing.assert_array_equal(zcount, [0, 0, 3])
+
+    start = np.datetime64("2020-01-05", "us")
+    for unit in ("s", "ms", "us", "ns"):
+        date_times = (start + np.round(tow * 1e6).astype("timedelta64[us]")).astype(
+            "datetime64[{}]".format(unit)
+        )
+        week_num, zcount = time.datetime2zcount_array(date_times, integer=True)
+        np.testing.assert_array_equal(week_num, [2087] * 7)
+        if unit == "s":
+            np.testing.assert_array_equal(zcount, [0, 0, 0, 1, 2, 403199, 403199])
+        else:
+            np.testing.assert_array_equal(zcount, expected)
+
+    # Integer Z-counts round trip exactly
+    zcount = np.arange(0, 403200, 7, dtype=np.int64)
+    date_times = time.zcount2datetime_array(2086, zcount)
+    np.testing.assert_array_equal(time.datetime2zcount_array(date_times, integer=True)[1], zcount)
+    np.testing.assert_array_equal(date_times, time.zcount2datetime_array(2086, zcount.astype(float)))
+    np.testing.assert_array_equal(time.zcount2tow_array(2086, zcount)[1], zcount * 1.5)
+
+
+def test_zcount_arrays_gps_seconds():
+    """Test converting between Z-counts and seconds since the GPS epoch."""
+    gps_seconds = np.array([0, 1, 2, 3, 604800, 604801, 2086 * 604800 + 123457, -1])
+    week_num, zcount = time.gps_seconds2zcount_array(gps_seconds, integer=True)
+    np.testing.assert_array_equal(week_num, [0, 0, 0, 0, 1, 1, 2086, -1])
+    np.testing.assert_array_equal(zcount, [0, 0, 1, 2, 0, 0, 82304, 403199])
+    week_f, zcount_f = time.gps_seconds2zcount_array(gps_seconds)
+    np.testing.assert_array_equal(week_f, week_num)
+    np.testing.assert_array_equal(time.zcount2gps_seconds_array(week_f, zcount_f), gps_seconds)
+    week_f, zcount_f = time.gps_seconds2zcount_array(gps_seconds + 0.75, integer=True)
+    np.testing.assert_array_equal(zcount_f, [0, 1, 1, 2, 0, 1, 82305, 403199])
+    np.testing.assert_array_equal(
+        time.zcount2gps_seconds_array([0, 1, 2086], [0, 1, 82304]),
+        [0.0, 604801.5, 2086 * 604800 + 123456.0],
+    )
+
+
+def test_zcount_arrays_year():
+    """Test correcting truncated week numbers with the year."""
+    week_num, zcount = time.tow2zcount_array([100, 100], [6.0, 7.5], year=2021)
+    np.testing.assert_array_equal(week_num, [2148, 2148])
+    np.testing.assert_array_equal(zcount, [4.0, 5.0])
+    week_num, tow = time.zcount2tow_array([100], [4], year=2021)
+    assert (week_num[0], tow[0]) == time.zcount2tow(100, 4, 2021)
+    np.testing.assert_array_equal(
+        time.zcount2gps_seconds_array([2209], [4], [2022], rollover=8192),
+        [2209 * 604800 + 6.0],
+    )
+    for zcount in ([4, 4], [4.0, 4.0]):
+        np.testing.assert_array_equal(
+            time.zcount2datetime_array([100, 0], zcount, 2021),
+            np.array(["2021-03-07T00:00:06", "NaT"], dtype="datetime64[us]"),
+        )
+
+    with pytest.raises(ValueError, match="1 of 2 rows"):
+        time.tow2zcount_array([100, 0], [0.0, 0.0], year=2021)
+    with pytest.raises(ValueError):
+        time.zcount2tow_array([0], [0], year=2021)
+
+
+@pytest.mark.parametrize("start,duration_s,step_ms", [
+    (datetime.datetime(2020, 1, 1), 1, 1),
+    (datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc), 1, 0.3),
+    (datetime.datetime(2020, 1, 1, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=5))), 0.01, 0.0015),
+    (datetime.datetime(2020, 1, 1), 10, 3000),
+    (datetime.datetime(2020, 1, 1), 0, 1),
+    (datetime.datetime(2020, 1, 1), -1, 1),
+])
+def test_arange_datetime_datetime64(start, duration_s, step_ms):
+    """Test that the datetime64 output holds the same instants as the list."""
+    expected = time.arange_datetime(start, duration_s, step_ms)
+    date_times = time.arange_datetime(start, duration_s, step_ms, output="datetime64")
+    assert date_times.dtype == np.dtype("datetime64[us]")
+    assert len(date_times) == len(expected)
+    for d, e in zip(date_times.astype(datetime.datetime), expected):
+        if e.tzinfo is not None:
+            e = e.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        assert d == e
+
+    chunks = list(time.arange_datetime_chunks(start, duration_s, step_ms, chunk_size=7))
+    assert all(len(c) <= 7 for c in chunks)
+    np.testing.assert_array_equal(
+        np.concatenate([np.array([], dtype="datetime64[us]")] + chunks), date_times
+    )
+
+
+def test_arange_datetime_errors():
+    """Test the errors raised for invalid arange_datetime arguments."""
+    start = datetime.datetime(2020, 1, 1)
+    with pytest.raises(ValueError):
+        time.arange_datetime(start, 1, 1, output="array")
+    with pytest.raises(ValueError):
+        time.arange_datetime(start, 1, 0, output="datetime64")
+    with pytest.raises(ValueError):
+        time.arange_datetime_chunks(start, 1, -1)
+    with pytest.raises(ValueError):
+        time.arange_datetime_chunks(start, 1, 1, chunk_size=0)
+
+
+_ISO_STRINGS = [
+    "2020-02-29T12:34:56.123456",
+    "2019-02-29T00:00:00",
+    "2020-01-01 00:00:00",
+    "2020-01-01|00:00:00.5",
+    "20200101T000000123456",
+    "2020-01-01T00:00:00123456",
+    "2020-01-01T00:00:00.12",
+    "2020-13-01T00:00:00",
+    "0000-01-01T00:00:00",
+    "2020-01-01T24:00:00",
+    "",
+    "garbage",
+    "2020-01-01T00:00:60",
+    "2020-01-01T00:00:59.999999Z",
+    "2020-0101T00:00:00",
+    "1999-12-31T23:59:59.000001xyz",
+]
+
+
+@pytest.mark.parametrize("iso_strings", [
+    _ISO_STRINGS,
+    np.array(_ISO_STRINGS),
+    np.array(_ISO_STRINGS, dtype=object),
+    np.array(_ISO_STRINGS).astype("S"),
+])
+def test_parse_iso_array(iso_strings):
+    """Test that parse_iso_array agrees with cast_to_datetime."""
+    date_times, bad_indices = time.parse_iso_array(iso_strings)
+    assert date_times.dtype == np.dtype("datetime64[us]")
+    assert bad_indices.dtype == np.int64
+    for i, iso_string in enumerate(_ISO_STRINGS):
+        try:
+            expected = time.cast_to_datetime(iso_string).replace(tzinfo=None)
+        except (IOError, ValueError):
+            assert i in bad_indices
+            assert np.isnat(date_times[i])
+        else:
+            assert i not in bad_indices
+            assert date_times[i].astype(datetime.datetime) == expected
+
+
+def test_parse_iso_array_gpstime():
+    """Test parsing directly to GPSTimes."""
+    times, bad_indices = time.parse_iso_array(
+        ["2019-12-01T00:17:32.500000", "bad", 5, "2008-10-12T00:00:00"], output="gpstime"
+    )
+    np.testing.assert_array_equal(bad_indices, [1, 2])
+    assert times[0] == GPSTime(2082, 1052.5)
+    assert times[1] == GPSTime(0, 0)
+    assert times[3] == GPSTime(1501, 0)
+
+
+def test_parse_iso_array_errors():
+    """Test the errors raised for invalid parse_iso_array arguments."""
+    with pytest.raises(ValueError):
+        time.parse_iso_array(["2020-01-01T00:00:00"], output="datetime")
+    with pytest.raises(ValueError):
+        time.parse_iso_array([["2020-01-01T00:00:00"]])
+
+
+def test_parse_iso_array_short():
+    """Test parsing strings narrower than the fixed-width layout."""
+    date_times, bad_indices = time.parse_iso_array(["2020-01-01T00:00:00", "x"])
+    assert date_times[0] == np.datetime64("2020-01-01T00:00:00", "us")
+    np.testing.assert_array_equal(bad_indices, [1])
+
+    date_times, bad_indices = time.parse_iso_array(np.array([], dtype=str))
+    assert len(date_times) == 0
+    assert len(bad_indices) == 0
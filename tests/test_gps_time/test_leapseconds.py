@@ -1,9 +1,11 @@
 import pytest
 
+import logging
 import datetime
+import numpy as np
 
 from gps_time.core import GPSTime
-from gps_time.leapseconds import LeapSeconds
+from gps_time.leapseconds import LeapSeconds, gps2utc, utc2gps, gps2utc_array, utc2gps_array
 
 
 @pytest.mark.parametrize("year,leap_seconds", [
@@ -74,6 +76,319 @@ def test_leap_second_boundaries():
     assert LeapSeconds.get_leap_seconds(GPSTime.from_datetime(t)) == 18
 
 
+def test_leap_second_lookup_matches_table():
+    """Test the binary search lookups against a scan of the table.
+
+    Checks times on, just before, and just after every entry, including
+    femtosecond offsets.
+    """
+    for index, (leap_time, count) in enumerate(LeapSeconds._leap_seconds):
+        previous_count = LeapSeconds._leap_seconds[index - 1][1] if index else 0
+        before = leap_time - 1e-15
+        assert before < leap_time
+
+        assert LeapSeconds.get_leap_seconds(leap_time) == count
+        assert LeapSeconds.get_leap_seconds(leap_time + 1e-6) == count
+        assert LeapSeconds.get_leap_seconds(before) == previous_count
+
+        assert LeapSeconds.get_next_leap_second(before) == [leap_time, count]
+        expected_next = (
+            LeapSeconds._leap_seconds[index + 1]
+            if index + 1 < len(LeapSeconds._leap_seconds)
+            else None
+        )
+        assert LeapSeconds.get_next_leap_second(leap_time) == expected_next
+        assert LeapSeconds.get_next_leap_second(leap_time + 1e-6) == expected_next
+
+
+def _boundary_seconds() -> np.ndarray:
+    """Whole GPS seconds around every leap second plus random times."""
+    keys = np.array(LeapSeconds._leap_second_keys)
+    rng = np.random.default_rng(0)
+    return np.concatenate(
+        [keys - 1, keys, keys + 1, keys - 18, keys + 18, rng.integers(0, 2**31, 500)]
+    )
+
+
+def test_gps2utc_array():
+    """Test that gps2utc_array matches gps2utc for integer and datetime64 input."""
+    gps_seconds = _boundary_seconds()
+    utc_seconds = gps2utc_array(gps_seconds)
+    assert utc_seconds.dtype == np.int64
+
+    epoch = datetime.datetime(1980, 1, 6, tzinfo=datetime.timezone.utc)
+    for gps, utc in zip(gps_seconds.tolist(), utc_seconds.tolist()):
+        assert gps2utc(GPSTime(0, gps)) == epoch + datetime.timedelta(seconds=utc)
+
+    rng = np.random.default_rng(1)
+    gps_datetimes = (
+        np.datetime64("1980-01-06", "us")
+        + (gps_seconds * 1000000 + rng.integers(0, 1000000, gps_seconds.size)).astype("timedelta64[us]")
+    )
+    utc_datetimes = gps2utc_array(gps_datetimes)
+    assert utc_datetimes.dtype == gps_datetimes.dtype
+    for gps, utc in zip(gps_datetimes.astype(datetime.datetime), utc_datetimes.astype(datetime.datetime)):
+        assert gps2utc(gps) == utc.replace(tzinfo=datetime.timezone.utc)
+
+    utc_ns = gps2utc_array(gps_datetimes.astype("datetime64[ns]"))
+    assert utc_ns.dtype == np.dtype("datetime64[ns]")
+    np.testing.assert_array_equal(utc_ns, utc_datetimes)
+
+    utc_days = gps2utc_array(np.array(["2020-01-01"], dtype="datetime64[D]"))
+    np.testing.assert_array_equal(utc_days, np.array(["2019-12-31T23:59:42"], dtype="datetime64[s]"))
+
+    with pytest.raises(TypeError):
+        gps2utc_array(np.array([1.5]))
+
+
+def test_utc2gps_array():
+    """Test that utc2gps_array matches utc2gps for integer and datetime64 input."""
+    utc_seconds = _boundary_seconds()
+    gps_seconds = utc2gps_array(utc_seconds)
+
+    epoch = datetime.datetime(1980, 1, 6, tzinfo=datetime.timezone.utc)
+    for utc, gps in zip(utc_seconds.tolist(), gps_seconds.tolist()):
+        assert utc2gps(epoch + datetime.timedelta(seconds=utc)) == GPSTime(0, gps)
+
+    utc_datetimes = np.datetime64("1980-01-06", "ms") + (utc_seconds * 1000 + 999).astype("timedelta64[ms]")
+    gps_datetimes = utc2gps_array(utc_datetimes)
+    assert gps_datetimes.dtype == utc_datetimes.dtype
+    for utc, gps in zip(utc_datetimes.astype(datetime.datetime), gps_datetimes.astype(datetime.datetime)):
+        expected = utc2gps(utc.replace(tzinfo=datetime.timezone.utc)).to_datetime()
+        assert expected == gps.replace(tzinfo=datetime.timezone.utc)
+
+
+LEAP_SECONDS_LIST = """#
+#	In the following text, the symbol '#' introduces
+#	a comment, which continues from that symbol until
+#	the end of the line.
+#
+#	File expires on:  28 June 2026
+#
+#$	 3945196800
+#@	3991593600
+#
+2272060800	10	# 1 Jan 1972
+2287785600	11	# 1 Jul 1972
+2303683200	12	# 1 Jan 1973
+2335219200	13	# 1 Jan 1974
+2366755200	14	# 1 Jan 1975
+2398291200	15	# 1 Jan 1976
+2429913600	16	# 1 Jan 1977
+2461449600	17	# 1 Jan 1978
+2492985600	18	# 1 Jan 1979
+2524521600	19	# 1 Jan 1980
+2571782400	20	# 1 Jul 1981
+2603318400	21	# 1 Jul 1982
+2634854400	22	# 1 Jul 1983
+2698012800	23	# 1 Jul 1985
+2776982400	24	# 1 Jan 1988
+2840140800	25	# 1 Jan 1990
+2871676800	26	# 1 Jan 1991
+2918937600	27	# 1 Jul 1992
+2950473600	28	# 1 Jul 1993
+2982009600	29	# 1 Jul 1994
+3029443200	30	# 1 Jan 1996
+3076704000	31	# 1 Jul 1997
+3124137600	32	# 1 Jan 1999
+3345062400	33	# 1 Jan 2006
+3439756800	34	# 1 Jan 2009
+3550089600	35	# 1 Jul 2012
+3644697600	36	# 1 Jul 2015
+3692217600	37	# 1 Jan 2017
+#
+#h	d5d1b6b1 6b3e6a5f 3d1b7c2e 0d0a3c4f 9a8b7c6d
+"""
+
+LEAP_SECOND_DAT = """#  Value of TAI-UTC in second valid beetween the initial value until
+#  the epoch given on the next line. The last line reads that NO
+#  leap second was introduced since the corresponding date
+#
+#  File expires on 28 June 2026
+#
+#    MJD        Date        TAI-UTC (s)
+#           day month year
+#    ---    --------------   ------
+#
+    41317.0    1  1 1972       10
+    41499.0    1  7 1972       11
+    41683.0    1  1 1973       12
+    42048.0    1  1 1974       13
+    42413.0    1  1 1975       14
+    42778.0    1  1 1976       15
+    43144.0    1  1 1977       16
+    43509.0    1  1 1978       17
+    43874.0    1  1 1979       18
+    44239.0    1  1 1980       19
+    44786.0    1  7 1981       20
+    45151.0    1  7 1982       21
+    45516.0    1  7 1983       22
+    46247.0    1  7 1985       23
+    47161.0    1  1 1988       24
+    47892.0    1  1 1990       25
+    48257.0    1  1 1991       26
+    48804.0    1  7 1992       27
+    49169.0    1  7 1993       28
+    49534.0    1  7 1994       29
+    50083.0    1  1 1996       30
+    50630.0    1  7 1997       31
+    51179.0    1  1 1999       32
+    53736.0    1  1 2006       33
+    54832.0    1  1 2009       34
+    56109.0    1  7 2012       35
+    57204.0    1  7 2015       36
+    57754.0    1  1 2017       37
+"""
+
+
+@pytest.fixture
+def bundled_table():
+    """Restore the bundled leap second table after the test."""
+    yield [(key, count) for key, count in zip(LeapSeconds._leap_second_keys, LeapSeconds._leap_second_counts[1:])]
+    LeapSeconds.reset()
+
+
+@pytest.mark.parametrize("name,text", [
+    ("leap-seconds.list", LEAP_SECONDS_LIST),
+    ("Leap_Second.dat", LEAP_SECOND_DAT),
+], ids=["list", "dat"])
+def test_load(tmp_path, bundled_table, name, text, caplog):
+    """Test loading leap second files that match the bundled table."""
+    caplog.set_level(logging.WARNING, logger="gps_time")
+    path = tmp_path / name
+    path.write_text(text)
+    LeapSeconds.load(str(path), cache_dir=str(tmp_path / "cache"))
+
+    assert list(zip(LeapSeconds._leap_second_keys, LeapSeconds._leap_second_counts[1:])) == bundled_table
+    assert LeapSeconds.get_next_leap_second(GPSTime(1300, 0)) == [GPSTime(1356, 0), 14]
+
+    # The expiration is read from the file
+    expiration = datetime.datetime(2026, 6, 28, tzinfo=datetime.timezone.utc)
+    LeapSeconds.get_leap_seconds(GPSTime.from_datetime(expiration))
+    assert not caplog.records
+    LeapSeconds.get_leap_seconds(GPSTime.from_datetime(expiration) + 1)
+    assert caplog.records[-1].getMessage().startswith("Leap seconds only current through 28 Jun 2026.")
+
+    LeapSeconds.reset()
+    assert LeapSeconds._leap_second_keys == [key for key, _ in bundled_table]
+    LeapSeconds.get_leap_seconds(GPSTime.from_datetime(expiration))
+    assert caplog.records[-1].getMessage().startswith("Leap seconds only current through 31 Dec 2025.")
+
+
+def test_load_new_leap_second(tmp_path, bundled_table):
+    """Test that a leap second added to the file is used."""
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(LEAP_SECONDS_LIST.replace("#h", "3991593600	38	# 28 Jun 2026\n#h"))
+    LeapSeconds.load(str(path), cache_dir=str(tmp_path))
+
+    leap_time = GPSTime(0, 3991593600 - 2524953600)
+    assert LeapSeconds.get_leap_seconds(leap_time - 1e-15) == 18
+    assert LeapSeconds.get_leap_seconds(leap_time) == 19
+    np.testing.assert_array_equal(
+        LeapSeconds.get_leap_seconds_array([3991593600 - 2524953600 - 1, 3991593600 - 2524953600]), [18, 19]
+    )
+    assert LeapSeconds.get_next_leap_second(GPSTime(2300, 0)) == [leap_time, 19]
+
+
+def test_load_cache(tmp_path, bundled_table, monkeypatch):
+    """Test that the parsed table is cached until the file changes."""
+    from gps_time import leapseconds
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(LEAP_SECONDS_LIST)
+    cache_dir = tmp_path / "cache"
+    LeapSeconds.load(str(path), cache_dir=str(cache_dir))
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.stat().st_size == 40 + 16 * 18
+
+    # The cached table is used without parsing the file
+    def fail(text):
+        raise AssertionError("parsed")
+    monkeypatch.setattr(leapseconds, "_parse_leap_second_file", fail)
+    LeapSeconds.reset()
+    LeapSeconds.load(str(path), cache_dir=str(cache_dir))
+    assert LeapSeconds._leap_second_keys == [key for key, _ in bundled_table]
+    monkeypatch.undo()
+
+    # Changing the file invalidates the cache
+    path.write_text(LEAP_SECONDS_LIST.replace("3692217600	37", "3692217600	38"))
+    LeapSeconds.load(str(path), cache_dir=str(cache_dir))
+    assert LeapSeconds._leap_second_counts[-1] == 19
+
+    # A corrupt cache is replaced
+    cache_file.write_bytes(b"GPSLEAP1")
+    LeapSeconds.load(str(path), cache_dir=str(cache_dir))
+    assert LeapSeconds._leap_second_counts[-1] == 19
+    assert cache_file.stat().st_size == 40 + 16 * 18
+
+    # The default cache directory follows XDG_CACHE_HOME
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    LeapSeconds.load(str(path))
+    assert len(list((tmp_path / "xdg" / "gps_time").iterdir())) == 1
+
+
+def test_load_unwritable_cache(tmp_path, bundled_table):
+    """Test that the file is still loaded if the cache cannot be written."""
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(LEAP_SECONDS_LIST)
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    LeapSeconds.load(str(path), cache_dir=str(not_a_directory))
+    assert LeapSeconds._leap_second_keys == [key for key, _ in bundled_table]
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "#@	3991593600\n",
+    "2571782400	20\n",
+    "2571782400	20\n2571782400	21\n#@	3991593600\n",
+    "2571782400	20\n2603318400	20\n#@	3991593600\n",
+    "2571782400	20	1\n#@	3991593600\n",
+    "2571782400	twenty\n#@	3991593600\n",
+])
+def test_load_errors(tmp_path, bundled_table, text):
+    """Test that invalid files raise and leave the table unchanged."""
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        LeapSeconds.load(str(path), cache_dir=str(tmp_path))
+    with pytest.raises(OSError):
+        LeapSeconds.load(str(tmp_path / "missing"), cache_dir=str(tmp_path))
+    assert LeapSeconds._leap_second_keys == [key for key, _ in bundled_table]
+
+
+def test_load_environment(tmp_path, bundled_table, monkeypatch, caplog):
+    """Test loading the file named by GPS_TIME_LEAP_SECONDS."""
+    import os
+    import sys
+    import subprocess
+    from gps_time import leapseconds
+    caplog.set_level(logging.WARNING, logger="gps_time")
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(LEAP_SECONDS_LIST.replace("#h", "3991593600	38	# 28 Jun 2026\n#h"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    monkeypatch.delenv("GPS_TIME_LEAP_SECONDS", raising=False)
+    leapseconds._load_from_environment()
+    assert LeapSeconds._leap_second_counts[-1] == 18
+
+    monkeypatch.setenv("GPS_TIME_LEAP_SECONDS", str(tmp_path / "missing"))
+    leapseconds._load_from_environment()
+    assert LeapSeconds._leap_second_counts[-1] == 18
+    assert "GPS_TIME_LEAP_SECONDS" in caplog.records[-1].getMessage()
+
+    monkeypatch.setenv("GPS_TIME_LEAP_SECONDS", str(path))
+    leapseconds._load_from_environment()
+    assert LeapSeconds._leap_second_counts[-1] == 19
+
+    # The file is loaded when the module is imported
+    env = dict(os.environ)
+    code = "from gps_time.leapseconds import LeapSeconds; print(LeapSeconds._leap_second_counts[-1])"
+
+    env["GPS_TIME_LEAP_SECONDS"] = str(path)
+    result = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, check=True)
+    assert result.stdout.strip() == b"19"
+
+
 if __name__ == "__main__":
     gps_time = GPSTime.from_datetime(datetime.datetime(2000, 1, 1))
     # gps_time2 = gps_time + datetime.datetime(1990, 1, 6)
@@ -0,0 +1,135 @@
+import pytest
+
+import datetime
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+
+from gps_time.core import GPSTime
+from gps_time.arrays import GPSTimeArray
+from gps_time.datetime import parse_iso_array
+from gps_time import parallel
+from gps_time.parallel import to_gpstime_array
+
+
+@pytest.fixture
+def date_times():
+    """A datetime64 array spanning several weeks."""
+    start = np.datetime64("2019-12-30T12:00:00", "us")
+    return start + np.arange(1000, dtype=np.int64).astype("timedelta64[us]") * 6123456789
+
+
+class _NoPool:
+    """An executor that fails the test if it is used."""
+
+    def submit(self, *args, **kwargs):
+        raise AssertionError("the process pool must not be used")
+
+
+def test_to_gpstime_array_datetime64(date_times):
+    """Test that datetime64 values are converted in this process."""
+    expected = GPSTimeArray.from_datetime64(date_times)
+    for kwargs in [
+        {},
+        {"min_parallel_size": 0, "max_workers": 2},
+        {"min_parallel_size": 0, "executor": _NoPool()},
+    ]:
+        times, bad = to_gpstime_array(date_times, **kwargs)
+        assert isinstance(times, GPSTimeArray)
+        assert (times == expected).all()
+        assert bad.dtype == np.int64 and len(bad) == 0
+
+
+def test_to_gpstime_array_iso(date_times):
+    """Test the conversion of ISO strings, including malformed strings."""
+    iso_strings = np.datetime_as_string(date_times, unit="us").tolist()
+    iso_strings[3] = "2020-02-30T00:00:00"
+    iso_strings[998] = "not a time"
+    iso_strings[999] = "20200101 000000.000001"
+    expected, expected_bad = parse_iso_array(iso_strings, output="gpstime")
+
+    for kwargs in [{"max_workers": 2, "chunk_size": 100}, {"max_workers": 2, "chunk_size": 7}]:
+        times, bad = to_gpstime_array(iso_strings, min_parallel_size=0, **kwargs)
+        assert (times == expected).all()
+        np.testing.assert_array_equal(bad, [3, 998])
+        np.testing.assert_array_equal(bad, expected_bad)
+        assert times[999] == GPSTime(2086, 259200, 1000000000)
+
+    times, bad = to_gpstime_array(np.array(iso_strings))
+    assert (times == expected).all()
+    np.testing.assert_array_equal(bad, [3, 998])
+
+
+def test_to_gpstime_array_datetimes(date_times):
+    """Test the conversion of naive and aware datetimes."""
+    naive = date_times.astype(datetime.datetime).tolist()
+    eastern = datetime.timezone(datetime.timedelta(hours=-5))
+    aware = [d.replace(tzinfo=datetime.timezone.utc).astimezone(eastern) for d in naive]
+    expected = GPSTimeArray.from_datetime64(date_times)
+
+    times, bad = to_gpstime_array(naive, min_parallel_size=0, executor=_NoPool())
+    assert (times == expected).all()
+    times, bad = to_gpstime_array(iter(aware))
+    assert (times == expected).all()
+
+    # GPSTime.from_datetime agrees where the time of week is exact as a float
+    quarters = [datetime.datetime(2020, 1, 1) + datetime.timedelta(seconds=0.25 * i) for i in range(100)]
+    times, _ = to_gpstime_array(quarters)
+    assert times.to_gpstimes() == [GPSTime.from_datetime(d) for d in quarters]
+
+
+def test_convert_chunk(date_times):
+    """Test the worker function in this process."""
+    from multiprocessing.shared_memory import SharedMemory
+    iso_strings = np.datetime_as_string(date_times, unit="us")
+    iso_strings[15] = "bad"
+    size = len(iso_strings)
+    input_memory = SharedMemory(create=True, size=iso_strings.nbytes)
+    output_memory = SharedMemory(create=True, size=25 * size)
+    try:
+        np.ndarray((size,), dtype=iso_strings.dtype, buffer=input_memory.buf)[:] = iso_strings
+        parallel._convert_chunk(
+            input_memory.name, iso_strings.dtype.str, output_memory.name, size, 10, 20
+        )
+        week_number, seconds, femtoseconds, bad = parallel._output_columns(output_memory.buf, size)
+        expected = GPSTimeArray.from_datetime64(date_times[10:20])
+        good = np.arange(10) != 5
+        np.testing.assert_array_equal(week_number[10:20][good], expected.week_number[good])
+        np.testing.assert_array_equal(seconds[10:20][good], expected.seconds[good])
+        np.testing.assert_array_equal(femtoseconds[10:20][good], expected.femtoseconds[good])
+        np.testing.assert_array_equal(seconds[:10], 0)
+        np.testing.assert_array_equal(np.flatnonzero(bad), [15])
+        del week_number, seconds, femtoseconds, bad
+    finally:
+        for memory in (input_memory, output_memory):
+            memory.close()
+            memory.unlink()
+
+
+def test_to_gpstime_array_executor(date_times):
+    """Test converting with a pool that is reused."""
+    iso_strings = np.datetime_as_string(date_times, unit="us")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            times, _ = to_gpstime_array(iso_strings, min_parallel_size=0, executor=executor)
+            assert (times == GPSTimeArray.from_datetime64(date_times)).all()
+
+
+def test_to_gpstime_array_empty():
+    """Test that empty inputs give empty arrays."""
+    for values in [[], np.array([], dtype="datetime64[us]")]:
+        times, bad = to_gpstime_array(values, min_parallel_size=0)
+        assert len(times) == 0 and len(bad) == 0
+
+
+@pytest.mark.parametrize("values,kwargs,error", [
+    (np.zeros(3, dtype=np.int64), {}, TypeError),
+    ([1, 2, 3], {}, TypeError),
+    (np.array([["2020-01-01T00:00:00"]]), {}, ValueError),
+    (["2020-01-01T00:00:00"], {"max_workers": 0}, ValueError),
+    (["2020-01-01T00:00:00"], {"chunk_size": 0}, ValueError),
+])
+def test_to_gpstime_array_errors(values, kwargs, error):
+    """Test the argument checks."""
+    with pytest.raises(error):
+        to_gpstime_array(values, **kwargs)
@@ -95,3 +95,14 @@ def test_gpstime_variations(yaml, gpstime_instance):
     if gpstime_instance.seconds > 0:
         assert loaded_time.seconds == gpstime_instance.seconds
 
+
+def test_gpstime_flow_style(yaml):
+    """Test that GPSTime is dumped as a single flow-style mapping."""
+    stream = StringIO()
+    yaml.dump({"times": [GPSTime(2290, 123456, 5), GPSTime(2290, 0)]}, stream)
+    assert stream.getvalue() == (
+        "times:\n"
+        "- !GPSTime {week_number: 2290, seconds: 123456, femtoseconds: 5}\n"
+        "- !GPSTime {week_number: 2290, seconds: 0, femtoseconds: 0}\n"
+    )
+    assert yaml.load(stream.getvalue())["times"][0] == GPSTime(2290, 123456, 5)
@@ -0,0 +1,163 @@
+import pytest
+
+import json
+import numpy as np
+
+from gps_time.core import GPSTime
+from gps_time.arrays import GPSTimeArray
+from gps_time.store import GPSTimeStore
+
+
+@pytest.fixture
+def times():
+    """Unsorted times, with repeats, across weeks and within seconds."""
+    rng = np.random.default_rng(0)
+    return GPSTimeArray(
+        rng.integers(2000, 2005, 5000),
+        rng.integers(0, 3, 5000) * 201600,
+        rng.integers(0, 4, 5000) * 250000000000000,
+    )
+
+
+@pytest.fixture
+def store(tmp_path, times):
+    return GPSTimeStore.create(
+        tmp_path / "store",
+        times,
+        {"index": np.arange(len(times)), "value": np.linspace(0, 1, len(times))},
+    )
+
+
+def test_create(store, times):
+    """Test that the rows are sorted by time and memory mapped."""
+    assert len(store) == len(times)
+    assert store.columns == ["index", "value"]
+    assert isinstance(store.column("week_number"), np.memmap)
+    assert not store.column("value").flags.writeable
+
+    index = store.column("index")
+    np.testing.assert_array_equal(index, times.argsort())
+    assert (store.times == times[np.asarray(index)]).all()
+    np.testing.assert_array_equal(store.column("value"), np.linspace(0, 1, len(times))[index])
+
+    reopened = GPSTimeStore(store.path)
+    assert (reopened.times == store.times).all()
+    assert reopened.column("value").dtype == np.float64
+    assert "rows=5000" in repr(reopened)
+
+
+def test_query(store, times):
+    """Test that range queries match GPSTime comparisons."""
+    bounds = [
+        GPSTime(1999, 0),
+        GPSTime(2001, 201600, 250000000000000),
+        GPSTime(2001, 201600, 250000000000001),
+        GPSTime(2002, 403199, 999999999999999),
+        GPSTime(2003, 0),
+        GPSTime(2010, 0),
+    ]
+    for start in bounds:
+        for stop in bounds:
+            selected, columns = store.query(start, stop)
+            expected = (times >= start) & (times < stop)
+            assert len(selected) == expected.sum()
+            assert (selected >= start).all() and (selected < stop).all()
+            np.testing.assert_array_equal(
+                np.sort(columns["index"]), np.flatnonzero(expected)
+            )
+
+    selected, columns = store.query(start=GPSTime(2004, 0))
+    assert len(selected) == (times >= GPSTime(2004, 0)).sum()
+    assert np.shares_memory(selected.seconds, store.column("seconds"))
+    assert np.shares_memory(columns["value"], store.column("value"))
+
+    selected, columns = store.query(stop=GPSTime(2001, 0), columns=["value"])
+    assert list(columns) == ["value"]
+    assert len(selected) == (times < GPSTime(2001, 0)).sum()
+    assert store.index_range() == slice(0, len(times))
+
+    with pytest.raises(TypeError):
+        store.query(start=2001)
+    with pytest.raises(KeyError):
+        store.query(columns=["other"])
+
+
+def test_append(store, times):
+    """Test appending later rows."""
+    later = GPSTimeArray([2007, 2006, 2004], [5, 5, 403200], [0, 0, 750000000000000])
+    before = store.times
+    store.append(later, {"index": [-1, -2, -3], "value": [1.0, 2.0, 3.0]})
+    assert len(store) == len(times) + 3
+    assert len(before) == len(times)
+    np.testing.assert_array_equal(store.column("index")[-3:], [-3, -2, -1])
+
+    reopened = GPSTimeStore(store.path)
+    selected, columns = reopened.query(start=GPSTime(2005, 0))
+    assert selected.to_gpstimes() == [GPSTime(2006, 5), GPSTime(2007, 5)]
+    np.testing.assert_array_equal(columns["value"], [2.0, 1.0])
+
+    store.append(GPSTimeArray([], []), {"index": [], "value": []})
+    assert len(store) == len(times) + 3
+    with pytest.raises(ValueError):
+        store.append(GPSTimeArray([2007], [4]), {"index": [0], "value": [0.0]})
+    with pytest.raises(ValueError):
+        store.append(GPSTimeArray([2008], [0]), {"index": [0]})
+    assert len(GPSTimeStore(store.path)) == len(times) + 3
+
+
+def test_empty_store(tmp_path):
+    """Test creating an empty store and appending to it."""
+    store = GPSTimeStore.create(tmp_path / "empty", GPSTimeArray([], []))
+    assert len(store) == 0
+    assert store.columns == []
+    assert len(store.query(GPSTime(0, 0), GPSTime(3000, 0))[0]) == 0
+
+    store.append(GPSTimeArray([2001, 2000], [0, 0]))
+    assert store.times.to_gpstimes() == [GPSTime(2000, 0), GPSTime(2001, 0)]
+    # Equal times may be appended
+    store.append(GPSTimeArray([2001], [0]))
+    assert len(GPSTimeStore(tmp_path / "empty")) == 3
+
+
+def test_create_errors(tmp_path, store, times):
+    """Test invalid columns and existing stores."""
+    with pytest.raises(FileExistsError):
+        GPSTimeStore.create(store.path, times)
+    for columns in (
+        {"seconds": np.zeros(len(times))},
+        {"not a name": np.zeros(len(times))},
+        {"short": np.zeros(3)},
+        {"objects": np.full(len(times), None)},
+    ):
+        with pytest.raises(ValueError):
+            GPSTimeStore.create(tmp_path / "other", times, columns)
+
+
+def test_open_errors(tmp_path, store):
+    """Test opening directories that are not valid stores."""
+    with pytest.raises(FileNotFoundError):
+        GPSTimeStore(tmp_path / "missing")
+
+    with open(tmp_path / "store" / "value.bin", "r+b") as f:
+        f.truncate(8)
+    with pytest.raises(ValueError):
+        GPSTimeStore(store.path)
+
+    metadata_path = tmp_path / "store" / "store.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["version"] = 2
+    metadata_path.write_text(json.dumps(metadata))
+    with pytest.raises(ValueError):
+        GPSTimeStore(store.path)
+
+
+def test_interrupted_append(tmp_path):
+    """Test that rows beyond the recorded length are ignored and overwritten."""
+    store = GPSTimeStore.create(tmp_path / "store", GPSTimeArray([2000], [0]))
+    with open(tmp_path / "store" / "week_number.bin", "ab") as f:
+        f.write(np.int64(9999).tobytes())
+    assert len(GPSTimeStore(store.path)) == 1
+
+    store.append(GPSTimeArray([2001], [0]))
+    assert (tmp_path / "store" / "week_number.bin").stat().st_size == 16
+    assert GPSTimeStore(store.path).times.to_gpstimes() == [GPSTime(2000, 0), GPSTime(2001, 0)]
@@ -1,6 +1,7 @@
 import pytest
 
 from gps_time.core import GPSTime
+from gps_time.arrays import GPSTimeArray
 from gps_time import utilities
 
 
@@ -27,3 +28,69 @@ def test_validate_gps_week():
     utilities.validate_gps_week(full_week, week)
     with pytest.raises(ValueError):
         utilities.validate_gps_week(full_week, bad_week)
+
+
+def test_arange_gpstime_range():
+    """Test the lazy GPSTimeRange output of arange_gpstime.
+
+    Verifies the length, exact integer stepping, indexing, slicing,
+    membership, and iteration.
+    """
+    start = GPSTime(2000, 604799, 999000000000000)
+    r = utilities.arange_gpstime(start, 86400, 100, output="range")
+    assert isinstance(r, utilities.GPSTimeRange)
+    assert len(r) == 864000
+    assert r[0] == start
+    assert r[1] == GPSTime(2001, 0, 99000000000000)
+    assert r[-1] == GPSTime(2001, 86399, 899000000000000)
+    assert r[10**5] - r[0] == 10**4
+
+    s = r[10:20:3]
+    assert isinstance(s, utilities.GPSTimeRange)
+    assert list(s) == [r[10], r[13], r[16], r[19]]
+    assert list(r[5:1:-2]) == [r[5], r[3]]
+    assert len(r[10:5]) == 0
+
+    assert r[12345] in r
+    assert r.index(r[12345]) == 12345
+    assert r.count(r[12345]) == 1
+    assert (r[12345] + 1e-3) not in r
+    assert r[-1] + 0.1 not in r
+    assert start - 0.1 not in r
+    assert 1 not in r
+    with pytest.raises(ValueError):
+        r.index(start - 0.1)
+    with pytest.raises(IndexError):
+        r[len(r)]
+
+    assert list(r[:1000]) == [r[i] for i in range(1000)]
+    assert "GPSTimeRange" in repr(r)
+
+
+def test_arange_gpstime_array():
+    """Test the GPSTimeArray output of arange_gpstime."""
+    start = GPSTime(2000, 604799, 999000000000000)
+    r = utilities.arange_gpstime(start, 36, 1.0 / 3, output="range")
+    a = utilities.arange_gpstime(start, 36, 1.0 / 3, output="array")
+    assert isinstance(a, GPSTimeArray)
+    assert len(a) == len(r)
+    assert a.to_gpstimes() == list(r)
+
+    # Large multiples do not overflow
+    a = GPSTimeArray.from_range(start, 10**15 + 1, 10**7)
+    assert a[-1] == GPSTime(2000, 604799 + 9999999, 999000000000000 + 9999999)
+    a = GPSTimeArray.from_range(start, -(10**12), 5)
+    assert a.to_gpstimes() == [start - i * 1e-3 for i in range(5)]
+
+    assert len(utilities.arange_gpstime(start, 1, 1, output="array")) == 1000
+    assert len(utilities.arange_gpstime(start, -1, 1, output="range")) == 0
+    assert list(utilities.arange_gpstime(start, -1, -500, output="range")) == [start, start - 0.5]
+
+    with pytest.raises(ValueError):
+        utilities.arange_gpstime(start, 1, 1, output="tuple")
+    with pytest.raises(ValueError):
+        utilities.arange_gpstime(start, 1, 0, output="range")
+    with pytest.raises(ValueError):
+        utilities.GPSTimeRange(start, 0, 10)
+    with pytest.raises(ValueError):
+        utilities.GPSTimeRange(start, 1, -1)
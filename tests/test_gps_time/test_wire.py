@@ -0,0 +1,105 @@
+import pytest
+
+import numpy as np
+
+from gps_time.core import GPSTime
+from gps_time.arrays import GPSTimeArray
+from gps_time.wire import WIRE_DTYPE, RECORD_SIZE, pack, pack_into, unpack, iter_unpack
+
+
+@pytest.fixture
+def times():
+    return GPSTimeArray(
+        np.arange(2000, 2100), np.arange(100) * 6047, np.arange(100) * 10**13 + 7
+    )
+
+
+def test_wire_dtype():
+    """Test that the records are packed little-endian without padding."""
+    assert WIRE_DTYPE.itemsize == RECORD_SIZE == 14
+    assert not WIRE_DTYPE.isalignedstruct
+
+
+def test_pack(times):
+    """Test that a batch is the concatenation of the scalar encodings."""
+    data = pack(times)
+    assert data == b"".join(t.to_bytes() for t in times)
+    assert pack(times.to_gpstimes()) == data
+    assert pack(times[::3]) == b"".join(t.to_bytes() for t in times[::3])
+    assert pack([]) == b""
+
+    with pytest.raises(ValueError):
+        pack([GPSTime(70000, 0)])
+    with pytest.raises(ValueError):
+        pack(GPSTimeArray([-1], [0]))
+    with pytest.raises(TypeError):
+        pack([1.0])
+
+
+def test_unpack(times):
+    """Test decoding batches from buffers."""
+    data = pack(times)
+    result = unpack(data)
+    assert (result == times).all()
+    assert result.week_number.dtype == np.int64
+    result.sort()
+
+    assert (unpack(memoryview(data)) == times).all()
+    assert (unpack(np.frombuffer(data, dtype=np.uint8)) == times).all()
+    assert (unpack(data, offset=14 * 10, count=5) == times[10:15]).all()
+    assert (unpack(b"header" + data, offset=6) == times).all()
+    assert len(unpack(b"")) == 0
+    assert len(unpack(data, count=0)) == 0
+
+    with pytest.raises(ValueError):
+        unpack(data[:-1])
+    with pytest.raises(ValueError):
+        unpack(data, count=101)
+    with pytest.raises(ValueError):
+        unpack(data, offset=-1)
+    with pytest.raises(ValueError):
+        unpack(data, offset=len(data) + 1)
+
+
+def test_unpack_untrusted():
+    """Test that records that are not normalized are rejected."""
+    records = np.zeros(3, dtype=WIRE_DTYPE)
+    records["seconds"][1] = 604800
+    with pytest.raises(ValueError):
+        unpack(records.tobytes())
+    with pytest.raises(ValueError):
+        list(iter_unpack(records.tobytes()))
+
+    records["seconds"][1] = 0
+    records["femtoseconds"][2] = 2**64 - 1
+    with pytest.raises(ValueError):
+        unpack(records.tobytes())
+    assert (unpack(records[:2].tobytes()) == GPSTime(0, 0)).all()
+
+
+def test_pack_into(times):
+    """Test encoding into preallocated buffers."""
+    buffer = bytearray(4 + len(times) * RECORD_SIZE)
+    assert pack_into(times, buffer, offset=4) == len(times) * RECORD_SIZE
+    assert bytes(buffer[4:]) == pack(times)
+    assert (unpack(buffer, offset=4) == times).all()
+
+    block = np.zeros(len(times) * RECORD_SIZE, dtype=np.uint8)
+    pack_into(times.to_gpstimes(), memoryview(block))
+    assert block.tobytes() == pack(times)
+
+    with pytest.raises(ValueError):
+        pack_into(times, buffer, offset=5)
+    with pytest.raises(ValueError):
+        pack_into(times, buffer, offset=-1)
+    with pytest.raises(TypeError):
+        pack_into(times, bytes(buffer))
+
+
+def test_iter_unpack(times):
+    """Test decoding GPSTime objects one at a time."""
+    data = pack(times)
+    assert list(iter_unpack(data)) == times.to_gpstimes()
+    assert list(iter_unpack(b"")) == []
+    with pytest.raises(ValueError):
+        next(iter_unpack(data[:-1]))
@@ -0,0 +1,130 @@
+import pytest
+
+from io import StringIO
+
+import ruamel.yaml
+
+from gps_time.core import GPSTime
+from gps_time.yamlio import yaml_loader, load_records, dump_records
+
+
+def _records(count):
+    for i in range(count):
+        yield {"id": i, "time": GPSTime(2100, i * 1.25)}
+
+
+def test_dump_records():
+    """Test that records are written as one block sequence."""
+    stream = StringIO()
+    assert dump_records(_records(5), stream, chunk_size=2) == 5
+    lines = stream.getvalue().splitlines()
+    assert lines[:2] == [
+        "- id: 0",
+        "  time: !GPSTime {week_number: 2100, seconds: 0, femtoseconds: 0}",
+    ]
+    assert len(lines) == 10
+
+    # The chunks form a single list
+    assert yaml_loader().load(stream.getvalue()) == list(_records(5))
+
+
+def test_load_records():
+    """Test that the records are loaded one at a time, in order."""
+    stream = StringIO()
+    dump_records(_records(2500), stream)
+    stream.seek(0)
+    records = load_records(stream)
+    assert next(records) == {"id": 0, "time": GPSTime(2100, 0)}
+    assert list(records) == list(_records(2500))[1:]
+
+
+def test_load_records_documents():
+    """Test streams of several documents."""
+    text = (
+        "a: 1\n"
+        "---\n"
+        "- 1\n"
+        "- [2, 3]\n"
+        "- &t !GPSTime {week_number: 1, seconds: 2, femtoseconds: 3}\n"
+        "- *t\n"
+        "---\n"
+        "!!seq [4]\n"
+        "--- &x\n"
+        "- 5\n"
+        "--- !GPSTime {week_number: 1, time_of_week: 2.5}\n"
+    )
+    records = list(load_records(StringIO(text)))
+    assert records == [
+        {"a": 1}, 1, [2, 3], GPSTime(1, 2, 3), GPSTime(1, 2, 3), [4], [5], GPSTime(1, 2.5)
+    ]
+    # An alias in a later record constructs its own copy
+    assert records[3] is not records[4]
+
+    # Anchors do not carry over to the next document
+    with pytest.raises(ruamel.yaml.composer.ComposerError):
+        list(load_records(StringIO("- &t 1\n---\n- *t\n")))
+
+
+def test_records_file(tmp_path):
+    """Test writing and reading a file by path."""
+    path = tmp_path / "records.yaml"
+    assert dump_records(_records(10), path) == 10
+    assert list(load_records(path)) == list(_records(10))
+    assert list(load_records(str(path))) == list(_records(10))
+
+    # The default YAML instance can be replaced, e.g. by a safe loader
+    yaml = ruamel.yaml.YAML(typ="safe", pure=True)
+    yaml.register_class(GPSTime)
+    dump_records(_records(3), path, yaml=yaml)
+    assert list(load_records(path, yaml=yaml)) == list(_records(3))
+
+
+def test_dump_records_empty():
+    """Test that no records give an empty list."""
+    stream = StringIO()
+    assert dump_records([], stream) == 0
+    assert stream.getvalue() == "[]\n"
+    stream.seek(0)
+    assert list(load_records(stream)) == []
+    assert list(load_records(StringIO(""))) == []
+
+    with pytest.raises(ValueError):
+        dump_records([], stream, chunk_size=0)
+
+
+@pytest.mark.parametrize("typ,pure", [("rt", False), ("safe", True), ("safe", False)])
+def test_yaml_loader(typ, pure):
+    """Test that each loader and dumper round trips GPSTime exactly."""
+    yaml = yaml_loader(typ, pure)
+    times = [GPSTime(2290, 123456, 5), GPSTime(0, 604799, 999999999999999)]
+    stream = StringIO()
+    yaml.dump({"times": times}, stream)
+    assert "!GPSTime {" in stream.getvalue()
+    assert yaml.load(stream.getvalue()) == {"times": times}
+    assert yaml.load("!GPSTime {week_number: 1, time_of_week: 2.5}") == GPSTime(1, 2.5)
+
+
+def test_load_records_libyaml():
+    """Test that streaming requires the pure Python parser."""
+    yaml = yaml_loader("safe", pure=True)
+    assert list(load_records(StringIO("- 1\n- 2\n"), yaml)) == [1, 2]
+
+    # libyaml composes whole documents, so the records cannot be streamed
+    yaml.Parser = type("CParser", (), {})
+    with pytest.raises(ValueError, match="pure Python parser"):
+        list(load_records(StringIO("- 1\n"), yaml))
+
+
+@pytest.mark.parametrize("pure", [True, False])
+def test_records_safe(pure):
+    """Test that the safe dumper writes the chunks as one block sequence."""
+    yaml = yaml_loader("safe", pure=pure)
+    records = [1, 2, {"t": GPSTime(1, 2, 3)}, [4, 5], "6"]
+    stream = StringIO()
+    assert dump_records(records, stream, yaml, chunk_size=2) == 5
+    assert stream.getvalue().startswith("- 1\n- 2\n")
+    assert yaml.representer.default_flow_style is None
+    assert yaml.load(stream.getvalue()) == records
+
+    stream.seek(0)
+    assert list(load_records(stream, yaml_loader("safe", pure=True))) == records